@@ -0,0 +1,314 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+"""Times build_match and build_backfill_match over growing pools.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_match --output results.json
+    python -m benchmarks.bench_match --compare-ref HEAD~1
+    python -m benchmarks.bench_match --baseline benchmarks/baseline.json
+
+Results are reported per ticket, so a flat line across sizes is linear and a
+growing one points at superlinear behaviour. The run fails (exit code 1) when
+a case is slower than its baseline by more than --threshold, or when the per
+ticket time at the largest size grows past --max-growth times the smallest.
+
+--compare-ref checks out a git ref into a temporary worktree and benchmarks it
+first, in the same run and on the same machine, and uses that as the baseline;
+this is what `make bench` does. A ref that predates this script cannot be
+benchmarked, so benchmarks/baseline.json is used instead with a warning.
+benchmarks/baseline.json was captured on a
+single development machine, so comparing against it is only meaningful on
+that machine; refresh it with `make bench_baseline`.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from app.pool import TicketPool  # noqa: E402
+from app.rules import RulesPlan, compile_rules  # noqa: E402
+from app.services.matchFunction import AsyncMatchFunctionService  # noqa: E402
+
+from .tickets import TicketGenerator  # noqa: E402
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BASELINE: str = os.path.join(ROOT_DIR, "benchmarks", "baseline.json")
+DEFAULT_SIZES: Sequence[int] = (10, 100, 1000, 10000, 100000)
+DEFAULT_REPEAT: int = 3
+DEFAULT_THRESHOLD: float = 0.5
+DEFAULT_MAX_GROWTH: float = 4.0
+# Smaller pools are dominated by fixed costs and timer noise.
+DEFAULT_CHECK_MIN_SIZE: int = 1000
+BACKFILL_RATIO: int = 10
+
+RULES: Dict[str, str] = {
+    "default": "{}",
+    "alliance_2x4": json.dumps(
+        {
+            "alliance": {
+                "min_number": 2,
+                "max_number": 2,
+                "player_min_number": 1,
+                "player_max_number": 4,
+            }
+        }
+    ),
+    "skill_distance": json.dumps(
+        {
+            "alliance": {
+                "min_number": 1,
+                "max_number": 1,
+                "player_min_number": 2,
+                "player_max_number": 4,
+            },
+            "matching_rule": [{"attribute": "mmr", "criteria": "distance", "reference": 50}],
+        }
+    ),
+    "region_latency": json.dumps(
+        {
+            "alliance": {
+                "min_number": 1,
+                "max_number": 1,
+                "player_min_number": 2,
+                "player_max_number": 4,
+            },
+            "region_latency_max_ms": 150,
+        }
+    ),
+}
+
+
+def bench_build_match(
+    service: AsyncMatchFunctionService, rules: RulesPlan, tickets: List[Any]
+) -> float:
+    pool = service.create_pool(rules=rules)
+    build_match = service.build_match
+    start = time.perf_counter()
+    for ticket in tickets:
+        build_match(rules=rules, ticket=ticket, pool=pool)
+    return time.perf_counter() - start
+
+
+def bench_build_backfill_match(
+    service: AsyncMatchFunctionService,
+    rules: RulesPlan,
+    tickets: List[Any],
+    backfill_tickets: List[Any],
+) -> float:
+    # Same pools as AsyncMatchFunctionService.BackfillMatches.
+    pool: TicketPool[Any] = TicketPool()
+    backfill_pool: TicketPool[Any] = TicketPool()
+    build_backfill_match = service.build_backfill_match
+    backfill_iter = iter(backfill_tickets)
+    start = time.perf_counter()
+    for index, ticket in enumerate(tickets):
+        backfill_ticket = next(backfill_iter, None) if index % BACKFILL_RATIO == 0 else None
+        build_backfill_match(
+            rules=rules,
+            ticket=ticket,
+            pool=pool,
+            backfill_ticket=backfill_ticket,
+            backfill_pool=backfill_pool,
+        )
+    return time.perf_counter() - start
+
+
+def run(sizes: Sequence[int], rules_names: Sequence[str], repeat: int, seed: int) -> List[Dict[str, Any]]:
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.WARNING)
+    service = AsyncMatchFunctionService(logger=logger)
+    plans = {name: compile_rules(RULES[name]) for name in rules_names}
+
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        generator = TicketGenerator(seed=seed)
+        tickets = generator.tickets(size)
+        backfill_tickets = generator.backfill_tickets(max(1, size // BACKFILL_RATIO))
+        for name, rules in plans.items():
+            cases = {
+                "build_match": lambda: bench_build_match(service, rules, tickets),
+                "build_backfill_match": lambda: bench_build_backfill_match(
+                    service, rules, tickets, backfill_tickets
+                ),
+            }
+            for function, case in cases.items():
+                gc.collect()
+                seconds = min(case() for _ in range(repeat))
+                result = {
+                    "name": "{}/{}/{}".format(function, name, size),
+                    "function": function,
+                    "rules": name,
+                    "size": size,
+                    "seconds": seconds,
+                    "per_ticket_us": seconds / size * 1e6,
+                }
+                results.append(result)
+                print(
+                    "{:<48} {:>12.6f} s {:>10.2f} us/ticket".format(
+                        result["name"], seconds, result["per_ticket_us"]
+                    ),
+                    file=sys.stderr,
+                )
+    return results
+
+
+def run_ref(
+    ref: str, sizes: Sequence[int], rules_names: Sequence[str], repeat: int, seed: int
+) -> Optional[Dict[str, Any]]:
+    """Benchmarks the tree at git `ref` in a temporary worktree and returns its report.
+
+    Returns None when the ref has no benchmarks/bench_match.py to run.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="bench-")
+    worktree = os.path.join(tmp_dir, "tree")
+    output = os.path.join(tmp_dir, "baseline.json")
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", "--quiet", worktree, ref], cwd=ROOT_DIR, check=True
+    )
+    try:
+        if not os.path.exists(os.path.join(worktree, "benchmarks", "bench_match.py")):
+            print("{} has no benchmarks/bench_match.py".format(ref), file=sys.stderr)
+            return None
+        print("benchmarking {} as the baseline".format(ref), file=sys.stderr)
+        command = [
+            sys.executable, "-m", "benchmarks.bench_match",
+            "--output", output,
+            "--sizes", *map(str, sizes),
+            "--rules", *rules_names,
+            "--repeat", str(repeat),
+            "--seed", str(seed),
+            "--max-growth", "inf",
+        ]
+        subprocess.run(command, cwd=worktree, check=False)
+        if not os.path.exists(output):
+            raise RuntimeError("benchmark of {} produced no results".format(ref))
+        with open(output) as f:
+            return json.load(f)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=ROOT_DIR, check=False)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def check_baseline(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_size: int = DEFAULT_CHECK_MIN_SIZE,
+) -> List[str]:
+    expected = {r["name"]: r for r in baseline.get("results", [])}
+    failures: List[str] = []
+    for result in results:
+        base = expected.get(result["name"])
+        if base is None or result["size"] < min_size:
+            continue
+        ratio = result["per_ticket_us"] / max(base["per_ticket_us"], 1e-9)
+        if ratio > 1.0 + threshold:
+            failures.append(
+                "{}: {:.2f} us/ticket vs baseline {:.2f} ({:+.0%})".format(
+                    result["name"], result["per_ticket_us"], base["per_ticket_us"], ratio - 1.0
+                )
+            )
+    return failures
+
+
+def check_growth(
+    results: List[Dict[str, Any]], max_growth: float, min_size: int = DEFAULT_CHECK_MIN_SIZE
+) -> List[str]:
+    series: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        if result["size"] >= min_size:
+            series.setdefault("{}/{}".format(result["function"], result["rules"]), []).append(result)
+    failures: List[str] = []
+    for name, points in series.items():
+        if len(points) < 2:
+            continue
+        points.sort(key=lambda r: r["size"])
+        first, last = points[0], points[-1]
+        growth = last["per_ticket_us"] / max(first["per_ticket_us"], 1e-9)
+        if growth > max_growth:
+            failures.append(
+                "{}: per ticket time grows {:.1f}x from {} to {} tickets".format(
+                    name, growth, first["size"], last["size"]
+                )
+            )
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--rules", nargs="+", choices=list(RULES), default=list(RULES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--compare-ref", help="git ref to benchmark in this run and compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--max-growth", type=float, default=DEFAULT_MAX_GROWTH)
+    args = parser.parse_args(argv)
+
+    baselines: List[Dict[str, Any]] = []
+    if args.compare_ref:
+        ref_report = run_ref(
+            args.compare_ref, sizes=args.sizes, rules_names=args.rules, repeat=args.repeat, seed=args.seed
+        )
+        if ref_report is not None:
+            baselines.append(ref_report)
+        elif not args.baseline:
+            print(
+                "WARNING comparing against {} instead; it was captured on another machine".format(
+                    os.path.relpath(DEFAULT_BASELINE)
+                ),
+                file=sys.stderr,
+            )
+            args.baseline = DEFAULT_BASELINE
+    if args.baseline:
+        with open(args.baseline) as f:
+            baselines.append(json.load(f))
+
+    results = run(sizes=args.sizes, rules_names=args.rules, repeat=args.repeat, seed=args.seed)
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "compare_ref": args.compare_ref,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    failures = check_growth(results, max_growth=args.max_growth)
+    for baseline in baselines:
+        failures += check_baseline(results, baseline, threshold=args.threshold)
+    for failure in failures:
+        print("REGRESSION " + failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+"""Times RegionLatencySelector.select per group for growing batches.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_region
+    python -m benchmarks.bench_region --batches 1 16 256 --output region.json
+
+build_match selects regions for the groups drained by one ticket, which is
+usually a single group, so the small batch sizes are the realistic ones.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from app.region import RegionLatencySelector  # noqa: E402
+
+from .tickets import TicketGenerator  # noqa: E402
+
+DEFAULT_BATCHES: Sequence[int] = (1, 4, 16, 64, 256, 1024)
+DEFAULT_GROUP_SIZE: int = 4
+DEFAULT_MIN_SECONDS: float = 0.2
+
+
+def time_per_call(fn: Callable[[], Any], min_seconds: float) -> float:
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / calls
+
+
+def run(batches: Sequence[int], group_size: int, aggregate: str, min_seconds: float, seed: int) -> List[Dict[str, Any]]:
+    selector = RegionLatencySelector(max_latency_ms=150, aggregate=aggregate)
+    generator = TicketGenerator(seed=seed)
+    results: List[Dict[str, Any]] = []
+    for batch in batches:
+        groups = [generator.tickets(group_size) for _ in range(batch)]
+        seconds = time_per_call(lambda: selector.select(groups), min_seconds)
+        result = {
+            "batch": batch,
+            "us_per_group": seconds / batch * 1e6,
+        }
+        results.append(result)
+        print("batch {:>6}  {:>9.2f} us/group".format(batch, result["us_per_group"]), file=sys.stderr)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, nargs="+", default=list(DEFAULT_BATCHES))
+    parser.add_argument("--group-size", type=int, default=DEFAULT_GROUP_SIZE, help="tickets per group")
+    parser.add_argument("--aggregate", choices=("max", "mean"), default="max")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS, help="time per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(args.batches, args.group_size, args.aggregate, args.min_seconds, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
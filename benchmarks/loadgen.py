@@ -0,0 +1,412 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+"""In-process gRPC load generator for the MatchFunction service.
+
+Starts App with AsyncMatchFunctionService on a local port and drives all five
+RPCs at fixed (open-loop) rates, then reports throughput and p50/p99/p999
+latency per method. Streaming calls are timed from open to the last response.
+
+Usage (from the repository root):
+
+    python -m benchmarks.loadgen --interceptors otel auth metrics
+    python -m benchmarks.loadgen --matrix --duration 20 --output loadgen.json
+
+--matrix runs every interceptor configuration in its own subprocess (the
+interceptors register process-global Prometheus metrics) and prints the cost
+of each one relative to running with no interceptors. The load generator
+shares the event loop with the server, so absolute numbers include client
+overhead; compare configurations against each other.
+
+--loop selects the event loop (asyncio or uvloop) shared by server and client;
+--compare-loops runs the same configuration under each loop in a subprocess
+and reports the difference, e.g. for a streaming-only workload:
+
+    python -m benchmarks.loadgen --compare-loops --validate-rate 0 --enrich-rate 0 \
+        --make-matches-rate 20 --backfill-rate 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import grpc  # noqa: E402
+import jwt  # noqa: E402
+
+from accelbyte_grpc_plugin.app import App, AppOption, AppOptionGRPCInterceptor, AppOptionGRPCService  # noqa: E402
+from accelbyte_grpc_plugin.event_loop import EVENT_LOOPS, get_event_loop_name, set_event_loop  # noqa: E402
+from app.services.matchFunction import AsyncMatchFunctionService  # noqa: E402
+from matchFunction_pb2 import (  # noqa: E402
+    BackfillMakeMatchesRequest,
+    EnrichTicketRequest,
+    MakeMatchesRequest,
+    Rules,
+    ValidateTicketRequest,
+)
+from matchFunction_pb2_grpc import MatchFunctionStub, add_MatchFunctionServicer_to_server  # noqa: E402
+
+from .tickets import TicketGenerator  # noqa: E402
+
+INTERCEPTORS: Sequence[str] = ("otel", "auth", "logging", "metrics")
+MATRIX: Dict[str, Sequence[str]] = {
+    "none": (),
+    "otel": ("otel",),
+    "auth": ("auth",),
+    "logging": ("logging",),
+    "metrics": ("metrics",),
+    "all": INTERCEPTORS,
+}
+NAMESPACE: str = "loadgen"
+RULES_JSON: str = json.dumps(
+    {
+        "alliance": {
+            "min_number": 1,
+            "max_number": 1,
+            "player_min_number": 2,
+            "player_max_number": 4,
+        }
+    }
+)
+
+
+class FakeTokenValidator:
+    """TokenValidatorProtocol stand-in that accepts every token after a fixed delay."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: int = 0
+
+    def validate_token(self, token: str, resource=None, action=None, namespace=None, user_id=None, **kwargs):
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return None
+
+
+def create_tokens(count: int) -> List[str]:
+    exp = int(time.time()) + 3600
+    return [
+        jwt.encode({"sub": "loadgen-{}".format(i), "namespace": NAMESPACE, "exp": exp}, "loadgen-signing-key-not-verified-here")
+        for i in range(count)
+    ]
+
+
+def create_app(interceptors: Sequence[str], auth_latency: float) -> App:
+    logger = logging.getLogger("loadgen")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(open(os.devnull, "w")))
+
+    options: List[AppOption] = []
+    auth_interceptor = None
+    if "auth" in interceptors:
+        from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+
+        auth_interceptor = AuthorizationServerInterceptor(
+            token_validator=FakeTokenValidator(latency=auth_latency),  # type: ignore[arg-type]
+            namespace=NAMESPACE,
+        )
+        options.append(AppOptionGRPCInterceptor(interceptor=auth_interceptor))
+    if "logging" in interceptors:
+        from accelbyte_grpc_plugin.interceptors.logging import LoggingServerInterceptor
+
+        options.append(AppOptionGRPCInterceptor(interceptor=LoggingServerInterceptor(logger=logger)))
+    if "metrics" in interceptors:
+        from accelbyte_grpc_plugin.interceptors.metrics import MetricsServerInterceptor
+
+        options.append(AppOptionGRPCInterceptor(interceptor=MetricsServerInterceptor()))
+
+    service = AsyncMatchFunctionService(logger=logger, payload_log_max_size=4096)
+    options.append(
+        AppOptionGRPCService(
+            full_name=AsyncMatchFunctionService.full_name,
+            service=service,
+            add_service_fn=add_MatchFunctionServicer_to_server,
+        )
+    )
+
+    app = App(port=0, logger=logger, options=options)
+    if "otel" not in interceptors:
+        app.grpc_interceptors.clear()
+    app.initialize()
+
+    if auth_interceptor is not None:
+        # The MatchFunction proto carries no auth annotations; require a token on
+        # every method so the validation and token cache paths are exercised.
+        auth_interceptor.policies = MappingProxyType(
+            {method: policy._replace(require_token=True) for method, policy in auth_interceptor.policies.items()}
+        )
+    return app
+
+
+class LoadGenerator:
+    """Drives the stub with requests generated up front, so timings exclude ticket generation."""
+
+    VARIANTS: int = 16
+
+    def __init__(self, stub: MatchFunctionStub, tokens: List[str], tickets_per_stream: int, seed: int) -> None:
+        self.stub = stub
+        self.tokens = tokens
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+        self.count: int = 0
+
+        generator = TicketGenerator(seed=seed)
+        rules = Rules(json=RULES_JSON)
+        self.validate_requests = [
+            ValidateTicketRequest(ticket=ticket, rules=rules) for ticket in generator.tickets(self.VARIANTS)
+        ]
+        self.enrich_requests = [EnrichTicketRequest(ticket=ticket) for ticket in generator.tickets(self.VARIANTS)]
+        self.make_matches_requests: List[List[MakeMatchesRequest]] = []
+        self.backfill_requests: List[List[BackfillMakeMatchesRequest]] = []
+        for variant in range(self.VARIANTS):
+            requests = [
+                MakeMatchesRequest(
+                    parameters=MakeMatchesRequest.MakeMatchesParameters(rules=rules, tickId=variant)
+                )
+            ]
+            requests.extend(MakeMatchesRequest(ticket=t) for t in generator.tickets(tickets_per_stream))
+            self.make_matches_requests.append(requests)
+            backfill_requests = [
+                BackfillMakeMatchesRequest(
+                    parameters=BackfillMakeMatchesRequest.MakeMatchesParameters(rules=rules, tickId=variant)
+                )
+            ]
+            for index, ticket in enumerate(generator.tickets(tickets_per_stream)):
+                if index % 4 == 0:
+                    backfill_requests.append(
+                        BackfillMakeMatchesRequest(backfill_ticket=generator.backfill_ticket())
+                    )
+                backfill_requests.append(BackfillMakeMatchesRequest(ticket=ticket))
+            self.backfill_requests.append(backfill_requests)
+
+    def metadata(self):
+        self.count += 1
+        return (("authorization", "Bearer " + self.tokens[self.count % len(self.tokens)]),)
+
+    async def timed(self, method: str, call: Callable[[], Awaitable[Any]]) -> None:
+        start = time.perf_counter()
+        try:
+            await call()
+        except grpc.aio.AioRpcError as error:
+            errors = self.errors.setdefault(method, {})
+            errors[error.code().name] = errors.get(error.code().name, 0) + 1
+            return
+        self.latencies.setdefault(method, []).append(time.perf_counter() - start)
+
+    async def validate_ticket(self) -> None:
+        request = self.validate_requests[self.count % self.VARIANTS]
+        await self.stub.ValidateTicket(request, metadata=self.metadata())
+
+    async def enrich_ticket(self) -> None:
+        request = self.enrich_requests[self.count % self.VARIANTS]
+        await self.stub.EnrichTicket(request, metadata=self.metadata())
+
+    async def make_matches(self) -> None:
+        requests = self.make_matches_requests[self.count % self.VARIANTS]
+        async for _ in self.stub.MakeMatches(iter(requests), metadata=self.metadata()):
+            pass
+
+    async def backfill_matches(self) -> None:
+        requests = self.backfill_requests[self.count % self.VARIANTS]
+        async for _ in self.stub.BackfillMatches(iter(requests), metadata=self.metadata()):
+            pass
+
+    async def drive(self, method: str, call: Callable[[], Awaitable[Any]], rate: float, duration: float, max_in_flight: int) -> None:
+        """Starts calls on a fixed schedule regardless of how long earlier calls take."""
+        if rate <= 0:
+            return
+        tasks: "set[asyncio.Task]" = set()
+        interval = 1.0 / rate
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + duration
+        next_at = start
+        while next_at < deadline:
+            if len(tasks) < max_in_flight:
+                task = asyncio.ensure_future(self.timed(method, call))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            else:
+                errors = self.errors.setdefault(method, {})
+                errors["CLIENT_OVERLOADED"] = errors.get("CLIENT_OVERLOADED", 0) + 1
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, Dict[str, int]], duration: float) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {}
+    for method in sorted(set(latencies) | set(errors)):
+        values = sorted(latencies.get(method, []))
+        summary[method] = {
+            "calls": len(values),
+            "errors": errors.get(method, {}),
+            "throughput": len(values) / duration,
+            "p50_ms": percentile(values, 0.50) * 1e3,
+            "p99_ms": percentile(values, 0.99) * 1e3,
+            "p999_ms": percentile(values, 0.999) * 1e3,
+        }
+    return summary
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    app = create_app(interceptors=args.interceptors, auth_latency=args.auth_latency_ms / 1e3)
+    assert app.grpc_server is not None
+    port = app.grpc_server.add_insecure_port("127.0.0.1:0")
+    await app.grpc_server.start()
+    try:
+        async with grpc.aio.insecure_channel("127.0.0.1:{}".format(port)) as channel:
+            loadgen = LoadGenerator(
+                stub=MatchFunctionStub(channel),
+                tokens=create_tokens(args.tokens),
+                tickets_per_stream=args.tickets_per_stream,
+                seed=args.seed,
+            )
+            # Warm-up: connection, token cache and rules cache.
+            await loadgen.validate_ticket()
+            await loadgen.make_matches()
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            await asyncio.gather(
+                loadgen.drive("MakeMatches", loadgen.make_matches, args.make_matches_rate, args.duration, args.max_in_flight),
+                loadgen.drive("BackfillMatches", loadgen.backfill_matches, args.backfill_rate, args.duration, args.max_in_flight),
+                loadgen.drive("ValidateTicket", loadgen.validate_ticket, args.validate_rate, args.duration, args.max_in_flight),
+                loadgen.drive("EnrichTicket", loadgen.enrich_ticket, args.enrich_rate, args.duration, args.max_in_flight),
+            )
+            elapsed = time.perf_counter() - start
+            cpu_seconds = time.process_time() - cpu_start
+    finally:
+        await app.grpc_server.stop(grace=None)
+    return {
+        "interceptors": list(args.interceptors),
+        "loop": get_event_loop_name(),
+        "duration": elapsed,
+        "cpu_seconds": cpu_seconds,
+        "methods": summarize(loadgen.latencies, loadgen.errors, elapsed),
+    }
+
+
+def print_report(
+    name: str,
+    report: Dict[str, Any],
+    reference: Optional[Dict[str, Any]] = None,
+    reference_name: str = "none",
+) -> None:
+    print(
+        "[{}] interceptors: {}  loop: {}  cpu: {:.2f} s".format(
+            name, ", ".join(report["interceptors"]) or "none", report["loop"], report["cpu_seconds"]
+        ),
+        file=sys.stderr,
+    )
+    for method, stats in report["methods"].items():
+        line = "  {:<16} {:>8.1f}/s  p50 {:>8.3f} ms  p99 {:>8.3f} ms  p999 {:>8.3f} ms".format(
+            method, stats["throughput"], stats["p50_ms"], stats["p99_ms"], stats["p999_ms"]
+        )
+        base = (reference or {}).get("methods", {}).get(method)
+        if base and base["p50_ms"] > 0:
+            line += "  (p50 {:+.1%} vs {})".format(stats["p50_ms"] / base["p50_ms"] - 1.0, reference_name)
+        if stats["errors"]:
+            line += "  errors: {}".format(stats["errors"])
+        print(line, file=sys.stderr)
+
+
+def run_matrix(args: argparse.Namespace, argv: Sequence[str]) -> Dict[str, Any]:
+    passthrough = [a for a in argv if a not in ("--matrix",)]
+    passthrough = strip_option(strip_option(passthrough, "--output"), "--interceptors", nargs=True)
+    reports: Dict[str, Any] = {}
+    for name, interceptors in MATRIX.items():
+        command = [sys.executable, "-m", "benchmarks.loadgen", *passthrough, "--interceptors", *interceptors]
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+        reports[name] = json.loads(output)
+        print_report(name, reports[name], reports.get("none"))
+    return reports
+
+
+def run_loops(args: argparse.Namespace, argv: Sequence[str]) -> Dict[str, Any]:
+    passthrough = strip_option(strip_option([a for a in argv if a != "--compare-loops"], "--output"), "--loop")
+    reports: Dict[str, Any] = {}
+    for loop in EVENT_LOOPS:
+        command = [sys.executable, "-m", "benchmarks.loadgen", *passthrough, "--loop", loop]
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout
+        reports[loop] = json.loads(output)
+        print_report(loop, reports[loop], reports.get(EVENT_LOOPS[0]), reference_name=EVENT_LOOPS[0])
+    return reports
+
+
+def strip_option(argv: List[str], option: str, nargs: bool = False) -> List[str]:
+    result: List[str] = []
+    skipping = False
+    for index, arg in enumerate(argv):
+        if skipping:
+            if arg.startswith("--"):
+                skipping = False
+            elif nargs or argv[index - 1] == option:
+                continue
+        if arg == option:
+            skipping = True
+            continue
+        if arg.startswith(option + "="):
+            continue
+        result.append(arg)
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interceptors", nargs="*", choices=list(INTERCEPTORS), default=list(INTERCEPTORS))
+    parser.add_argument("--matrix", action="store_true", help="run every interceptor configuration")
+    parser.add_argument("--loop", choices=EVENT_LOOPS, default=EVENT_LOOPS[0], help="event loop to run on")
+    parser.add_argument("--compare-loops", action="store_true", help="run the configuration under every event loop")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per run")
+    parser.add_argument("--make-matches-rate", type=float, default=5.0, help="MakeMatches streams per second")
+    parser.add_argument("--backfill-rate", type=float, default=2.0, help="BackfillMatches streams per second")
+    parser.add_argument("--validate-rate", type=float, default=200.0, help="ValidateTicket calls per second")
+    parser.add_argument("--enrich-rate", type=float, default=200.0, help="EnrichTicket calls per second")
+    parser.add_argument("--tickets-per-stream", type=int, default=100)
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="per method; later calls are counted as CLIENT_OVERLOADED")
+    parser.add_argument("--tokens", type=int, default=1, help="number of distinct access tokens")
+    parser.add_argument("--auth-latency-ms", type=float, default=5.0, help="simulated token validation time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.compare_loops:
+        result: Dict[str, Any] = run_loops(args, argv)
+    elif args.matrix:
+        result = run_matrix(args, argv)
+    else:
+        set_event_loop(args.loop)
+        result = asyncio.run(run(args))
+        print_report("run", result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
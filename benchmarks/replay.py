@@ -0,0 +1,154 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+"""Replays captured MakeMatches/BackfillMatches streams through the servicer offline.
+
+Capture files are written by the servicer when CAPTURE_DIR is set, sampling
+every CAPTURE_EVERY_N-th stream up to CAPTURE_MAX_BYTES in total. Each file
+is fed to AsyncMatchFunctionService exactly as it was received, and the
+matching decisions (which tickets were grouped, backfill pairings, regions)
+are hashed so that a change in the algorithm shows up as a digest mismatch.
+
+Usage (from the repository root):
+
+    python -m benchmarks.replay captures/ --output replay.json
+    python -m benchmarks.replay captures/ --expect replay.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from grpc import StatusCode  # noqa: E402
+
+from app.capture import CAPTURE_SUFFIX, get_capture_rpc, read_capture  # noqa: E402
+from app.services.matchFunction import AsyncMatchFunctionService  # noqa: E402
+from app.utils import aiterize  # noqa: E402
+
+
+class ReplayAbort(Exception):
+    pass
+
+
+class ReplayContext:
+    """Minimal servicer context: no deadline, abort raises."""
+
+    async def abort(self, code: StatusCode, details: str = "") -> None:
+        raise ReplayAbort("{}: {}".format(code.name, details))
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+
+def find_captures(paths: Sequence[str]) -> List[str]:
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(CAPTURE_SUFFIX)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def digest_response(digest: Any, rpc: str, response: Any) -> None:
+    # Generated ids and timestamps differ between runs and are left out.
+    if rpc == "MakeMatches":
+        match = response.match
+        decision: Any = [
+            [ticket.ticket_id for ticket in match.tickets],
+            list(match.region_preferences),
+            match.backfill,
+        ]
+    else:
+        proposal = response.backfill_proposal
+        decision = [
+            proposal.backfill_ticket_id,
+            [ticket.ticket_id for ticket in proposal.added_tickets],
+        ]
+    digest.update(json.dumps(decision).encode("utf-8"))
+
+
+async def replay_file(service: AsyncMatchFunctionService, path: str) -> Dict[str, Any]:
+    rpc = get_capture_rpc(path)
+    requests = list(read_capture(path))
+    handler = getattr(service, rpc)
+    digest = hashlib.sha256()
+    results = 0
+    error = None
+    start = time.perf_counter()
+    try:
+        async for response in handler(aiterize(requests), ReplayContext()):
+            digest_response(digest, rpc, response)
+            results += 1
+    except ReplayAbort as abort:
+        error = str(abort)
+    seconds = time.perf_counter() - start
+    return {
+        "file": os.path.basename(path),
+        "rpc": rpc,
+        "messages": len(requests),
+        "results": results,
+        "seconds": seconds,
+        "digest": digest.hexdigest(),
+        "error": error,
+    }
+
+
+async def run(paths: Sequence[str]) -> List[Dict[str, Any]]:
+    logger = logging.getLogger("replay")
+    logger.setLevel(logging.WARNING)
+    service = AsyncMatchFunctionService(logger=logger)
+    reports = []
+    for path in find_captures(paths):
+        report = await replay_file(service, path)
+        reports.append(report)
+        print(
+            "{:<64} {:>6} msgs {:>6} results {:>10.6f} s {}".format(
+                report["file"], report["messages"], report["results"], report["seconds"],
+                report["error"] or report["digest"][:16],
+            ),
+            file=sys.stderr,
+        )
+    return reports
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="capture files or directories")
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--expect", help="previous results; fail when a digest differs")
+    args = parser.parse_args(argv)
+
+    reports = asyncio.run(run(args.paths))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(reports, f, indent=2)
+    else:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+
+    if not args.expect:
+        return 0
+    with open(args.expect) as f:
+        expected = {r["file"]: r["digest"] for r in json.load(f)}
+    mismatches = [r["file"] for r in reports if r["file"] in expected and expected[r["file"]] != r["digest"]]
+    for name in mismatches:
+        print("MISMATCH " + name, file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+
+from matchFunction_pb2 import BackfillTicket, Ticket
+
+DEFAULT_PARTY_SIZES: Dict[int, float] = {1: 0.6, 2: 0.25, 3: 0.1, 4: 0.05}
+DEFAULT_REGIONS: Sequence[str] = ("us-east-1", "us-west-2", "eu-central-1", "ap-northeast-1")
+
+
+class TicketGenerator:
+    """Reproducible synthetic tickets with parties, skill attributes and region latencies."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        match_pool: str = "benchmark",
+        party_sizes: Optional[Dict[int, float]] = None,
+        attributes: Optional[Dict[str, Sequence[float]]] = None,
+        regions: Sequence[str] = DEFAULT_REGIONS,
+        max_age: float = 60.0,
+    ) -> None:
+        self.random = random.Random(seed)
+        self.match_pool = match_pool
+        party_sizes = party_sizes if party_sizes else DEFAULT_PARTY_SIZES
+        self.party_sizes = list(party_sizes)
+        self.party_weights = list(party_sizes.values())
+        # attribute name -> (mean, standard deviation)
+        self.attributes = attributes if attributes is not None else {"mmr": (1500.0, 400.0)}
+        self.regions = list(regions)
+        self.max_age = max_age
+        self.count: int = 0
+
+    def ticket(self) -> Ticket:
+        rnd = self.random
+        self.count += 1
+        ticket = Ticket(
+            ticket_id="ticket-{}".format(self.count),
+            match_pool=self.match_pool,
+            namespace="benchmark",
+        )
+        ticket.CreatedAt.FromNanoseconds(int((time.time() - rnd.uniform(0.0, self.max_age)) * 1e9))
+        party_size = rnd.choices(self.party_sizes, weights=self.party_weights)[0]
+        if party_size > 1:
+            ticket.party_session_id = "party-{}".format(self.count)
+        for index in range(party_size):
+            player = ticket.players.add(player_id="player-{}-{}".format(self.count, index))
+            for name, (mean, stddev) in self.attributes.items():
+                player.attributes.fields[name].number_value = max(0.0, rnd.gauss(mean, stddev))
+        # One nearby region and progressively farther ones.
+        base = rnd.uniform(10.0, 80.0)
+        for region in rnd.sample(self.regions, len(self.regions)):
+            ticket.latencies[region] = int(base)
+            base += rnd.uniform(20.0, 120.0)
+        return ticket
+
+    def tickets(self, count: int) -> List[Ticket]:
+        return [self.ticket() for _ in range(count)]
+
+    def backfill_ticket(self, players: int = 4) -> BackfillTicket:
+        self.count += 1
+        backfill_ticket = BackfillTicket(
+            ticket_id="backfill-{}".format(self.count),
+            match_pool=self.match_pool,
+            match_session_id="session-{}".format(self.count),
+        )
+        backfill_ticket.CreatedAt.FromNanoseconds(int(time.time() * 1e9))
+        partial_match = backfill_ticket.partial_match
+        partial_match.tickets.extend(self.ticket() for _ in range(players))
+        team = partial_match.teams.add(team_id="team-{}".format(self.count))
+        for ticket in partial_match.tickets:
+            team.user_ids.extend(player.player_id for player in ticket.players)
+        partial_match.backfill = True
+        return backfill_ticket
+
+    def backfill_tickets(self, count: int) -> List[BackfillTicket]:
+        return [self.backfill_ticket() for _ in range(count)]
+
+
+__all__ = [
+    "TicketGenerator",
+]
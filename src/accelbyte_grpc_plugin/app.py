@@ -15,7 +15,7 @@ import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum
 from logging import Logger
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from typing import Protocol, runtime_checkable
 
 # environs
@@ -35,6 +35,10 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import MetricReader
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME as RESOURCE_SERVICE_NAME
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import Sampler
+
+from .event_loop import get_event_loop_name
+from .workers import get_worker_id
 
 
 class App:
@@ -81,11 +85,19 @@ class App:
             sorted(options, key=lambda o: o.get_order())
         )
 
+        self.worker_id: Optional[int] = get_worker_id()
+
         self.grpc_interceptors: List[ServerInterceptor] = [aio_server_interceptor()]
         self.grpc_server: Optional[Server] = None
+        self.grpc_server_options: List[Tuple[str, Any]] = []
+        self.grpc_server_kwargs: Dict[str, Any] = {}
+        self.grpc_health_servicer: Optional[Any] = None
+        if self.worker_id is not None:
+            self.grpc_server_options.append(("grpc.so_reuseport", 1))
         self.grpc_service_names: List[str] = []
         self.otel_metric_readers: List[MetricReader] = []
         self.otel_resource: Resource = Resource({RESOURCE_SERVICE_NAME: self.name})
+        self.otel_sampler: Optional[Sampler] = None
 
         self.is_initialized: bool = False
 
@@ -102,9 +114,15 @@ class App:
             **kwargs,
         )
 
-        tracer_provider = TracerProvider(resource=self.otel_resource)
+        # Without a preset sampler, the SDK reads OTEL_TRACES_SAMPLER and OTEL_TRACES_SAMPLER_ARG.
+        tracer_provider = TracerProvider(
+            sampler=self.otel_sampler, resource=self.otel_resource
+        )
         opentelemetry.trace.set_tracer_provider(tracer_provider=tracer_provider)
-        self.logger.info("opentelemetry tracer provider set")
+        self.logger.info(
+            "opentelemetry tracer provider set (sampler: %s)",
+            tracer_provider.sampler.get_description(),
+        )
 
         self.apply_option_range(
             (
@@ -130,7 +148,11 @@ class App:
             **kwargs,
         )
 
-        self.grpc_server = grpc.aio.server(interceptors=self.grpc_interceptors)
+        self.grpc_server = grpc.aio.server(
+            interceptors=self.grpc_interceptors,
+            options=self.grpc_server_options,
+            **self.grpc_server_kwargs,
+        )
         self.logger.info("gRPC server created")
 
         self.apply_option_range(
@@ -156,18 +178,54 @@ class App:
         self.logger.info("initialization finished")
 
     async def run(self, termination_timeout: Optional[float] = None) -> None:
+        await self.start()
+        await self.wait_for_termination(timeout=termination_timeout)
+
+    async def start(self) -> None:
         if not self.is_initialized:
             self.initialize()
 
         assert self.grpc_server is not None
 
         self.grpc_server.add_insecure_port("[::]:{}".format(self.port))
-        self.logger.info("gRPC server is starting")
+        self.logger.info("event loop: %s", get_event_loop_name())
+        if self.worker_id is None:
+            self.logger.info("gRPC server is starting")
+        else:
+            self.logger.info("gRPC server is starting (worker %d)", self.worker_id)
         await self.grpc_server.start()
 
-        await self.grpc_server.wait_for_termination(timeout=termination_timeout)
+    async def wait_for_termination(self, timeout: Optional[float] = None) -> None:
+        assert self.grpc_server is not None
+
+        await self.grpc_server.wait_for_termination(timeout=timeout)
         self.logger.info("gRPC server has terminated")
 
+    async def set_serving(self, serving: bool) -> None:
+        """Sets the overall health status and notifies interceptors listening for it.
+
+        Updating the health status is a no-op when health checking is disabled.
+        """
+        for interceptor in self.grpc_interceptors:
+            if isinstance(interceptor, AppServingListener):
+                interceptor.on_serving_changed(self, serving)
+
+        if self.grpc_health_servicer is None:
+            return
+
+        from grpc_health.v1 import health_pb2
+
+        status = (
+            health_pb2.HealthCheckResponse.SERVING
+            if serving
+            else health_pb2.HealthCheckResponse.NOT_SERVING
+        )
+        await self.grpc_health_servicer.set("", status)
+        self.logger.info(
+            "health status set to %s",
+            health_pb2.HealthCheckResponse.ServingStatus.Name(status),
+        )
+
     # noinspection PyShadowingBuiltins
     def apply_option_range(
         self, range: Union[int, Tuple[int, int]], /, *args, **kwargs
@@ -208,6 +266,16 @@ class AppOptionApplyFunc(Protocol):
     def __call__(self, app: App, /, *args, **kwargs) -> None: ...
 
 
+@runtime_checkable
+class AppGRPCServiceListener(Protocol):
+    def on_grpc_service_added(self, app: App, full_name: str, /) -> None: ...
+
+
+@runtime_checkable
+class AppServingListener(Protocol):
+    def on_serving_changed(self, app: App, serving: bool, /) -> None: ...
+
+
 @runtime_checkable
 class AppOption(Protocol):
     def apply(self, app: App, /, *args, **kwargs) -> None: ...
@@ -289,6 +357,9 @@ class AppOptionGRPCService(AppOptionBase):
     def apply(self, app: App, /, *args, **kwargs) -> None:
         self.add_service_fn(self.service, app.grpc_server)
         app.grpc_service_names.append(self.full_name)
+        for interceptor in app.grpc_interceptors:
+            if isinstance(interceptor, AppGRPCServiceListener):
+                interceptor.on_grpc_service_added(app, self.full_name)
 
     def get_name(self) -> str:
         return self.__name__
@@ -299,6 +370,7 @@ class AppOptionGRPCService(AppOptionBase):
 
 __all__ = [
     "App",
+    "AppGRPCServiceListener",
     "AppOption",
     "AppOptionApplyFunc",
     "AppOptionApplyOrderEnum",
@@ -306,4 +378,5 @@ __all__ = [
     "AppOptionFunc",
     "AppOptionGRPCInterceptor",
     "AppOptionGRPCService",
+    "AppServingListener",
 ]
@@ -0,0 +1,61 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - uvloop (optional)
+
+import asyncio
+import logging
+from logging import Logger
+from typing import Optional
+
+EVENT_LOOP_ENV: str = "SERVICE_EVENT_LOOP"
+EVENT_LOOP_ASYNCIO: str = "asyncio"
+EVENT_LOOP_UVLOOP: str = "uvloop"
+EVENT_LOOPS = (EVENT_LOOP_ASYNCIO, EVENT_LOOP_UVLOOP)
+
+
+def set_event_loop(name: str, logger: Optional[Logger] = None) -> str:
+    """Installs the event loop policy for `name` and returns the loop actually selected.
+
+    Falls back to the default asyncio loop when uvloop is requested but not installed.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    name = name.strip().lower()
+    if name not in EVENT_LOOPS:
+        raise ValueError(
+            "unknown {}: {} (expected one of {})".format(EVENT_LOOP_ENV, name, ", ".join(EVENT_LOOPS))
+        )
+
+    if name == EVENT_LOOP_UVLOOP:
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("uvloop is not installed, falling back to the asyncio event loop")
+            name = EVENT_LOOP_ASYNCIO
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            return name
+
+    asyncio.set_event_loop_policy(None)
+    return name
+
+
+def get_event_loop_name(loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    loop_type = type(loop)
+    return "{}.{}".format(loop_type.__module__, loop_type.__qualname__)
+
+
+__all__ = [
+    "EVENT_LOOP_ASYNCIO",
+    "EVENT_LOOP_ENV",
+    "EVENT_LOOP_UVLOOP",
+    "EVENT_LOOPS",
+    "get_event_loop_name",
+    "set_event_loop",
+]
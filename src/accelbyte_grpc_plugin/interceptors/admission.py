@@ -0,0 +1,178 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - prometheus-client
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
+from grpc.aio import ServerInterceptor
+from prometheus_client import Counter, Gauge
+
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+
+class _MethodAdmission:
+    """In-flight limit for one method with a bounded number of waiting calls."""
+
+    __slots__ = ("max_in_flight", "max_queue", "queue_timeout", "waiting", "_semaphore",
+                 "in_flight_gauge", "queue_depth_gauge", "shed_queue_full", "shed_queue_timeout")
+
+    def __init__(
+        self,
+        interceptor: "AdmissionServerInterceptor",
+        method: str,
+        max_in_flight: int,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = interceptor.max_queue
+        self.queue_timeout = interceptor.queue_timeout
+        self.waiting: int = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight_gauge = interceptor.in_flight_gauge.labels(grpc_method=method)
+        self.queue_depth_gauge = interceptor.queue_depth_gauge.labels(grpc_method=method)
+        self.shed_queue_full = interceptor.shed_counter.labels(grpc_method=method, reason="queue_full")
+        self.shed_queue_timeout = interceptor.shed_counter.labels(grpc_method=method, reason="queue_timeout")
+
+    async def acquire(self) -> Optional[str]:
+        """Takes a slot, returning the reason when the call should be shed instead."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        semaphore = self._semaphore
+        if not semaphore.locked():
+            await semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self.shed_queue_full.inc()
+                return "too many calls in flight and queued"
+            self.waiting += 1
+            self.queue_depth_gauge.inc()
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.shed_queue_timeout.inc()
+                return "timed out waiting for a free slot"
+            finally:
+                self.waiting -= 1
+                self.queue_depth_gauge.dec()
+        self.in_flight_gauge.inc()
+        return None
+
+    def release(self) -> None:
+        assert self._semaphore is not None
+        self.in_flight_gauge.dec()
+        self._semaphore.release()
+
+
+class AdmissionServerInterceptor(ServerInterceptor):
+    """Limits in-flight calls per method and sheds overflow with RESOURCE_EXHAUSTED.
+
+    Calls over the limit wait up to `queue_timeout` seconds in a queue of at
+    most `max_queue` calls; streaming calls hold their slot until they end.
+    A limit of 0 or less disables admission control for that method.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT: int = 64
+    DEFAULT_MAX_QUEUE: int = 16
+    DEFAULT_QUEUE_TIMEOUT: float = 0.5
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        method_max_in_flight: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight if max_in_flight is not None else self.DEFAULT_MAX_IN_FLIGHT
+        self.max_queue = max_queue if max_queue is not None else self.DEFAULT_MAX_QUEUE
+        self.queue_timeout = queue_timeout if queue_timeout is not None else self.DEFAULT_QUEUE_TIMEOUT
+        self.method_max_in_flight = dict(method_max_in_flight) if method_max_in_flight else {}
+        self.in_flight_gauge = Gauge(
+            name="grpc_server_admission_in_flight",
+            documentation="number of admitted gRPC calls in flight",
+            labelnames=["grpc_method"],
+            multiprocess_mode="livesum",
+        )
+        self.queue_depth_gauge = Gauge(
+            name="grpc_server_admission_queue_depth",
+            documentation="number of gRPC calls waiting for admission",
+            labelnames=["grpc_method"],
+            multiprocess_mode="livesum",
+        )
+        self.shed_counter = Counter(
+            name="grpc_server_admission_shed",
+            documentation="number of gRPC calls rejected with RESOURCE_EXHAUSTED",
+            labelnames=["grpc_method", "reason"],
+        )
+        self.method_admissions: Dict[str, Optional[_MethodAdmission]] = {}
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+        method = getattr(handler_call_details, "method", "")
+        if method in self.method_admissions:
+            admission = self.method_admissions[method]
+        else:
+            admission = self.method_admissions[method] = self.create_method_admission(method)
+        if admission is None:
+            return handler
+        return wrap_rpc_method_handler(
+            handler,
+            lambda behavior, request_streaming, response_streaming: self.wrap_behavior(
+                behavior, admission, response_streaming
+            ),
+        )
+
+    def create_method_admission(self, method: str) -> Optional[_MethodAdmission]:
+        max_in_flight = self.method_max_in_flight.get(method, self.max_in_flight)
+        if max_in_flight <= 0:
+            return None
+        return _MethodAdmission(interceptor=self, method=method, max_in_flight=max_in_flight)
+
+    @staticmethod
+    def wrap_behavior(
+        behavior: Callable, admission: _MethodAdmission, response_streaming: bool
+    ) -> Callable:
+        if response_streaming:
+
+            async def stream_behavior(request_or_iterator, context):
+                reason = await admission.acquire()
+                if reason is not None:
+                    await context.abort(StatusCode.RESOURCE_EXHAUSTED, reason)
+                try:
+                    result = behavior(request_or_iterator, context)
+                    if inspect.isasyncgen(result):
+                        async for response in result:
+                            yield response
+                    elif inspect.isawaitable(result):
+                        await result
+                finally:
+                    admission.release()
+
+            return stream_behavior
+
+        async def unary_behavior(request_or_iterator, context):
+            reason = await admission.acquire()
+            if reason is not None:
+                await context.abort(StatusCode.RESOURCE_EXHAUSTED, reason)
+            try:
+                result: Any = behavior(request_or_iterator, context)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            finally:
+                admission.release()
+
+        return unary_behavior
+
+
+__all__ = ["AdmissionServerInterceptor"]
@@ -2,7 +2,21 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
-from typing import Awaitable, Callable, Optional, Tuple
+# requires:
+# - accelbyte-py-sdk
+# - grpcio
+# - prometheus-client
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
 
 import grpc
 from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
@@ -10,7 +24,9 @@ from grpc.aio import ServerInterceptor
 
 from google.protobuf.descriptor import MethodDescriptor
 from google.protobuf.descriptor_pool import Default as DescriptorPool
+from prometheus_client import Counter
 
+from accelbyte_grpc_plugin.app import App
 from accelbyte_grpc_plugin.utils import (
     get_headers_from_metadata,
     get_propagator_header_keys,
@@ -24,15 +40,215 @@ from accelbyte_py_sdk.token_validation._ctypes import (
     UserRevokedError,
 )
 
+TOKEN_CACHE_COUNTER = Counter(
+    name="grpc_server_auth_token_cache",
+    documentation="number of verified-token cache lookups",
+    labelnames=["result"],
+    unit="count",
+)
+
+
+class MethodPolicy(NamedTuple):
+    require_token: bool
+    resource: Optional[str]
+    action: Optional[int]
+
+
+class VerifiedTokenCache:
+    """Size-bounded LRU of per-token values, e.g. validation results or decoded claims.
+
+    Entries expire at the token's `exp`, capped at `max_ttl` seconds so that
+    revocations are still picked up within a bounded time.
+    """
+
+    DEFAULT_MAX_SIZE: int = 10000
+    DEFAULT_MAX_TTL: float = 300.0
+
+    def __init__(self, max_size: Optional[int] = None, max_ttl: Optional[float] = None) -> None:
+        self.max_size = max_size if max_size is not None else self.DEFAULT_MAX_SIZE
+        self.max_ttl = max_ttl if max_ttl is not None else self.DEFAULT_MAX_TTL
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    @staticmethod
+    def create_key(
+        token: str, resource: Optional[str] = None, action: Optional[int] = None
+    ) -> str:
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return f"{digest}:{resource}:{action}"
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, exp: Optional[float]) -> None:
+        if self.max_size <= 0 or not exp:
+            return
+        expires_at = min(float(exp), time.time() + self.max_ttl)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _SerializedRefreshLookup:
+    """Cache lookup that answers hits without locking and lets one miss at a time fetch."""
+
+    def __init__(
+        self, cache: Any, lookup: Callable[..., Any], peek: Callable[[Any, Any], Any], key_name: str
+    ) -> None:
+        self.cache = cache
+        self.lookup = lookup
+        self.peek = peek
+        self.key_name = key_name
+        self.lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        value = self.peek(self.cache, args[0] if args else kwargs[self.key_name])
+        if value is not None:
+            return value
+        with self.lock:
+            # The wrapped lookup checks the cache again, so waiters reuse the fetch in progress.
+            return self.lookup(*args, **kwargs)
+
+
+def serialize_cache_refreshes(token_validator: Any) -> None:
+    """Lets only one thread at a time fetch into each of the validator's caches.
+
+    The SDK's CachingTokenValidator caches guard their dicts with a lock but
+    fetch outside it on a miss, so concurrent misses on a cold cache each
+    issue the same JWKS, role or namespace request. Cache hits, and therefore
+    validate_token itself, still run in parallel.
+    """
+    lookups = (
+        ("jwks_cache", "get_key", "key_id", lambda cache, key: cache.get_key_from_cache(key)),
+        ("roles_cache", "get_role", "role_id", lambda cache, key: cache._roles.get(key)),
+        (
+            "namespace_context_cache",
+            "get_namespace_context",
+            "namespace",
+            lambda cache, key: cache._namespace_contexts.get(key),
+        ),
+    )
+    for cache_name, lookup_name, key_name, peek in lookups:
+        cache = getattr(token_validator, cache_name, None)
+        lookup = getattr(cache, lookup_name, None)
+        if lookup is None or isinstance(lookup, _SerializedRefreshLookup):
+            continue
+        setattr(
+            cache,
+            lookup_name,
+            _SerializedRefreshLookup(cache=cache, lookup=lookup, peek=peek, key_name=key_name),
+        )
+
 
 class AuthorizationServerInterceptor(ServerInterceptor):
+    """Validates bearer tokens and permissions from the methods' proto annotations.
+
+    Synchronous validators run in `executor`, so the event loop is never
+    blocked. Validations run in parallel; for the SDK's CachingTokenValidator
+    only the refetches on a cache miss are serialized (serialize_cache_refreshes).
+    """
+
+    DEFAULT_MAX_WORKERS: int = 4
+
     def __init__(
         self,
         token_validator: TokenValidatorProtocol,
         namespace: Optional[str] = None,
+        token_cache: Optional[VerifiedTokenCache] = None,
+        claims_cache: Optional[VerifiedTokenCache] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         self.token_validator = token_validator
         self.namespace = namespace
+        self.token_cache = token_cache if token_cache is not None else VerifiedTokenCache()
+        self.claims_cache = (
+            claims_cache
+            if claims_cache is not None
+            else VerifiedTokenCache(max_size=self.token_cache.max_size, max_ttl=float("inf"))
+        )
+        self._in_flight: Dict[str, "asyncio.Future[Optional[Tuple[str, StatusCode]]]"] = {}
+        self.executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(
+                max_workers=self.DEFAULT_MAX_WORKERS,
+                thread_name_prefix="token-validation",
+            )
+        )
+        serialize_cache_refreshes(self.token_validator)
+        self.token_cache_hits = TOKEN_CACHE_COUNTER.labels(result="hit")
+        self.token_cache_misses = TOKEN_CACHE_COUNTER.labels(result="miss")
+        self.policies: Mapping[str, MethodPolicy] = MappingProxyType({})
+        self.policy_service_names: Tuple[str, ...] = ()
+        self._resolved_policies: Dict[str, MethodPolicy] = {}
+
+    def on_grpc_service_added(self, app: App, full_name: str, /) -> None:
+        start = time.perf_counter()
+        service_names = [n for n in app.grpc_service_names if n not in self.policy_service_names]
+        self.register_services(service_names=service_names)
+        app.logger.info(
+            "authorization policy table: %d method(s) from %s built in %.3f ms",
+            len(self.policies),
+            ", ".join(service_names),
+            (time.perf_counter() - start) * 1000.0,
+        )
+
+    def register_services(self, service_names: Iterable[str]) -> None:
+        policies = dict(self.policies)
+        registered = list(self.policy_service_names)
+        for service_name in service_names:
+            policies.update(self.build_policies(service_name=service_name))
+            registered.append(service_name)
+        self.policies = MappingProxyType(policies)
+        self.policy_service_names = tuple(registered)
+
+    @classmethod
+    def build_policies(cls, service_name: str) -> Dict[str, MethodPolicy]:
+        try:
+            service_descriptor = DescriptorPool().FindServiceByName(service_name)
+        except KeyError:
+            return {}
+        return {
+            f"/{service_name}/{method_descriptor.name}": cls.create_method_policy(
+                method_descriptor=method_descriptor
+            )
+            for method_descriptor in service_descriptor.methods
+        }
+
+    @classmethod
+    def create_method_policy(cls, method_descriptor: MethodDescriptor) -> MethodPolicy:
+        # Check if method requires Bearer authentication from OpenAPI annotations
+        require_token = cls.has_bearer_security(method_descriptor)
+
+        # Extract permission extensions
+        resource, action = cls.extract_permissions(method_descriptor)
+
+        return MethodPolicy(require_token=require_token, resource=resource, action=action)
+
+    def get_method_policy(self, method: str) -> Optional[MethodPolicy]:
+        policy = self.policies.get(method)
+        if policy is not None:
+            return policy
+        # Methods of services not registered through AppOptionGRPCService
+        # (e.g. reflection) are resolved once and remembered.
+        policy = self._resolved_policies.get(method)
+        if policy is None:
+            method_descriptor = self.get_method_descriptor(method=method)
+            if method_descriptor:
+                policy = self.create_method_policy(method_descriptor=method_descriptor)
+                self._resolved_policies[method] = policy
+        return policy
 
     async def intercept_service(
         self,
@@ -40,18 +256,14 @@ class AuthorizationServerInterceptor(ServerInterceptor):
         handler_call_details: HandlerCallDetails,
     ) -> RpcMethodHandler:
         method = getattr(handler_call_details, "method", "")
-        method_descriptor = self.get_method_descriptor(method=method)
+        policy = self.get_method_policy(method=method)
 
-        if not method_descriptor:
+        if policy is None:
             return self.create_aio_rpc_error(
                 error="method not found", code=StatusCode.INTERNAL
             )
 
-        # Check if method requires Bearer authentication from OpenAPI annotations
-        require_token = self.has_bearer_security(method_descriptor)
-
-        # Extract permission extensions
-        resource, action = self.extract_permissions(method_descriptor)
+        require_token, resource, action = policy
 
         # Skip auth if no security requirements
         if not require_token and resource is None and action is None:
@@ -68,63 +280,144 @@ class AuthorizationServerInterceptor(ServerInterceptor):
         if not authorization.startswith("Bearer "):
             return self.create_aio_rpc_error(error="invalid authorization token format")
 
-        try:
+        token = authorization.removeprefix("Bearer ")
+        cache_key = self.token_cache.create_key(token=token, resource=resource, action=action)
+        if self.token_cache.get(cache_key):
+            self.token_cache_hits.inc()
+            return await continuation(handler_call_details)
+        self.token_cache_misses.inc()
+
+        # Concurrent calls with the same (token, resource, action) share one validation.
+        future = self._in_flight.get(cache_key)
+        if future is None:
             # by default, any HTTP calls inside an interceptor does not propagate headers
             propagator_header_keys = get_propagator_header_keys()
             propagator_headers = {
                 k: v for k, v in headers.items() if k in propagator_header_keys
             }
 
-            token = authorization.removeprefix("Bearer ")
-            error = self.token_validator.validate_token(
+            future = asyncio.ensure_future(
+                self.authorize(
+                    token=token,
+                    resource=resource,
+                    action=action,
+                    cache_key=cache_key,
+                    x_additional_headers=propagator_headers,
+                )
+            )
+            self._in_flight[cache_key] = future
+            future.add_done_callback(functools.partial(self._remove_in_flight, cache_key))
+
+        error = await asyncio.shield(future)
+        if error is not None:
+            error_message, code = error
+            return self.create_aio_rpc_error(error=error_message, code=code)
+
+        return await continuation(handler_call_details)
+
+    async def authorize(
+        self,
+        token: str,
+        resource: Optional[str],
+        action: Optional[int],
+        cache_key: str,
+        **kwargs,
+    ) -> Optional[Tuple[str, StatusCode]]:
+        try:
+            error = await self.validate_token(
                 token=token,
                 resource=resource,
                 action=action,
-                namespace=self.namespace,
-                x_additional_headers=propagator_headers,
+                **kwargs,
             )
             if error is not None:
                 if isinstance(error, InsufficientPermissionsError):
-                    return self.create_aio_rpc_error(
-                        error=f"insufficient permissions: resource: {resource}, action: {action}",
-                        code=StatusCode.PERMISSION_DENIED,
+                    return (
+                        f"insufficient permissions: resource: {resource}, action: {action}",
+                        StatusCode.PERMISSION_DENIED,
                     )
                 elif isinstance(error, (TokenRevokedError, UserRevokedError)):
-                    return self.create_aio_rpc_error(
-                        error=f"authorization token was already revoked",
-                        code=StatusCode.PERMISSION_DENIED,
+                    return (
+                        f"authorization token was already revoked",
+                        StatusCode.PERMISSION_DENIED,
                     )
                 else:
-                    return self.create_aio_rpc_error(
-                        error=f"ValidateToken.{type(error).__name__}: {error}",
-                        code=StatusCode.UNAUTHENTICATED,
+                    return (
+                        f"ValidateToken.{type(error).__name__}: {error}",
+                        StatusCode.UNAUTHENTICATED,
                     )
         except Exception as error:
-            return self.create_aio_rpc_error(
-                error=f"ValidateToken.{type(error).__name__}: {error}",
-                code=StatusCode.INTERNAL,
+            return (
+                f"ValidateToken.{type(error).__name__}: {error}",
+                StatusCode.INTERNAL,
             )
 
         try:
-            claims, error = parse_access_token(token)
+            claims, error = self.get_token_claims(token)
             if error is not None:
-                return self.create_aio_rpc_error(
-                    error=f"ParceAccessToken.{type(error).__name__}: {error}",
-                    code=StatusCode.UNAUTHENTICATED,
+                return (
+                    f"ParceAccessToken.{type(error).__name__}: {error}",
+                    StatusCode.UNAUTHENTICATED,
                 )
             if extend_namespace := claims.get("extend_namespace", None):
                 if extend_namespace != self.namespace:
-                    return self.create_aio_rpc_error(
-                        error=f"'{extend_namespace}' does not match '{self.namespace}'",
-                        code=StatusCode.PERMISSION_DENIED,
+                    return (
+                        f"'{extend_namespace}' does not match '{self.namespace}'",
+                        StatusCode.PERMISSION_DENIED,
                     )
         except Exception as error:
-            return self.create_aio_rpc_error(
-                error=f"ParceAccessToken.{type(error).__name__}: {error}",
-                code=StatusCode.INTERNAL,
+            return (
+                f"ParceAccessToken.{type(error).__name__}: {error}",
+                StatusCode.INTERNAL,
             )
 
-        return await continuation(handler_call_details)
+        self.token_cache.put(cache_key, True, exp=claims.get("exp"))
+
+        return None
+
+    def get_token_claims(self, token: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """Decode the token's claims, memoized until the token expires."""
+        key = self.claims_cache.create_key(token=token)
+        claims = self.claims_cache.get(key)
+        if claims is not None:
+            return claims, None
+        claims, error = parse_access_token(token)
+        if error is None and claims:
+            self.claims_cache.put(key, claims, exp=claims.get("exp"))
+        return claims, error
+
+    def _remove_in_flight(self, cache_key: str, future: "asyncio.Future") -> None:
+        if self._in_flight.get(cache_key) is future:
+            del self._in_flight[cache_key]
+
+    async def validate_token(
+        self,
+        token: str,
+        resource: Optional[str],
+        action: Optional[int],
+        **kwargs,
+    ) -> Optional[Exception]:
+        """Validate without blocking the event loop: natively if the validator is async, else in the executor."""
+        validate_token_async = getattr(self.token_validator, "validate_token_async", None)
+        if validate_token_async is not None and inspect.iscoroutinefunction(validate_token_async):
+            return await validate_token_async(
+                token=token,
+                resource=resource,
+                action=action,
+                namespace=self.namespace,
+                **kwargs,
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(
+                self.token_validator.validate_token,
+                token=token,
+                resource=resource,
+                action=action,
+                namespace=self.namespace,
+                **kwargs,
+            ),
+        )
 
     @staticmethod
     def create_aio_rpc_error(error: str, code: StatusCode = StatusCode.UNAUTHENTICATED):
@@ -216,4 +509,7 @@ class AuthorizationServerInterceptor(ServerInterceptor):
 
 __all__ = [
     "AuthorizationServerInterceptor",
+    "MethodPolicy",
+    "VerifiedTokenCache",
+    "serialize_cache_refreshes",
 ]
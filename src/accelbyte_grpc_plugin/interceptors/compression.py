@@ -0,0 +1,70 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - grpcio
+
+import inspect
+from typing import Awaitable, Callable, Dict
+
+from grpc import Compression, HandlerCallDetails, RpcMethodHandler
+from grpc.aio import ServerInterceptor
+
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+
+class CompressionServerInterceptor(ServerInterceptor):
+    """Sets the response compression of selected methods, keyed by full method name.
+
+    Keys include the proto package, e.g.
+    "/accelbyte.matchmaking.matchfunction.MatchFunction/MakeMatches".
+    """
+
+    def __init__(self, method_compression: Dict[str, Compression]) -> None:
+        self.method_compression = dict(method_compression)
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        compression = self.method_compression.get(getattr(handler_call_details, "method", ""))
+        if compression is None:
+            return handler
+        return wrap_rpc_method_handler(
+            handler,
+            lambda behavior, request_streaming, response_streaming: self.wrap_behavior(
+                behavior, compression, response_streaming
+            ),
+        )
+
+    @staticmethod
+    def wrap_behavior(
+        behavior: Callable, compression: Compression, response_streaming: bool
+    ) -> Callable:
+        if response_streaming:
+
+            async def stream_behavior(request_or_iterator, context):
+                context.set_compression(compression)
+                result = behavior(request_or_iterator, context)
+                if inspect.isasyncgen(result):
+                    async for response in result:
+                        yield response
+                elif inspect.isawaitable(result):
+                    await result
+
+            return stream_behavior
+
+        async def unary_behavior(request_or_iterator, context):
+            context.set_compression(compression)
+            result = behavior(request_or_iterator, context)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return unary_behavior
+
+
+__all__ = ["CompressionServerInterceptor"]
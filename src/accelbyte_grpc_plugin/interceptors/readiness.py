@@ -0,0 +1,80 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - grpcio
+
+from typing import Awaitable, Callable, Optional, Tuple
+
+from grpc import HandlerCallDetails, RpcMethodHandler, StatusCode
+from grpc.aio import ServerInterceptor
+
+from accelbyte_grpc_plugin.app import App
+from accelbyte_grpc_plugin.utils import wrap_rpc_method_handler
+
+
+class ReadinessServerInterceptor(ServerInterceptor):
+    """Rejects calls with UNAVAILABLE until the app reports that it is serving.
+
+    Health checking and reflection stay reachable so callers can poll readiness.
+    `App.set_serving()` updates the interceptor through `on_serving_changed`.
+    """
+
+    DEFAULT_DETAILS: str = "service is not ready"
+    DEFAULT_EXEMPT_PREFIXES: Tuple[str, ...] = (
+        "/grpc.health.v1.",
+        "/grpc.reflection.",
+    )
+
+    def __init__(
+        self,
+        serving: bool = False,
+        details: Optional[str] = None,
+        exempt_prefixes: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        self.serving = serving
+        self.details = details if details is not None else self.DEFAULT_DETAILS
+        self.exempt_prefixes = (
+            tuple(exempt_prefixes) if exempt_prefixes is not None else self.DEFAULT_EXEMPT_PREFIXES
+        )
+
+    def on_serving_changed(self, app: App, serving: bool, /) -> None:
+        self.serving = serving
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if self.serving or handler is None:
+            return handler
+        method = getattr(handler_call_details, "method", "")
+        if method.startswith(self.exempt_prefixes):
+            return handler
+        return wrap_rpc_method_handler(
+            handler,
+            lambda behavior, request_streaming, response_streaming: self.reject_behavior(
+                response_streaming
+            ),
+        )
+
+    def reject_behavior(self, response_streaming: bool) -> Callable:
+        details = self.details
+
+        if response_streaming:
+
+            async def stream_behavior(request_or_iterator, context):
+                await context.abort(StatusCode.UNAVAILABLE, details)
+                yield  # unreachable; makes this an async generator
+
+            return stream_behavior
+
+        async def unary_behavior(request_or_iterator, context):
+            await context.abort(StatusCode.UNAVAILABLE, details)
+
+        return unary_behavior
+
+
+__all__ = ["ReadinessServerInterceptor"]
@@ -15,8 +15,9 @@ from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
 class AppOptionGRPCHealthCheck(AppOptionBase):
     def apply(self, app: App, /, *args, **kwargs) -> None:
         full_name = health_pb2.DESCRIPTOR.services_by_name["Health"].full_name
+        app.grpc_health_servicer = health.aio.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(
-            health.aio.HealthServicer(), app.grpc_server
+            app.grpc_health_servicer, app.grpc_server
         )
         app.grpc_service_names.append(full_name)
 
@@ -0,0 +1,136 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - grpcio
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from grpc import Compression
+
+from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+from ..interceptors.compression import CompressionServerInterceptor
+
+COMPRESSIONS: Dict[str, Compression] = {
+    "none": Compression.NoCompression,
+    "deflate": Compression.Deflate,
+    "gzip": Compression.Gzip,
+}
+
+
+def parse_compression(name: str) -> Compression:
+    try:
+        return COMPRESSIONS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            "unknown compression '{}', expected one of: {}".format(name, ", ".join(COMPRESSIONS))
+        ) from None
+
+
+class AppOptionGRPCServerOptions(AppOptionBase):
+    """Tunes the gRPC server: stream limits, message sizes, keepalive and compression.
+
+    Unset values keep the gRPC defaults. `method_compression` maps full method
+    names, including the proto package (e.g.
+    "/accelbyte.matchmaking.matchfunction.MatchFunction/MakeMatches"), to a
+    compression for their responses.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_streams: Optional[int] = None,
+        max_receive_message_length: Optional[int] = None,
+        max_send_message_length: Optional[int] = None,
+        keepalive_time_ms: Optional[int] = None,
+        keepalive_timeout_ms: Optional[int] = None,
+        keepalive_permit_without_calls: Optional[bool] = None,
+        maximum_concurrent_rpcs: Optional[int] = None,
+        compression: Optional[str] = None,
+        method_compression: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_receive_message_length = max_receive_message_length
+        self.max_send_message_length = max_send_message_length
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.keepalive_permit_without_calls = keepalive_permit_without_calls
+        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        self.compression = compression
+        self.method_compression = method_compression
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("GRPC_SERVER_"):
+            if self.max_concurrent_streams is None:
+                self.max_concurrent_streams = app.env.int("MAX_CONCURRENT_STREAMS", None)
+            if self.max_receive_message_length is None:
+                self.max_receive_message_length = app.env.int("MAX_RECEIVE_MESSAGE_LENGTH", None)
+            if self.max_send_message_length is None:
+                self.max_send_message_length = app.env.int("MAX_SEND_MESSAGE_LENGTH", None)
+            if self.keepalive_time_ms is None:
+                self.keepalive_time_ms = app.env.int("KEEPALIVE_TIME_MS", None)
+            if self.keepalive_timeout_ms is None:
+                self.keepalive_timeout_ms = app.env.int("KEEPALIVE_TIMEOUT_MS", None)
+            if self.keepalive_permit_without_calls is None:
+                self.keepalive_permit_without_calls = app.env.bool(
+                    "KEEPALIVE_PERMIT_WITHOUT_CALLS", None
+                )
+            if self.maximum_concurrent_rpcs is None:
+                self.maximum_concurrent_rpcs = app.env.int("MAXIMUM_CONCURRENT_RPCS", None)
+            if not self.compression:
+                self.compression = app.env.str("COMPRESSION", None)
+            if self.method_compression is None:
+                self.method_compression = app.env.dict("METHOD_COMPRESSION", {})
+
+        options = self.create_server_options()
+        app.grpc_server_options.extend(options)
+
+        if self.maximum_concurrent_rpcs is not None:
+            app.grpc_server_kwargs["maximum_concurrent_rpcs"] = self.maximum_concurrent_rpcs
+        if self.compression:
+            app.grpc_server_kwargs["compression"] = parse_compression(self.compression)
+
+        if self.method_compression:
+            app.grpc_interceptors.append(
+                CompressionServerInterceptor(
+                    method_compression={
+                        method: parse_compression(name)
+                        for method, name in self.method_compression.items()
+                    }
+                )
+            )
+
+        app.logger.info(
+            "gRPC server options: %s, maximum_concurrent_rpcs=%s, compression=%s, method_compression=%s",
+            dict(app.grpc_server_options) or "defaults",
+            self.maximum_concurrent_rpcs,
+            self.compression or "none",
+            self.method_compression or "none",
+        )
+
+    def create_server_options(self) -> List[Tuple[str, Any]]:
+        options: List[Tuple[str, Any]] = []
+        if self.max_concurrent_streams is not None:
+            options.append(("grpc.max_concurrent_streams", self.max_concurrent_streams))
+        if self.max_receive_message_length is not None:
+            options.append(("grpc.max_receive_message_length", self.max_receive_message_length))
+        if self.max_send_message_length is not None:
+            options.append(("grpc.max_send_message_length", self.max_send_message_length))
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        if self.keepalive_permit_without_calls is not None:
+            options.append(
+                ("grpc.keepalive_permit_without_calls", int(self.keepalive_permit_without_calls))
+            )
+        return options
+
+    def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
+        return AppOptionApplyOrderEnum.CREATE_GRPC_SERVER - 1
+
+
+__all__ = [
+    "AppOptionGRPCServerOptions",
+    "parse_compression",
+]
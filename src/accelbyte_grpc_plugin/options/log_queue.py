@@ -0,0 +1,101 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - opentelemetry-api
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional, Union
+
+import opentelemetry.metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+
+
+class DropOldestQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: when the queue is full the oldest record is dropped."""
+
+    def __init__(self, queue_: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(queue_)
+        self.dropped_records: int = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped_records += 1
+                except queue.Empty:
+                    pass
+
+
+class AppOptionLogQueue(AppOptionBase):
+    DEFAULT_MAX_SIZE: int = 10000
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self.max_size = max_size
+        self.handler: Optional[DropOldestQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("LOG_QUEUE_"):
+            if self.max_size is None:
+                self.max_size = app.env.int("MAX_SIZE", self.DEFAULT_MAX_SIZE)
+
+        handlers = list(app.logger.handlers)
+        if not handlers:
+            return
+
+        queue_: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=self.max_size)
+        self.handler = DropOldestQueueHandler(queue_)
+        self.listener = QueueListener(queue_, *handlers, respect_handler_level=True)
+
+        for hdlr in handlers:
+            app.logger.removeHandler(hdlr)
+        app.logger.addHandler(self.handler)
+
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+        meter = opentelemetry.metrics.get_meter(__name__)
+        meter.create_observable_counter(
+            name="log_queue_dropped_records",
+            callbacks=[self.observe_dropped_records],
+            unit="1",
+            description="number of log records dropped because the log queue was full",
+        )
+        meter.create_observable_gauge(
+            name="log_queue_size",
+            callbacks=[self.observe_queue_size],
+            unit="1",
+            description="number of log records waiting in the log queue",
+        )
+
+        app.logger.info(
+            "log queue enabled: %d handler(s), max size %d", len(handlers), self.max_size
+        )
+
+    def observe_dropped_records(self, options: CallbackOptions) -> Iterable[Observation]:
+        if self.handler is not None:
+            yield Observation(self.handler.dropped_records)
+
+    def observe_queue_size(self, options: CallbackOptions) -> Iterable[Observation]:
+        if self.handler is not None:
+            yield Observation(self.handler.queue.qsize())
+
+    def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
+        return AppOptionApplyOrderEnum.MAX - 1
+
+
+__all__ = [
+    "AppOptionLogQueue",
+    "DropOldestQueueHandler",
+]
@@ -0,0 +1,246 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - opentelemetry-api
+# - requests
+
+import atexit
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import opentelemetry.metrics
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..app import App, AppOptionBase
+
+
+class BatchingLokiHandler(logging.Handler):
+    """Buffers records in memory and pushes them to Loki in gzip-compressed batches.
+
+    A background thread flushes when `batch_size` records are buffered or
+    `flush_interval` seconds have passed, over a single keep-alive connection.
+    When the buffer is full the oldest records are dropped. On close the
+    thread pushes what is left in the buffer and exits.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]] = None,
+        labels: Optional[Dict[str, str]] = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        timeout: float = 5.0,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        super().__init__()
+        self.url = url
+        self.labels = labels if labels else {}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.dropped_records: int = 0
+        self.failed_batches: int = 0
+
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.auth = auth
+        session.headers.update(
+            {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        self.session = session
+
+        self._buffer: Deque[Tuple[str, str, str, str]] = deque(maxlen=max_buffer)
+        self._condition = threading.Condition()
+        self._push_lock = threading.Lock()
+        self._closed = False
+
+        meter = opentelemetry.metrics.get_meter(__name__)
+        self._batch_size_histogram = meter.create_histogram(
+            name="loki_batch_size",
+            unit="1",
+            description="number of log records per Loki push",
+        )
+        self._flush_latency_histogram = meter.create_histogram(
+            name="loki_flush_latency",
+            unit="s",
+            description="time spent pushing one batch to Loki, including retries",
+        )
+
+        self._thread = threading.Thread(
+            target=self._run, name="loki-batch-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = (
+                str(int(record.created * 1e9)),
+                self.format(record),
+                record.name,
+                record.levelname.lower(),
+            )
+        except Exception:  # noqa
+            self.handleError(record)
+            return
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped_records += 1
+            self._buffer.append(entry)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        with self._condition:
+            entries = list(self._buffer)
+            self._buffer.clear()
+        if entries:
+            self.push(entries)
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        # The flusher drains the buffer before it exits; while it is still
+        # pushing (e.g. retrying), the session stays open for it.
+        self._thread.join(timeout=self.timeout)
+        if not self._thread.is_alive():
+            self.session.close()
+        super().close()
+
+    def push(self, entries: List[Tuple[str, str, str, str]]) -> bool:
+        with self._push_lock:
+            return self._push(entries)
+
+    def _push(self, entries: List[Tuple[str, str, str, str]]) -> bool:
+        start = time.perf_counter()
+        body = gzip.compress(json.dumps(self.create_payload(entries)).encode("utf-8"))
+        delivered = False
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(self.url, data=body, timeout=self.timeout)
+                if response.ok:
+                    delivered = True
+                    break
+                if response.status_code < 500 and response.status_code != 429:
+                    break
+            except requests.RequestException:
+                pass
+            if attempt < self.max_retries:
+                time.sleep(self.retry_backoff * (2 ** attempt))
+        if not delivered:
+            self.failed_batches += 1
+        self._batch_size_histogram.record(len(entries))
+        self._flush_latency_histogram.record(time.perf_counter() - start)
+        return delivered
+
+    def create_payload(self, entries: List[Tuple[str, str, str, str]]) -> dict:
+        streams: Dict[Tuple[str, str], List[List[str]]] = {}
+        for timestamp, line, logger_name, severity in entries:
+            streams.setdefault((logger_name, severity), []).append([timestamp, line])
+        return {
+            "streams": [
+                {
+                    "stream": {**self.labels, "logger": logger_name, "severity": severity},
+                    "values": values,
+                }
+                for (logger_name, severity), values in streams.items()
+            ]
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.batch_size:
+                    self._condition.wait(timeout=self.flush_interval)
+                if self._closed and not self._buffer:
+                    return
+                entries = [
+                    self._buffer.popleft()
+                    for _ in range(min(len(self._buffer), self.batch_size))
+                ]
+            if entries:
+                self.push(entries)
+
+
+class AppOptionLokiBatch(AppOptionBase):
+    DEFAULT_URL: str = "http://localhost:3100/loki/api/v1/push"
+    DEFAULT_USERNAME: str = ""
+    DEFAULT_PASSWORD: str = ""
+    DEFAULT_BATCH_SIZE: int = 500
+    DEFAULT_FLUSH_INTERVAL: float = 1.0
+    DEFAULT_MAX_BUFFER: int = 10000
+    DEFAULT_MAX_RETRIES: int = 3
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_buffer: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ) -> None:
+        self.url = url
+        self.username = username
+        self.password = password
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_retries = max_retries
+        self.handler: Optional[BatchingLokiHandler] = None
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("LOKI_"):
+            if not self.url:
+                self.url = app.env.str("URL", self.DEFAULT_URL)
+            if not self.username:
+                self.username = app.env.str("USERNAME", self.DEFAULT_USERNAME)
+            if not self.password:
+                self.password = app.env.str("PASSWORD", self.DEFAULT_PASSWORD)
+            if self.batch_size is None:
+                self.batch_size = app.env.int("BATCH_SIZE", self.DEFAULT_BATCH_SIZE)
+            if self.flush_interval is None:
+                self.flush_interval = app.env.float(
+                    "FLUSH_INTERVAL", self.DEFAULT_FLUSH_INTERVAL
+                )
+            if self.max_buffer is None:
+                self.max_buffer = app.env.int("MAX_BUFFER", self.DEFAULT_MAX_BUFFER)
+            if self.max_retries is None:
+                self.max_retries = app.env.int("MAX_RETRIES", self.DEFAULT_MAX_RETRIES)
+        auth = (self.username, self.password) if self.username else None
+        self.handler = BatchingLokiHandler(
+            url=self.url,
+            auth=auth,
+            labels={"application": app.name},
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            max_buffer=self.max_buffer,
+            max_retries=self.max_retries,
+        )
+        atexit.register(self.handler.close)
+        app.logger.addHandler(hdlr=self.handler)
+
+
+__all__ = [
+    "AppOptionLokiBatch",
+    "BatchingLokiHandler",
+]
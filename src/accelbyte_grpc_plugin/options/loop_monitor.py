@@ -0,0 +1,193 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - opentelemetry-api
+
+import asyncio
+import atexit
+import sys
+import threading
+import time
+import traceback
+from logging import Logger
+from typing import Iterable, Optional, Union
+
+import opentelemetry.metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+
+
+class LoopMonitor:
+    """Measures event loop scheduling lag and counts live tasks.
+
+    A timer callback is scheduled every `interval` seconds on the loop; how late
+    it runs is the lag. A watchdog thread checks that the timer keeps firing and,
+    when the loop has been stuck for longer than `threshold`, logs the stack of
+    the loop thread, i.e. of the callback that is blocking it.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        logger: Logger,
+        interval: float,
+        threshold: float,
+    ) -> None:
+        self.loop = loop
+        self.logger = logger
+        self.interval = interval
+        self.threshold = threshold
+        self.tasks: int = 0
+        self.stalls: int = 0
+
+        meter = opentelemetry.metrics.get_meter(__name__)
+        self._lag_histogram = meter.create_histogram(
+            name="event_loop_lag",
+            unit="s",
+            description="delay between when a loop timer was due and when it ran",
+        )
+
+        self._thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._due: float = 0.0
+        self._beat: int = 0
+        self._beat_at: float = 0.0
+        self._stopped = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._beat_at = time.monotonic()
+        self._schedule()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self) -> None:
+        self._due = self.loop.time() + self.interval
+        self._handle = self.loop.call_at(self._due, self._tick)
+
+    def _tick(self) -> None:
+        lag = max(0.0, self.loop.time() - self._due)
+        self._beat += 1
+        self._beat_at = time.monotonic()
+        self.tasks = len(asyncio.all_tasks(self.loop))
+        self._lag_histogram.record(lag)
+        if lag > self.threshold:
+            self.logger.warning(
+                "event loop lag %.3f s exceeded %.3f s (%d task(s))",
+                lag,
+                self.threshold,
+                self.tasks,
+            )
+        if not self._stopped.is_set():
+            self._schedule()
+
+    def _watch(self) -> None:
+        reported = -1
+        while not self._stopped.wait(self.interval):
+            if self.loop.is_closed() or not self.loop.is_running():
+                return
+            beat = self._beat
+            stalled = time.monotonic() - self._beat_at
+            if stalled <= self.interval + self.threshold or beat == reported:
+                continue
+            frame = sys._current_frames().get(self._thread_id)  # type: ignore[arg-type]
+            if frame is None:
+                continue
+            reported = beat
+            self.stalls += 1
+            self.logger.warning(
+                "event loop blocked for %.3f s, current stack:\n%s",
+                stalled,
+                "".join(traceback.format_stack(frame)).rstrip(),
+            )
+
+
+class AppOptionLoopMonitor(AppOptionBase):
+    """Starts a LoopMonitor on the running loop and exports its metrics.
+
+    Opt-in (ENABLE_LOOP_MONITOR): the timer wakes the loop and the watchdog
+    thread every LOOP_MONITOR_INTERVAL seconds even when the service is idle.
+    """
+
+    DEFAULT_INTERVAL: float = 0.1
+    DEFAULT_THRESHOLD: float = 0.25
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        threshold: Optional[float] = None,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.monitor: Optional[LoopMonitor] = None
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("LOOP_MONITOR_"):
+            if self.interval is None:
+                self.interval = app.env.float("INTERVAL", self.DEFAULT_INTERVAL)
+            if self.threshold is None:
+                self.threshold = app.env.float("THRESHOLD", self.DEFAULT_THRESHOLD)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            app.logger.warning("loop monitor not started: no running event loop")
+            return
+
+        self.monitor = LoopMonitor(
+            loop=loop,
+            logger=app.logger,
+            interval=self.interval,
+            threshold=self.threshold,
+        )
+        self.monitor.start()
+        atexit.register(self.monitor.stop)
+
+        meter = opentelemetry.metrics.get_meter(__name__)
+        meter.create_observable_gauge(
+            name="event_loop_tasks",
+            callbacks=[self.observe_tasks],
+            unit="1",
+            description="number of asyncio tasks alive on the event loop",
+        )
+        meter.create_observable_counter(
+            name="event_loop_stalls",
+            callbacks=[self.observe_stalls],
+            unit="1",
+            description="number of times the event loop was blocked past the threshold",
+        )
+
+        app.logger.info(
+            "loop monitor enabled: interval %.3f s, threshold %.3f s",
+            self.interval,
+            self.threshold,
+        )
+
+    def observe_tasks(self, options: CallbackOptions) -> Iterable[Observation]:
+        if self.monitor is not None:
+            yield Observation(self.monitor.tasks)
+
+    def observe_stalls(self, options: CallbackOptions) -> Iterable[Observation]:
+        if self.monitor is not None:
+            yield Observation(self.monitor.stalls)
+
+    def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
+        return AppOptionApplyOrderEnum.MAX - 1
+
+
+__all__ = [
+    "AppOptionLoopMonitor",
+    "LoopMonitor",
+]
@@ -0,0 +1,223 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - grpcio
+
+import asyncio
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Optional
+
+from grpc import ServicerContext, StatusCode
+
+from profiling_pb2 import (
+    DESCRIPTOR,
+    MemorySnapshotRequest,
+    MemorySnapshotResponse,
+    MemoryStat,
+    ProfileRequest,
+    ProfileResponse,
+)
+from profiling_pb2_grpc import ProfilingServicer, add_ProfilingServicer_to_server
+
+from ..app import App, AppOptionGRPCService
+
+
+class StackSampler:
+    """Collects collapsed stacks of every other thread at a fixed interval."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: int = 0
+        self.stacks: Dict[str, int] = Counter()
+
+    def run(self, duration: float) -> None:
+        own_id = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append("{} ({}:{})".format(code.co_name, code.co_filename, frame.f_lineno))
+                    frame = frame.f_back
+                frames.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(frames))] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def format_collapsed(self) -> str:
+        return "".join("{} {}\n".format(stack, count) for stack, count in self.stacks.items())
+
+    def format_text(self, limit: int) -> str:
+        lines = ["{} samples".format(self.samples)]
+        for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])[:limit]:
+            lines.append("{:>6} {}".format(count, stack.rsplit(";", 1)[-1]))
+        return "\n".join(lines) + "\n"
+
+
+class AsyncProfilingService(ProfilingServicer):
+    """Profiles the running process on request; one profile or snapshot at a time."""
+
+    full_name: str = DESCRIPTOR.services_by_name["Profiling"].full_name
+
+    DEFAULT_MAX_DURATION: float = 60.0
+    DEFAULT_SAMPLING_INTERVAL_MS: float = 10.0
+    DEFAULT_LIMIT: int = 50
+    DEFAULT_SORT: str = "cumulative"
+    SORT_KEYS = frozenset(pstats.Stats.sort_arg_dict_default)
+    DEFAULT_MEMORY_LIMIT: int = 25
+    DEFAULT_KEY_TYPE: str = "lineno"
+
+    def __init__(self, max_duration: Optional[float] = None) -> None:
+        self.max_duration = max_duration if max_duration is not None else self.DEFAULT_MAX_DURATION
+        self._lock = asyncio.Lock()
+
+    async def check_request(self, duration: float, context: ServicerContext) -> None:
+        if not 0 < duration <= self.max_duration:
+            await context.abort(
+                StatusCode.INVALID_ARGUMENT,
+                "duration_seconds must be in (0, {}]".format(self.max_duration),
+            )
+        if self._lock.locked():
+            await context.abort(StatusCode.FAILED_PRECONDITION, "a profile is already running")
+
+    async def Profile(self, request: ProfileRequest, context: ServicerContext) -> ProfileResponse:
+        await self.check_request(request.duration_seconds, context)
+        limit = request.limit or self.DEFAULT_LIMIT
+        sort = request.sort or self.DEFAULT_SORT
+        if sort not in self.SORT_KEYS:
+            await context.abort(
+                StatusCode.INVALID_ARGUMENT,
+                "unknown sort: {} (expected one of {})".format(sort, ", ".join(sorted(self.SORT_KEYS))),
+            )
+        async with self._lock:
+            start = time.perf_counter()
+            if request.profiler == ProfileRequest.CPROFILE:
+                if request.format == ProfileRequest.COLLAPSED:
+                    await context.abort(StatusCode.INVALID_ARGUMENT, "COLLAPSED requires SAMPLING")
+                # cProfile hooks the calling thread only, i.e. the event loop.
+                profile = cProfile.Profile()
+                profile.enable()
+                try:
+                    await asyncio.sleep(request.duration_seconds)
+                finally:
+                    profile.disable()
+                profile.create_stats()
+                if request.format == ProfileRequest.PSTATS:
+                    data = marshal.dumps(profile.stats)  # type: ignore[attr-defined]
+                else:
+                    stream = io.StringIO()
+                    stats = pstats.Stats(profile, stream=stream)
+                    stats.sort_stats(sort).print_stats(limit)
+                    data = stream.getvalue().encode("utf-8")
+                return ProfileResponse(
+                    format=request.format,
+                    data=data,
+                    duration_seconds=time.perf_counter() - start,
+                )
+
+            if request.format == ProfileRequest.PSTATS:
+                await context.abort(StatusCode.INVALID_ARGUMENT, "PSTATS requires CPROFILE")
+            interval_ms = request.sampling_interval_ms or self.DEFAULT_SAMPLING_INTERVAL_MS
+            sampler = StackSampler(interval=interval_ms / 1000.0)
+            await asyncio.to_thread(sampler.run, request.duration_seconds)
+            if request.format == ProfileRequest.COLLAPSED:
+                text = sampler.format_collapsed()
+            else:
+                text = sampler.format_text(limit=limit)
+            return ProfileResponse(
+                format=request.format,
+                data=text.encode("utf-8"),
+                duration_seconds=time.perf_counter() - start,
+                samples=sampler.samples,
+            )
+
+    async def MemorySnapshot(
+        self, request: MemorySnapshotRequest, context: ServicerContext
+    ) -> MemorySnapshotResponse:
+        await self.check_request(request.duration_seconds, context)
+        key_type = request.key_type or self.DEFAULT_KEY_TYPE
+        if key_type not in ("lineno", "filename", "traceback"):
+            await context.abort(StatusCode.INVALID_ARGUMENT, "unknown key_type: {}".format(key_type))
+        async with self._lock:
+            start = time.perf_counter()
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start(request.frames or 1)
+            try:
+                before = tracemalloc.take_snapshot()
+                await asyncio.sleep(request.duration_seconds)
+                after = tracemalloc.take_snapshot()
+            finally:
+                if started:
+                    tracemalloc.stop()
+            differences = after.compare_to(before, key_type)
+            return MemorySnapshotResponse(
+                stats=[
+                    MemoryStat(
+                        location=str(difference.traceback),
+                        size=difference.size,
+                        size_diff=difference.size_diff,
+                        count=difference.count,
+                        count_diff=difference.count_diff,
+                    )
+                    for difference in differences[: request.limit or self.DEFAULT_MEMORY_LIMIT]
+                ],
+                total_size=sum(d.size for d in differences),
+                total_size_diff=sum(d.size_diff for d in differences),
+                duration_seconds=time.perf_counter() - start,
+            )
+
+
+class AppOptionProfiling(AppOptionGRPCService):
+    """Registers the Profiling admin service.
+
+    Its methods carry permission annotations, so AuthorizationServerInterceptor
+    requires a token with the profiling permission. Without that interceptor
+    the service would be open to anyone, so applying this option fails.
+    """
+
+    def __init__(self, max_duration: Optional[float] = None) -> None:
+        super().__init__(
+            full_name=AsyncProfilingService.full_name,
+            service=AsyncProfilingService(max_duration=max_duration),
+            add_service_fn=add_ProfilingServicer_to_server,
+        )
+        self.max_duration = max_duration
+
+    def apply(self, app: App, /, *args, **kwargs) -> None:
+        with app.env.prefixed("PROFILING_"):
+            if self.max_duration is None:
+                self.max_duration = app.env.float(
+                    "MAX_DURATION", AsyncProfilingService.DEFAULT_MAX_DURATION
+                )
+        self.service.max_duration = self.max_duration
+
+        from ..interceptors.authorization import AuthorizationServerInterceptor
+
+        if not any(isinstance(i, AuthorizationServerInterceptor) for i in app.grpc_interceptors):
+            raise RuntimeError(
+                "the profiling service requires authorization: "
+                "enable PLUGIN_GRPC_SERVER_AUTH_ENABLED or disable ENABLE_PROFILING"
+            )
+        super().apply(app, *args, **kwargs)
+
+
+__all__ = [
+    "AppOptionProfiling",
+    "AsyncProfilingService",
+    "StackSampler",
+]
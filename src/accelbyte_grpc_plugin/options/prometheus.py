@@ -3,22 +3,68 @@
 # and restrictions contact your company contract manager.
 
 # requires:
-# - Flask
 # - opentelemetry-exporter-prometheus
-# - Werkzeug
+# - prometheus-client
 
 import threading
-from typing import Optional, Union
+import time
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Iterable, Optional, Union
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
 
-from flask import Flask
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
-from prometheus_client import make_wsgi_app
-from werkzeug.middleware.dispatcher import DispatcherMiddleware
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram, make_wsgi_app
 
 from ..app import App, AppOptionApplyOrderEnum, AppOptionBase
+from ..workers import register_worker_metrics_port
+
+SCRAPE_DURATION_HISTOGRAM = Histogram(
+    name="metrics_scrape_duration_seconds",
+    documentation="time spent rendering the metrics exposition",
+)
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _SilentWSGIRequestHandler(WSGIRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:  # noqa
+        pass
+
+
+class MetricsWSGIApp:
+    """Serves the Prometheus exposition on a single path and times each scrape."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        registry: CollectorRegistry = REGISTRY,
+        histogram: Optional[Histogram] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.exposition_app = make_wsgi_app(registry=registry)
+        self.histogram = histogram if histogram is not None else SCRAPE_DURATION_HISTOGRAM
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        if environ.get("PATH_INFO", "") != self.endpoint:
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not Found"]
+        start = time.perf_counter()
+        try:
+            return self.exposition_app(environ, start_response)
+        finally:
+            self.histogram.observe(time.perf_counter() - start)
 
 
 class AppOptionPrometheus(AppOptionBase):
+    """Exports metrics for Prometheus to scrape.
+
+    In multi-worker mode the exposition server runs in the parent process; each
+    worker serves its OpenTelemetry metrics on a loopback port instead, which
+    the parent scrapes and re-exports with a `worker` label.
+    """
+
     DEFAULT_ADDR: str = "0.0.0.0"
     DEFAULT_PORT: int = 8080
     DEFAULT_ENDPOINT: str = "/metrics"
@@ -32,6 +78,7 @@ class AppOptionPrometheus(AppOptionBase):
         self.addr = addr
         self.port = port
         self.endpoint = endpoint
+        self.server: Optional[WSGIServer] = None
 
     def apply(self, app: App, /, *args, **kwargs) -> None:
         with app.env.prefixed("PROMETHEUS_"):
@@ -42,20 +89,52 @@ class AppOptionPrometheus(AppOptionBase):
             if not self.endpoint:
                 self.endpoint = app.env.str("ENDPOINT", self.DEFAULT_ENDPOINT)
             prefix = app.env.str("PREFIX", app.name)
-            mounts = {self.endpoint: make_wsgi_app()}
-            flask_app = Flask(import_name=app.name)
-            flask_app.wsgi_app = DispatcherMiddleware(
-                app=flask_app.wsgi_app, mounts=mounts
-            )
-            threading.Thread(
-                target=lambda: flask_app.run(
-                    host=self.addr,
-                    port=self.port,
-                    debug=True,
-                    use_reloader=False,
+            reader = PrometheusMetricReader(prefix)
+            if app.worker_id is None:
+                self.server = self.start_server(
+                    addr=self.addr, port=self.port, endpoint=self.endpoint
                 )
-            ).start()
-            app.otel_metric_readers.append(PrometheusMetricReader(prefix))
+            else:
+                self.server = self.start_worker_server(
+                    reader=reader, worker_id=app.worker_id, endpoint=self.endpoint
+                )
+                app.logger.info(
+                    "serving worker %d opentelemetry metrics on 127.0.0.1:%d%s",
+                    app.worker_id,
+                    self.server.server_port,
+                    self.endpoint,
+                )
+            app.otel_metric_readers.append(reader)
+
+    @staticmethod
+    def start_server(
+        addr: str, port: int, endpoint: str, registry: CollectorRegistry = REGISTRY
+    ) -> WSGIServer:
+        server = make_server(
+            host=addr,
+            port=port,
+            app=MetricsWSGIApp(endpoint=endpoint, registry=registry),
+            server_class=_ThreadingWSGIServer,
+            handler_class=_SilentWSGIRequestHandler,
+        )
+        threading.Thread(
+            target=server.serve_forever,
+            name="prometheus-exposition",
+            daemon=True,
+        ).start()
+        return server
+
+    @classmethod
+    def start_worker_server(
+        cls, reader: PrometheusMetricReader, worker_id: int, endpoint: str
+    ) -> WSGIServer:
+        # Only the reader's collector: the global registry's prometheus_client
+        # metrics are already aggregated by the parent from PROMETHEUS_MULTIPROC_DIR.
+        registry = CollectorRegistry()
+        registry.register(reader._collector)  # noqa
+        server = cls.start_server(addr="127.0.0.1", port=0, endpoint=endpoint, registry=registry)
+        register_worker_metrics_port(worker_id=worker_id, port=server.server_port)
+        return server
 
     def get_order(self) -> Union[int, AppOptionApplyOrderEnum]:
         return AppOptionApplyOrderEnum.SET_OTEL_METER_PROVIDER - 1
@@ -63,4 +142,5 @@ class AppOptionPrometheus(AppOptionBase):
 
 __all__ = [
     "AppOptionPrometheus",
+    "MetricsWSGIApp",
 ]
@@ -4,14 +4,15 @@
 
 from environs import Env
 from logging import Logger
-from typing import Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
 
-from grpc import HandlerCallDetails
+import grpc
+from grpc import HandlerCallDetails, RpcMethodHandler
 
 from opentelemetry.propagate import get_global_textmap
 
-from accelbyte_py_sdk import AccelByteSDK
-from accelbyte_py_sdk.core import HttpxHttpClient, RequestsHttpClient
+if TYPE_CHECKING:
+    from accelbyte_py_sdk import AccelByteSDK
 
 
 def create_env(**kwargs) -> Env:
@@ -39,11 +40,35 @@ def get_headers_from_metadata(handler_call_details: HandlerCallDetails) -> Dict[
     return headers
 
 
+def wrap_rpc_method_handler(
+    handler: Optional[RpcMethodHandler],
+    wrapper: Callable[[Callable, bool, bool], Callable],
+) -> Optional[RpcMethodHandler]:
+    """Rebuild `handler` with its behavior replaced by `wrapper(behavior, request_streaming, response_streaming)`."""
+    if handler is None:
+        return None
+    if handler.request_streaming and handler.response_streaming:
+        factory, behavior = grpc.stream_stream_rpc_method_handler, handler.stream_stream
+    elif handler.request_streaming:
+        factory, behavior = grpc.stream_unary_rpc_method_handler, handler.stream_unary
+    elif handler.response_streaming:
+        factory, behavior = grpc.unary_stream_rpc_method_handler, handler.unary_stream
+    else:
+        factory, behavior = grpc.unary_unary_rpc_method_handler, handler.unary_unary
+    return factory(
+        wrapper(behavior, handler.request_streaming, handler.response_streaming),
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer,
+    )
+
+
 def get_propagator_header_keys() -> Set[str]:
     return get_global_textmap().fields
 
 
-def instrument_sdk_http_client(sdk: AccelByteSDK, logger: Optional[Logger] = None) -> None:
+def instrument_sdk_http_client(sdk: "AccelByteSDK", logger: Optional[Logger] = None) -> None:
+    from accelbyte_py_sdk.core import HttpxHttpClient, RequestsHttpClient
+
     http_client = sdk.get_http_client(raise_when_none=False)
     if http_client is not None:
         if isinstance(http_client, HttpxHttpClient):
@@ -74,4 +99,5 @@ __all__ = [
     "get_headers_from_metadata",
     "get_propagator_header_keys",
     "instrument_sdk_http_client",
+    "wrap_rpc_method_handler",
 ]
@@ -0,0 +1,240 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+# requires:
+# - prometheus-client
+
+import glob
+import logging
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+import urllib.request
+from logging import Logger
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, Iterable, Optional
+
+WORKER_ID_ENV: str = "SERVICE_WORKER_ID"
+PROMETHEUS_MULTIPROC_DIR_ENV: str = "PROMETHEUS_MULTIPROC_DIR"
+WORKER_METRICS_PORT_FILE_PREFIX: str = "worker_"
+WORKER_METRICS_PORT_FILE_SUFFIX: str = ".port"
+
+
+def get_worker_id() -> Optional[int]:
+    """Returns the id of the current worker process, or None outside multi-worker mode."""
+    value = os.environ.get(WORKER_ID_ENV)
+    return int(value) if value else None
+
+
+def register_worker_metrics_port(worker_id: int, port: int) -> None:
+    """Records the loopback port of a worker's metrics server for the parent process."""
+    path = os.environ.get(PROMETHEUS_MULTIPROC_DIR_ENV)
+    if not path:
+        return
+    port_file = os.path.join(
+        path, WORKER_METRICS_PORT_FILE_PREFIX + str(worker_id) + WORKER_METRICS_PORT_FILE_SUFFIX
+    )
+    with open(port_file + ".tmp", "w") as f:
+        f.write(str(port))
+    os.replace(port_file + ".tmp", port_file)
+
+
+class WorkerMetricsCollector:
+    """Collects the workers' OpenTelemetry metrics, labelled with the worker id.
+
+    prometheus_client metrics are shared through PROMETHEUS_MULTIPROC_DIR, but
+    OpenTelemetry instruments only exist in each worker's MeterProvider, so
+    every worker serves them on a loopback port recorded in that directory
+    (see register_worker_metrics_port) and they are scraped on collection.
+    Workers that do not answer, e.g. while restarting, are skipped.
+    """
+
+    DEFAULT_TIMEOUT: float = 1.0
+
+    def __init__(
+        self,
+        path: str,
+        endpoint: str,
+        timeout: Optional[float] = None,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.path = path
+        self.endpoint = endpoint
+        self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+
+    def collect(self) -> Iterable[Any]:
+        from prometheus_client.metrics_core import Metric
+        from prometheus_client.parser import text_string_to_metric_families
+
+        families: Dict[str, Metric] = {}
+        pattern = WORKER_METRICS_PORT_FILE_PREFIX + "*" + WORKER_METRICS_PORT_FILE_SUFFIX
+        for port_file in sorted(glob.glob(os.path.join(self.path, pattern))):
+            worker_id = os.path.basename(port_file)[
+                len(WORKER_METRICS_PORT_FILE_PREFIX):-len(WORKER_METRICS_PORT_FILE_SUFFIX)
+            ]
+            try:
+                with open(port_file) as f:
+                    port = int(f.read())
+                url = "http://127.0.0.1:{}{}".format(port, self.endpoint)
+                with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                    text = response.read().decode("utf-8")
+            except (OSError, ValueError) as error:
+                self.logger.debug("skipped metrics of worker %s: %s", worker_id, error)
+                continue
+            for family in text_string_to_metric_families(text):
+                merged = families.get(family.name)
+                if merged is None:
+                    merged = families[family.name] = Metric(
+                        family.name, family.documentation, family.type, family.unit
+                    )
+                merged.samples.extend(
+                    sample._replace(labels={**sample.labels, "worker": worker_id})
+                    for sample in family.samples
+                )
+        return list(families.values())
+
+
+class WorkerSupervisor:
+    """Runs `target` in N spawned worker processes and restarts the ones that exit.
+
+    Workers share the gRPC port through SO_REUSEPORT. Prometheus client metrics
+    are written to PROMETHEUS_MULTIPROC_DIR by every worker and aggregated by
+    the exposition server started in this (parent) process, which also serves
+    the workers' OpenTelemetry metrics through WorkerMetricsCollector.
+    """
+
+    DEFAULT_RESTART_DELAY: float = 1.0
+    DEFAULT_TERMINATION_TIMEOUT: float = 10.0
+
+    def __init__(
+        self,
+        target: Callable[[], None],
+        workers: int,
+        logger: Optional[Logger] = None,
+        restart_delay: Optional[float] = None,
+        termination_timeout: Optional[float] = None,
+    ) -> None:
+        self.target = target
+        self.workers = max(1, workers)
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.restart_delay = (
+            restart_delay if restart_delay is not None else self.DEFAULT_RESTART_DELAY
+        )
+        self.termination_timeout = (
+            termination_timeout
+            if termination_timeout is not None
+            else self.DEFAULT_TERMINATION_TIMEOUT
+        )
+        self.processes: Dict[int, BaseProcess] = {}
+        self.restarts: int = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._stopping = False
+
+    def prepare_metrics_dir(self) -> str:
+        # Must run before prometheus_client is imported in this process.
+        path = os.environ.get(PROMETHEUS_MULTIPROC_DIR_ENV)
+        if path:
+            os.makedirs(path, exist_ok=True)
+            port_files = WORKER_METRICS_PORT_FILE_PREFIX + "*" + WORKER_METRICS_PORT_FILE_SUFFIX
+            for stale_file in glob.glob(os.path.join(path, "*.db")) + glob.glob(os.path.join(path, port_files)):
+                os.remove(stale_file)
+        else:
+            path = tempfile.mkdtemp(prefix="prometheus-multiproc-")
+            os.environ[PROMETHEUS_MULTIPROC_DIR_ENV] = path
+        return path
+
+    def serve_metrics(self, addr: str, port: int, endpoint: str) -> None:
+        from prometheus_client import CollectorRegistry
+        from prometheus_client.multiprocess import MultiProcessCollector
+
+        from .options.prometheus import AppOptionPrometheus
+
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(
+            WorkerMetricsCollector(
+                path=os.environ[PROMETHEUS_MULTIPROC_DIR_ENV], endpoint=endpoint, logger=self.logger
+            )
+        )
+        AppOptionPrometheus.start_server(
+            addr=addr, port=port, endpoint=endpoint, registry=registry
+        )
+        self.logger.info("serving aggregated worker metrics on %s:%d%s", addr, port, endpoint)
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        for worker_id in range(self.workers):
+            self.start_worker(worker_id)
+
+        while not self._stopping:
+            sentinels = {p.sentinel: worker_id for worker_id, p in self.processes.items()}
+            for sentinel in wait(list(sentinels), timeout=1.0):
+                if self._stopping:
+                    break
+                worker_id = sentinels[sentinel]
+                process = self.processes[worker_id]
+                process.join()
+                self.mark_process_dead(process)
+                self.logger.warning(
+                    "worker %d (pid %s) exited with code %s, restarting",
+                    worker_id, process.pid, process.exitcode,
+                )
+                time.sleep(self.restart_delay)
+                self.restarts += 1
+                self.start_worker(worker_id)
+
+        self.terminate_workers()
+
+    def start_worker(self, worker_id: int) -> None:
+        # Spawned children inherit the environment at start time.
+        os.environ[WORKER_ID_ENV] = str(worker_id)
+        try:
+            process = self._context.Process(
+                target=self.target, name="worker-{}".format(worker_id)
+            )
+            process.start()
+        finally:
+            del os.environ[WORKER_ID_ENV]
+        self.processes[worker_id] = process
+        self.logger.info("worker %d started (pid %s)", worker_id, process.pid)
+
+    def stop(self, signum: int = signal.SIGTERM, frame=None) -> None:
+        self._stopping = True
+
+    def terminate_workers(self) -> None:
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self.termination_timeout
+        for process in self.processes.values():
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+            self.mark_process_dead(process)
+        self.logger.info("all workers stopped")
+
+    @staticmethod
+    def mark_process_dead(process: BaseProcess) -> None:
+        if process.pid is None or not os.environ.get(PROMETHEUS_MULTIPROC_DIR_ENV):
+            return
+        from prometheus_client.multiprocess import mark_process_dead
+
+        mark_process_dead(process.pid)
+
+
+__all__ = [
+    "PROMETHEUS_MULTIPROC_DIR_ENV",
+    "WORKER_ID_ENV",
+    "WorkerMetricsCollector",
+    "WorkerSupervisor",
+    "get_worker_id",
+    "register_worker_metrics_port",
+]
@@ -4,57 +4,187 @@
 
 import asyncio
 import logging
+import time
 from logging import Logger
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from environs import Env
 
-from accelbyte_py_sdk import get_version
-from accelbyte_py_sdk.core import (
-    AccelByteSDK,
-    DictConfigRepository,
-    InMemoryTokenRepository,
-    HttpxHttpClient,
-)
-from accelbyte_py_sdk.services import auth as auth_service
-
 from accelbyte_grpc_plugin.app import (
     App,
     AppOption,
     AppOptionGRPCInterceptor,
     AppOptionGRPCService,
 )
-from accelbyte_grpc_plugin.utils import instrument_sdk_http_client
 
-from matchFunction_pb2_grpc import add_MatchFunctionServicer_to_server
-from .services.matchFunction import AsyncMatchFunctionService
-from .utils import create_env
+from .utils import StartupPhases, create_env
+
+if TYPE_CHECKING:
+    from accelbyte_py_sdk.core import AccelByteSDK
 
 DEFAULT_APP_PORT: int = 6565
+DEFAULT_SERVICE_WORKERS: int = 1
+DEFAULT_SERVICE_EVENT_LOOP: str = "asyncio"
+DEFAULT_SERVICE_DEFER_LOGIN: bool = False
 
 DEFAULT_AB_BASE_URL: str = "https://test.accelbyte.io"
 DEFAULT_AB_NAMESPACE: str = "accelbyte"
 
+DEFAULT_ENABLE_GRPC_SERVER_OPTIONS: bool = True
 DEFAULT_ENABLE_HEALTH_CHECK: bool = True
+DEFAULT_ENABLE_LOG_QUEUE: bool = False
+DEFAULT_ENABLE_LOKI: bool = False
+DEFAULT_ENABLE_LOOP_MONITOR: bool = False
+DEFAULT_ENABLE_PROFILING: bool = False
 DEFAULT_ENABLE_PROMETHEUS: bool = True
 DEFAULT_ENABLE_REFLECTION: bool = True
 DEFAULT_ENABLE_ZIPKIN: bool = True
 
+DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_ENABLED: bool = False
+DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_MAX_IN_FLIGHT: int = 64
+DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_MAX_QUEUE: int = 16
+DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_QUEUE_TIMEOUT: float = 0.5
+
 DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ENABLED: bool = True
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATION_WORKERS: int = 4
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_TOKEN_CACHE_SIZE: int = 10000
+DEFAULT_PLUGIN_GRPC_SERVER_AUTH_TOKEN_CACHE_MAX_TTL: float = 300.0
 
 DEFAULT_PLUGIN_GRPC_SERVER_LOGGING_ENABLED: bool = False
 DEFAULT_PLUGIN_GRPC_SERVER_METRICS_ENABLED: bool = True
 
+DEFAULT_MATCH_DEADLINE_RESERVE: float = 0.25
+
+DEFAULT_CAPTURE_DIR: str = ""
+DEFAULT_CAPTURE_EVERY_N: int = 1
+DEFAULT_CAPTURE_MAX_BYTES: int = 1 << 30
+
+DEFAULT_PAYLOAD_LOG_LEVEL: int = logging.INFO
+DEFAULT_PAYLOAD_LOG_EVERY_N: int = 1
+DEFAULT_PAYLOAD_LOG_FIRST_K: int = 0
+DEFAULT_PAYLOAD_LOG_MAX_SIZE: int = 4096
+
 
 async def main(**kwargs) -> None:
+    phases = StartupPhases(start=time.perf_counter())
+
     env = create_env(**kwargs)
 
     port: int = env.int("PORT", DEFAULT_APP_PORT)
+    defer_login: bool = env.bool("SERVICE_DEFER_LOGIN", DEFAULT_SERVICE_DEFER_LOGIN)
 
     logger = logging.getLogger("app")
     logger.setLevel(logging.INFO)
     logger.addHandler(logging.StreamHandler())
 
+    from matchFunction_pb2_grpc import add_MatchFunctionServicer_to_server
+    from .services.matchFunction import AsyncMatchFunctionService
+
+    phases.mark("imports")
+
+    sdk = create_sdk(env=env, logger=logger)
+
+    phases.mark("sdk")
+
+    if not defer_login:
+        await login(sdk=sdk, logger=logger)
+        phases.mark("login")
+
+    with env.prefixed("PAYLOAD_LOG_"):
+        payload_log_level = env.log_level("LEVEL", DEFAULT_PAYLOAD_LOG_LEVEL)
+        payload_log_every_n = env.int("EVERY_N", DEFAULT_PAYLOAD_LOG_EVERY_N)
+        payload_log_first_k = env.int("FIRST_K", DEFAULT_PAYLOAD_LOG_FIRST_K)
+        payload_log_max_size = env.int("MAX_SIZE", DEFAULT_PAYLOAD_LOG_MAX_SIZE)
+
+    match_deadline_reserve = env.float("MATCH_DEADLINE_RESERVE", DEFAULT_MATCH_DEADLINE_RESERVE)
+
+    capture = None
+    with env.prefixed("CAPTURE_"):
+        if capture_dir := env.str("DIR", DEFAULT_CAPTURE_DIR):
+            import atexit
+            from .capture import StreamCapture
+
+            capture = StreamCapture(
+                directory=capture_dir,
+                every_n=env.int("EVERY_N", DEFAULT_CAPTURE_EVERY_N),
+                max_bytes=env.int("MAX_BYTES", DEFAULT_CAPTURE_MAX_BYTES),
+            )
+            atexit.register(capture.close)
+            logger.info(f"capturing match request streams to {capture_dir}")
+
+    options = create_options(sdk=sdk, env=env, logger=logger)
+    if defer_login:
+        from accelbyte_grpc_plugin.interceptors.readiness import (
+            ReadinessServerInterceptor,
+        )
+
+        # Ahead of the other interceptors, so calls made before the login
+        # are rejected instead of being authorized against a cold SDK.
+        options.insert(
+            0, AppOptionGRPCInterceptor(interceptor=ReadinessServerInterceptor(serving=False))
+        )
+    options.append(
+        AppOptionGRPCService(
+            full_name=AsyncMatchFunctionService.full_name,
+            service=AsyncMatchFunctionService(
+                sdk=sdk,
+                logger=logger,
+                payload_log_level=payload_log_level,
+                payload_log_every_n=payload_log_every_n,
+                payload_log_first_k=payload_log_first_k,
+                payload_log_max_size=payload_log_max_size,
+                deadline_reserve=match_deadline_reserve,
+                capture=capture,
+            ),
+            add_service_fn=add_MatchFunctionServicer_to_server,
+        )
+    )
+
+    phases.mark("options")
+
+    app = App(port=port, env=env, logger=logger, options=options)
+    app.initialize()
+
+    phases.mark("initialize")
+
+    if defer_login:
+        await app.set_serving(False)
+    await app.start()
+
+    phases.mark("start")
+
+    if not defer_login:
+        logger.info(f"startup: {phases}")
+        await app.wait_for_termination()
+        return
+
+    # The port is bound and health reports NOT_SERVING while the login runs.
+    logger.info(f"waiting for login before serving, startup: {phases}")
+
+    try:
+        await login(sdk=sdk, logger=logger)
+    except Exception as error:
+        logger.error(f"login failed, stopping: {error}")
+        assert app.grpc_server is not None
+        await app.grpc_server.stop(grace=None)
+        raise
+
+    phases.mark("login")
+    await app.set_serving(True)
+    logger.info(f"ready, startup: {phases}")
+
+    await app.wait_for_termination()
+
+
+def create_sdk(env: Env, logger: Logger) -> "AccelByteSDK":
+    from accelbyte_py_sdk.core import (
+        AccelByteSDK,
+        DictConfigRepository,
+        InMemoryTokenRepository,
+        HttpxHttpClient,
+    )
+    from accelbyte_grpc_plugin.utils import instrument_sdk_http_client
+
     config = DictConfigRepository(dict(env.dump()))
     token = InMemoryTokenRepository()
     http = HttpxHttpClient()
@@ -71,44 +201,65 @@ async def main(**kwargs) -> None:
 
     instrument_sdk_http_client(sdk=sdk, logger=logger)
 
+    return sdk
+
+
+async def login(sdk: "AccelByteSDK", logger: Logger) -> None:
+    from accelbyte_py_sdk import get_version
+    from accelbyte_py_sdk.services import auth as auth_service
+
     _, error = await auth_service.login_client_async(sdk=sdk)
     if error:
         raise Exception(str(error))
 
     sdk.timer = auth_service.LoginClientTimer(5, refresh_rate=0.8, repeats=-1, autostart=True, sdk=sdk)
 
-    options = create_options(sdk=sdk, env=env, logger=logger)
-    options.append(
-        AppOptionGRPCService(
-            full_name=AsyncMatchFunctionService.full_name,
-            service=AsyncMatchFunctionService(
-                sdk=sdk,
-                logger=logger,
-            ),
-            add_service_fn=add_MatchFunctionServicer_to_server,
-        )
-    )
-
-    app = App(port=port, env=env, logger=logger, options=options)
-
     logger.info(f"using {get_version(latest=True, full=True)}")
 
-    await app.run()
 
-
-def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOption]:
+def create_options(sdk: "AccelByteSDK", env: Env, logger: Logger) -> List[AppOption]:
     options: List[AppOption] = []
 
     with env.prefixed("AB_"):
         namespace = env.str("NAMESPACE", DEFAULT_AB_NAMESPACE)
 
     with env.prefixed("ENABLE_"):
+        if env.bool("GRPC_SERVER_OPTIONS", DEFAULT_ENABLE_GRPC_SERVER_OPTIONS):
+            from accelbyte_grpc_plugin.options.grpc_server_options import (
+                AppOptionGRPCServerOptions,
+            )
+
+            options.append(AppOptionGRPCServerOptions())
         if env.bool("HEALTH_CHECK", env.bool("HEALTH_CHECKING", DEFAULT_ENABLE_HEALTH_CHECK)):
             from accelbyte_grpc_plugin.options.grpc_health_check import (
                 AppOptionGRPCHealthCheck,
             )
 
             options.append(AppOptionGRPCHealthCheck())
+        if env.bool("LOG_QUEUE", DEFAULT_ENABLE_LOG_QUEUE):
+            from accelbyte_grpc_plugin.options.log_queue import (
+                AppOptionLogQueue,
+            )
+
+            options.append(AppOptionLogQueue())
+        if env.bool("LOKI", DEFAULT_ENABLE_LOKI):
+            from accelbyte_grpc_plugin.options.loki_batch import (
+                AppOptionLokiBatch,
+            )
+
+            options.append(AppOptionLokiBatch())
+        if env.bool("LOOP_MONITOR", DEFAULT_ENABLE_LOOP_MONITOR):
+            from accelbyte_grpc_plugin.options.loop_monitor import (
+                AppOptionLoopMonitor,
+            )
+
+            options.append(AppOptionLoopMonitor())
+        if env.bool("PROFILING", DEFAULT_ENABLE_PROFILING):
+            from accelbyte_grpc_plugin.options.profiling import (
+                AppOptionProfiling,
+            )
+
+            options.append(AppOptionProfiling())
         if env.bool("PROMETHEUS", DEFAULT_ENABLE_PROMETHEUS):
             from accelbyte_grpc_plugin.options.prometheus import (
                 AppOptionPrometheus
@@ -129,16 +280,61 @@ def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOptio
             options.append(AppOptionZipkin())
 
     with env.prefixed("PLUGIN_GRPC_SERVER_"):
+        with env.prefixed("ADMISSION_"):
+            if env.bool("ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_ENABLED):
+                from accelbyte_grpc_plugin.interceptors.admission import (
+                    AdmissionServerInterceptor,
+                )
+
+                options.append(
+                    AppOptionGRPCInterceptor(
+                        interceptor=AdmissionServerInterceptor(
+                            max_in_flight=env.int(
+                                "MAX_IN_FLIGHT", DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_MAX_IN_FLIGHT
+                            ),
+                            max_queue=env.int(
+                                "MAX_QUEUE", DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_MAX_QUEUE
+                            ),
+                            queue_timeout=env.float(
+                                "QUEUE_TIMEOUT", DEFAULT_PLUGIN_GRPC_SERVER_ADMISSION_QUEUE_TIMEOUT
+                            ),
+                            method_max_in_flight=env.dict(
+                                "METHOD_MAX_IN_FLIGHT", {}, subcast_values=int
+                            ),
+                        )
+                    )
+                )
         with env.prefixed("AUTH_"):
             if env.bool("ENABLED", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_ENABLED):
+                from concurrent.futures import ThreadPoolExecutor
                 from accelbyte_py_sdk.token_validation.caching import CachingTokenValidator
-                from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+                from accelbyte_grpc_plugin.interceptors.authorization import (
+                    AuthorizationServerInterceptor,
+                    VerifiedTokenCache,
+                )
+
+                validation_workers = env.int(
+                    "VALIDATION_WORKERS", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_VALIDATION_WORKERS
+                )
+                token_cache = VerifiedTokenCache(
+                    max_size=env.int(
+                        "TOKEN_CACHE_SIZE", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_TOKEN_CACHE_SIZE
+                    ),
+                    max_ttl=env.float(
+                        "TOKEN_CACHE_MAX_TTL", DEFAULT_PLUGIN_GRPC_SERVER_AUTH_TOKEN_CACHE_MAX_TTL
+                    ),
+                )
 
                 options.append(
                     AppOptionGRPCInterceptor(
                         interceptor=AuthorizationServerInterceptor(
                             namespace=namespace,
                             token_validator=CachingTokenValidator(sdk=sdk),
+                            token_cache=token_cache,
+                            executor=ThreadPoolExecutor(
+                                max_workers=validation_workers,
+                                thread_name_prefix="token-validation",
+                            ),
                         )
                     )
                 )
@@ -166,6 +362,46 @@ def create_options(sdk: AccelByteSDK, env: Env, logger: Logger) -> List[AppOptio
 
 
 def run() -> None:
+    env = create_env()
+    workers = env.int("SERVICE_WORKERS", DEFAULT_SERVICE_WORKERS)
+    if workers > 1:
+        run_workers(env=env, workers=workers)
+    else:
+        serve()
+
+
+def run_workers(env: Env, workers: int) -> None:
+    from accelbyte_grpc_plugin.workers import WorkerSupervisor
+
+    logger = logging.getLogger("app")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler())
+
+    supervisor = WorkerSupervisor(target=serve, workers=workers, logger=logger)
+    supervisor.prepare_metrics_dir()
+
+    if env.bool("ENABLE_PROMETHEUS", DEFAULT_ENABLE_PROMETHEUS):
+        from accelbyte_grpc_plugin.options.prometheus import AppOptionPrometheus
+
+        with env.prefixed("PROMETHEUS_"):
+            supervisor.serve_metrics(
+                addr=env.str("ADDR", AppOptionPrometheus.DEFAULT_ADDR),
+                port=env.int("PORT", AppOptionPrometheus.DEFAULT_PORT),
+                endpoint=env.str("ENDPOINT", AppOptionPrometheus.DEFAULT_ENDPOINT),
+            )
+
+    logger.info(f"starting {workers} worker(s)")
+    supervisor.run()
+
+
+def serve() -> None:
+    from accelbyte_grpc_plugin.event_loop import EVENT_LOOP_ENV, set_event_loop
+
+    env = create_env()
+    set_event_loop(
+        name=env.str(EVENT_LOOP_ENV, DEFAULT_SERVICE_EVENT_LOOP),
+        logger=logging.getLogger("app"),
+    )
     asyncio.run(main())
 
 
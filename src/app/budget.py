@@ -0,0 +1,50 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import time
+from typing import Any, Optional
+
+
+class TimeBudget:
+    """Time left before an RPC deadline, minus a reserve kept for flushing results."""
+
+    __slots__ = ("deadline", "reserve", "degraded")
+
+    def __init__(self, time_remaining: Optional[float] = None, reserve: float = 0.0) -> None:
+        self.deadline: Optional[float] = (
+            time.monotonic() + time_remaining if time_remaining is not None else None
+        )
+        self.reserve = reserve
+        self.degraded: bool = False
+
+    @classmethod
+    def from_context(cls, context: Any, reserve: float = 0.0) -> "TimeBudget":
+        time_remaining = getattr(context, "time_remaining", None)
+        return cls(
+            time_remaining=time_remaining() if callable(time_remaining) else None,
+            reserve=reserve,
+        )
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def is_exhausted(self) -> bool:
+        """True once the remaining time drops to the reserve; stays degraded afterwards."""
+        if not self.degraded and self.deadline is not None:
+            self.degraded = self.deadline - time.monotonic() <= self.reserve
+        return self.degraded
+
+    def report(self) -> bool:
+        """Same check as `is_exhausted()`, for callers that have no cheaper fallback.
+
+        The caller keeps doing the same work; the result only marks the tick degraded.
+        """
+        return self.is_exhausted()
+
+
+__all__ = [
+    "TimeBudget",
+]
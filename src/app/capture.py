@@ -0,0 +1,205 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import mmap
+import os
+import queue
+import threading
+import time
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from google.protobuf.message import Message
+
+from matchFunction_pb2 import BackfillMakeMatchesRequest, MakeMatchesRequest
+
+M = TypeVar("M", bound=Message)
+
+CAPTURE_SUFFIX: str = ".pbstream"
+CAPTURE_MESSAGE_TYPES: Dict[str, Type[Message]] = {
+    "MakeMatches": MakeMatchesRequest,
+    "BackfillMatches": BackfillMakeMatchesRequest,
+}
+
+
+def encode_varint(value: int) -> bytes:
+    buffer = bytearray()
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+    return bytes(buffer)
+
+
+def decode_varint(buffer, position: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+class CaptureWriter:
+    """Appends length-delimited (varint size + bytes) request messages to a file."""
+
+    def __init__(self, path: str, buffer_size: int = 65536) -> None:
+        self.path = path
+        self.messages: int = 0
+        self._file: Optional[BinaryIO] = open(path, "wb", buffering=buffer_size)
+
+    def write(self, message: Message) -> None:
+        self.write_bytes(message.SerializeToString())
+
+    def write_bytes(self, data: bytes) -> None:
+        assert self._file is not None
+        self._file.write(encode_varint(len(data)))
+        self._file.write(data)
+        self.messages += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class StreamCapture:
+    """Records every `every_n`-th MakeMatches/BackfillMatches request stream into `directory`.
+
+    Each stream becomes one `<rpc>-<tickId>-<time_ns>-<pid>.pbstream` file holding
+    the parameters message followed by the ticket messages, as received.
+
+    Messages are serialized on the caller and written by a background thread.
+    Once `max_bytes` have been captured no new streams are recorded, and a
+    stream that crosses the limit is cut at its last whole message; 0 or less
+    means no limit.
+    """
+
+    DEFAULT_MAX_BYTES: int = 1 << 30
+
+    def __init__(self, directory: str, every_n: int = 1, max_bytes: Optional[int] = None) -> None:
+        self.directory = directory
+        self.every_n = every_n
+        self.max_bytes = max_bytes if max_bytes is not None else self.DEFAULT_MAX_BYTES
+        self.streams: int = 0
+        self.captured_bytes: int = 0
+        self.dropped_messages: int = 0
+        self.failed_writes: int = 0
+        self._queue: "queue.SimpleQueue[Optional[Tuple[str, Optional[bytes]]]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def sample(self) -> bool:
+        self.streams += 1
+        if self.is_full():
+            return False
+        return self.every_n > 0 and self.streams % self.every_n == 0
+
+    def is_full(self) -> bool:
+        return 0 < self.max_bytes <= self.captured_bytes
+
+    def create_path(self, rpc: str, tick_id: int) -> str:
+        name = "{}-{}-{}-{}{}".format(rpc, tick_id, time.time_ns(), os.getpid(), CAPTURE_SUFFIX)
+        return os.path.join(self.directory, name)
+
+    def submit(self, path: str, data: bytes) -> bool:
+        """Queues one message for `path`; False when it would exceed `max_bytes`."""
+        size = len(encode_varint(len(data))) + len(data)
+        if self.max_bytes > 0 and self.captured_bytes + size > self.max_bytes:
+            self.dropped_messages += 1
+            return False
+        self.captured_bytes += size
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="stream-capture", daemon=True)
+            self._thread.start()
+        self._queue.put((path, data))
+        return True
+
+    def close(self) -> None:
+        """Waits for the queued messages to be written and stops the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    async def record(self, rpc: str, request_iterator: AsyncIterator[M]) -> AsyncIterator[M]:
+        if not self.sample():
+            async for request in request_iterator:
+                yield request
+            return
+        path: Optional[str] = None
+        capturing = True
+        try:
+            async for request in request_iterator:
+                if capturing:
+                    if path is None:
+                        tick_id = request.parameters.tickId if request.HasField("parameters") else 0
+                        path = self.create_path(rpc=rpc, tick_id=tick_id)
+                    capturing = self.submit(path, request.SerializeToString())
+                yield request
+        finally:
+            if path is not None:
+                self._queue.put((path, None))
+
+    def _run(self) -> None:
+        writers: Dict[str, Optional[CaptureWriter]] = {}
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            path, data = item
+            if path not in writers:
+                try:
+                    writers[path] = CaptureWriter(path=path)
+                except OSError:
+                    writers[path] = None
+                    self.failed_writes += 1
+            writer = writers[path]
+            if data is None:
+                writers.pop(path)
+                if writer is not None:
+                    writer.close()
+            elif writer is not None:
+                try:
+                    writer.write_bytes(data)
+                except OSError:
+                    self.failed_writes += 1
+        for writer in writers.values():
+            if writer is not None:
+                writer.close()
+
+
+def get_capture_rpc(path: str) -> str:
+    rpc = os.path.basename(path).split("-", 1)[0]
+    if rpc not in CAPTURE_MESSAGE_TYPES:
+        raise ValueError(f"not a capture file: {path}")
+    return rpc
+
+
+def read_capture(path: str, message_type: Optional[Type[M]] = None) -> Iterator[M]:
+    """Yields the messages of a capture file, reading it through mmap."""
+    if message_type is None:
+        message_type = CAPTURE_MESSAGE_TYPES[get_capture_rpc(path)]  # type: ignore[assignment]
+    assert message_type is not None
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            position = 0
+            end = len(buffer)
+            while position < end:
+                size, position = decode_varint(buffer, position)
+                yield message_type.FromString(buffer[position:position + size])
+                position += size
+
+
+__all__ = [
+    "CaptureWriter",
+    "StreamCapture",
+    "get_capture_rpc",
+    "read_capture",
+]
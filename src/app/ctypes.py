@@ -1,11 +1,24 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, List, Optional, Tuple, Type
 
 
 class ValidationError(Exception):
     pass
 
 
+def check_types(obj: Any, **types: Tuple[Type, ...]) -> None:
+    """Raises TypeError when a field of `obj` does not have one of the given types.
+
+    bool is a subclass of int, so it is only accepted where it is listed.
+    """
+    for name, allowed in types.items():
+        value = getattr(obj, name)
+        if isinstance(value, bool) and bool not in allowed:
+            raise TypeError(f"{name} must be {allowed[0].__name__}, got bool")
+        if not isinstance(value, allowed):
+            raise TypeError(f"{name} must be {allowed[0].__name__}, got {type(value).__name__}")
+
+
 @dataclass
 class AllianceRule:
     min_number: int = 0
@@ -13,6 +26,19 @@ class AllianceRule:
     player_min_number: int = 0
     player_max_number: int = 0
 
+    def __post_init__(self) -> None:
+        check_types(self, **{f.name: (int,) for f in fields(self)})
+
+
+@dataclass
+class MatchingRule:
+    attribute: str = ""
+    criteria: str = "distance"
+    reference: float = 0
+
+    def __post_init__(self) -> None:
+        check_types(self, attribute=(str,), criteria=(str,), reference=(float, int))
+
 
 @dataclass
 class GameRules:
@@ -20,13 +46,47 @@ class GameRules:
     shipCountMax: int = 0
     auto_backfill: bool = False
     alliance: Optional[AllianceRule] = None
+    matching_rule: List[MatchingRule] = field(default_factory=list)
+    region_latency_max_ms: int = 0
+
+    def __post_init__(self) -> None:
+        check_types(
+            self,
+            shipCountMin=(int,),
+            shipCountMax=(int,),
+            auto_backfill=(bool,),
+            region_latency_max_ms=(int,),
+            matching_rule=(list,),
+        )
+        if isinstance(self.alliance, dict):
+            self.alliance = AllianceRule(**self.alliance)
+        elif self.alliance is not None and not isinstance(self.alliance, AllianceRule):
+            raise TypeError(f"alliance must be an object, got {type(self.alliance).__name__}")
+        matching_rule = []
+        for rule in self.matching_rule:
+            if isinstance(rule, dict):
+                rule = MatchingRule(**rule)
+            elif not isinstance(rule, MatchingRule):
+                raise TypeError(f"matching_rule entries must be objects, got {type(rule).__name__}")
+            matching_rule.append(rule)
+        self.matching_rule = matching_rule
+
+    def get_distance_rule(self) -> Optional[MatchingRule]:
+        for rule in self.matching_rule:
+            if rule.criteria == "distance" and rule.attribute:
+                return rule
+        return None
 
     def validate(self) -> None:
-        if not self.alliance:
-            raise ValidationError("alliance rule missing")
-        if self.alliance.min_number > self.alliance.max_number:
-            raise ValidationError("alliance rule MaxNumber is less than MinNumber")
-        if self.alliance.player_min_number > self.alliance.player_max_number:
-            raise ValidationError("alliance rule PlayerMaxNumber is less than PlayerMinNumber")
-        if self.shipCountMin > self.shipCountMax:
+        if self.alliance:
+            if self.alliance.min_number > self.alliance.max_number:
+                raise ValidationError("alliance rule MaxNumber is less than MinNumber")
+            if self.alliance.player_min_number > self.alliance.player_max_number:
+                raise ValidationError("alliance rule PlayerMaxNumber is less than PlayerMinNumber")
+        if self.shipCountMax != 0 and self.shipCountMin > self.shipCountMax:
             raise ValidationError("ShipCountMax is less than ShipCountMin")
+        for rule in self.matching_rule:
+            if rule.reference < 0:
+                raise ValidationError("matching rule Reference is negative")
+        if self.region_latency_max_ms < 0:
+            raise ValidationError("RegionLatencyMaxMs is negative")
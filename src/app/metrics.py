@@ -0,0 +1,66 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import time
+from typing import Iterable, Optional
+
+import opentelemetry.metrics
+from opentelemetry.metrics import Meter
+
+from matchFunction_pb2 import Ticket
+
+
+class MatchFunctionMetrics:
+    """Matchmaking instruments on the global meter provider.
+
+    Instruments are created through the API proxy, so they can be created
+    before App.initialize sets the meter provider.
+    """
+
+    def __init__(self, meter: Optional[Meter] = None) -> None:
+        if meter is None:
+            meter = opentelemetry.metrics.get_meter(__name__)
+        self.pool_size = meter.create_histogram(
+            name="matchmaking_pool_size",
+            unit="1",
+            description="unmatched tickets left in the pool when a stream ends",
+        )
+        self.ticket_age = meter.create_histogram(
+            name="matchmaking_ticket_age",
+            unit="s",
+            description="time from ticket creation until it is matched",
+        )
+        self.build_cpu_time = meter.create_histogram(
+            name="matchmaking_build_cpu_time",
+            unit="s",
+            description="CPU time spent building matches or proposals per tick",
+        )
+        # Recorded once per stream with match_pool and rpc only. The tick id is
+        # unbounded and would create a series per tick, so it is left to the
+        # "pool (end)" log line, which carries it next to the same counts.
+        self.results_per_tick = meter.create_histogram(
+            name="matchmaking_results_per_tick",
+            unit="1",
+            description="matches or backfill proposals emitted per tick",
+        )
+        self.degraded_ticks = meter.create_counter(
+            name="matchmaking_degraded_ticks",
+            unit="1",
+            description="ticks that reached the deadline reserve and fell back to greedy matching",
+        )
+
+    def record_ticket_ages(self, tickets: Iterable[Ticket], now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        record = self.ticket_age.record
+        for ticket in tickets:
+            created_at = ticket.CreatedAt
+            if created_at.seconds or created_at.nanos:
+                age = now - created_at.seconds - created_at.nanos / 1e9
+                record(max(age, 0.0), {"match_pool": ticket.match_pool})
+
+
+__all__ = [
+    "MatchFunctionMetrics",
+]
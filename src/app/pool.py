@@ -0,0 +1,278 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Callable, Deque, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TicketPool(Generic[T]):
+    """FIFO pool of unmatched tickets; every ticket is appended and popped exactly once."""
+
+    def __init__(self, min_size: int = 1, max_size: int = 1) -> None:
+        self.min_size = max(min_size, 1)
+        self.max_size = max(max_size, 1)
+        self.peak_size: int = 0
+        self._items: Deque[T] = deque()
+
+    def add(self, item: T) -> None:
+        self._items.append(item)
+        size = len(self._items)
+        if size > self.peak_size:
+            self.peak_size = size
+
+    def pop(self) -> T:
+        return self._items.popleft()
+
+    def drain_matches(self) -> List[List[T]]:
+        groups: List[List[T]] = []
+        items = self._items
+        popleft = items.popleft
+        while len(items) >= self.min_size:
+            num_items = self.max_size if len(items) >= self.max_size else self.min_size
+            groups.append([popleft() for _ in range(num_items)])
+        return groups
+
+    def drain_greedy(self) -> List[List[T]]:
+        """Cheapest draining strategy; used when the time budget runs out."""
+        return self.drain_matches()
+
+    @property
+    def size(self) -> int:
+        return len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return "{}(size={}, peak_size={})".format(
+            self.__class__.__name__, self.size, self.peak_size
+        )
+
+
+class SkillTicketPool(TicketPool[T]):
+    """Pool kept sorted by a skill key; matches are formed from neighbouring tickets
+    whose keys are at most max_distance apart.
+
+    Only windows around newly added tickets are checked: removing a matched window
+    never makes the remaining neighbours closer, so older windows stay unmatchable.
+
+    Tickets are stored in sorted blocks of at most 2 * load entries, located by
+    bisecting the blocks' last keys, so adding, popping or removing a ticket
+    moves at most one block instead of the whole pool. Positions are
+    (block, offset) pairs.
+    """
+
+    DEFAULT_LOAD: int = 256
+
+    def __init__(
+        self,
+        key: Callable[[T], float],
+        max_distance: float,
+        min_size: int = 1,
+        max_size: int = 1,
+        load: Optional[int] = None,
+    ) -> None:
+        super().__init__(min_size=min_size, max_size=max_size)
+        self.key = key
+        self.max_distance = max_distance
+        self.load = max(load if load is not None else self.DEFAULT_LOAD, 1)
+        self._key_blocks: List[List[float]] = []
+        self._item_blocks: List[List[T]] = []
+        self._maxes: List[float] = []
+        self._size: int = 0
+        self._pending: List[float] = []
+
+    def add(self, item: T) -> None:
+        key = self.key(item)
+        maxes = self._maxes
+        if not maxes:
+            self._key_blocks.append([key])
+            self._item_blocks.append([item])
+            maxes.append(key)
+        else:
+            block = bisect_right(maxes, key)
+            if block == len(maxes):
+                block -= 1
+            keys = self._key_blocks[block]
+            index = bisect_right(keys, key)
+            keys.insert(index, key)
+            self._item_blocks[block].insert(index, item)
+            maxes[block] = keys[-1]
+            if len(keys) > 2 * self.load:
+                self._split(block)
+        self._pending.append(key)
+        self._size += 1
+        if self._size > self.peak_size:
+            self.peak_size = self._size
+
+    def pop(self) -> T:
+        if not self._size:
+            raise IndexError("pop from an empty pool")
+        return self._remove((0, 0), 1)[0]
+
+    def drain_matches(self) -> List[List[T]]:
+        groups: List[List[T]] = []
+        pending, self._pending = self._pending, []
+        for key in pending:
+            window = self.find_window(key=key)
+            if window is None:
+                continue
+            position, num_items = window
+            groups.append(self._remove(position, num_items))
+        return groups
+
+    def drain_greedy(self) -> List[List[T]]:
+        """Groups neighbouring tickets in key order, ignoring max_distance."""
+        groups: List[List[T]] = []
+        self._pending = []
+        items = [item for block in self._item_blocks for item in block]
+        keys = [key for block in self._key_blocks for key in block]
+        start = 0
+        while len(items) - start >= self.min_size:
+            num_items = self.max_size if len(items) - start >= self.max_size else self.min_size
+            groups.append(items[start:start + num_items])
+            start += num_items
+        del items[:start]
+        del keys[:start]
+        self._key_blocks = [keys] if keys else []
+        self._item_blocks = [items] if items else []
+        self._maxes = [keys[-1]] if keys else []
+        self._size = len(items)
+        return groups
+
+    def find_window(self, key: float) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Returns the (position, number of tickets) of the tightest match around `key`.
+
+        A window of max_size tickets is preferred over one of min_size; either
+        must contain the position of `key` and span at most max_distance.
+        """
+        if len(self._key_blocks) == 1:
+            keys = self._key_blocks[0]
+            lo_index, hi_index = bisect_left(keys, key), bisect_right(keys, key)
+            base = (0, 0)
+        else:
+            lo = self._locate_left(key)
+            hi = self._locate_right(key)
+            # Every candidate window lies within max_size - 1 tickets of [lo, hi).
+            before, base = self._keys_before(lo, self.max_size - 1)
+            keys = before + self._keys_between(lo, hi)
+            lo_index, hi_index = len(before), len(keys)
+            keys += self._keys_from(hi, self.max_size - 1)
+        for num_items in (self.max_size, self.min_size):
+            if self._size < num_items:
+                continue
+            best: Optional[int] = None
+            best_span = self.max_distance
+            first = max(lo_index - num_items + 1, 0)
+            last = min(hi_index - 1, len(keys) - num_items)
+            for start in range(first, last + 1):
+                span = keys[start + num_items - 1] - keys[start]
+                if span <= best_span:
+                    best, best_span = start, span
+            if best is not None:
+                return self._advance(base, best), num_items
+        return None
+
+    def _split(self, block: int) -> None:
+        keys, items = self._key_blocks[block], self._item_blocks[block]
+        half = len(keys) // 2
+        self._key_blocks.insert(block + 1, keys[half:])
+        self._item_blocks.insert(block + 1, items[half:])
+        del keys[half:]
+        del items[half:]
+        self._maxes[block] = keys[-1]
+        self._maxes.insert(block + 1, self._key_blocks[block + 1][-1])
+
+    def _locate_left(self, key: float) -> Tuple[int, int]:
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, bisect_left(self._key_blocks[block], key)
+
+    def _locate_right(self, key: float) -> Tuple[int, int]:
+        block = bisect_right(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, bisect_right(self._key_blocks[block], key)
+
+    def _advance(self, position: Tuple[int, int], steps: int) -> Tuple[int, int]:
+        block, index = position
+        while steps:
+            remaining = len(self._key_blocks[block]) - index
+            if steps < remaining:
+                return block, index + steps
+            steps -= remaining
+            block, index = block + 1, 0
+        return block, index
+
+    def _keys_before(self, position: Tuple[int, int], count: int) -> Tuple[List[float], Tuple[int, int]]:
+        """Up to `count` keys preceding `position`, and the position of the first of them."""
+        block, index = position
+        keys: List[float] = []
+        while count > 0 and (block > 0 or index > 0):
+            if index == 0:
+                block -= 1
+                index = len(self._key_blocks[block])
+            take = min(count, index)
+            keys[:0] = self._key_blocks[block][index - take:index]
+            index -= take
+            count -= take
+        return keys, (block, index)
+
+    def _keys_between(self, start: Tuple[int, int], stop: Tuple[int, int]) -> List[float]:
+        block, index = start
+        keys: List[float] = []
+        while block < stop[0]:
+            keys.extend(self._key_blocks[block][index:])
+            block, index = block + 1, 0
+        if block < len(self._key_blocks):
+            keys.extend(self._key_blocks[block][index:stop[1]])
+        return keys
+
+    def _keys_from(self, position: Tuple[int, int], count: int) -> List[float]:
+        block, index = position
+        keys: List[float] = []
+        while count > 0 and block < len(self._key_blocks):
+            segment = self._key_blocks[block][index:index + count]
+            keys.extend(segment)
+            count -= len(segment)
+            block, index = block + 1, 0
+        return keys
+
+    def _remove(self, position: Tuple[int, int], count: int) -> List[T]:
+        block, index = position
+        removed: List[T] = []
+        while count:
+            keys, items = self._key_blocks[block], self._item_blocks[block]
+            take = min(count, len(keys) - index)
+            removed.extend(items[index:index + take])
+            del keys[index:index + take]
+            del items[index:index + take]
+            count -= take
+            if keys:
+                self._maxes[block] = keys[-1]
+                block += 1
+            else:
+                del self._key_blocks[block]
+                del self._item_blocks[block]
+                del self._maxes[block]
+            index = 0
+        self._size -= len(removed)
+        return removed
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+
+__all__ = [
+    "SkillTicketPool",
+    "TicketPool",
+]
@@ -0,0 +1,78 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+from typing import Dict, List, Optional, Sequence
+
+import math
+
+from matchFunction_pb2 import Ticket
+
+
+class RegionLatencySelector:
+    """Orders regions per ticket group by aggregated latency.
+
+    A region a ticket has no latency for is never preferred for its group,
+    and regions over `max_latency_ms` (RegionLatencyMaxMs) are dropped. A
+    group whose tickets report no latencies at all gets `default_preferences`,
+    the regions build_match used before latencies were taken into account.
+    """
+
+    AGGREGATE_MAX: str = "max"
+    AGGREGATE_MEAN: str = "mean"
+
+    DEFAULT_PREFERENCES: Sequence[str] = ("us-east-2", "us-west-2")
+
+    def __init__(
+        self,
+        max_latency_ms: int = 0,
+        aggregate: str = AGGREGATE_MAX,
+        default_preferences: Optional[Sequence[str]] = None,
+    ) -> None:
+        if aggregate not in (self.AGGREGATE_MAX, self.AGGREGATE_MEAN):
+            raise ValueError(f"unknown latency aggregate: {aggregate}")
+        self.max_latency_ms = max_latency_ms
+        self.aggregate = aggregate
+        self.default_preferences = list(
+            default_preferences if default_preferences is not None else self.DEFAULT_PREFERENCES
+        )
+
+    def select(self, groups: Sequence[Sequence[Ticket]]) -> List[List[str]]:
+        return [self.select_group(group) for group in groups]
+
+    def select_group(self, group: Sequence[Ticket]) -> List[str]:
+        latencies: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        for ticket in group:
+            for region, latency in ticket.latencies.items():
+                if region in latencies:
+                    if self.aggregate == self.AGGREGATE_MEAN:
+                        latencies[region] += latency
+                    elif latency > latencies[region]:
+                        latencies[region] = latency
+                    counts[region] += 1
+                else:
+                    latencies[region] = latency
+                    counts[region] = 1
+
+        if not latencies:
+            return list(self.default_preferences)
+
+        size = len(group)
+        candidates = []
+        for region, latency in latencies.items():
+            if counts[region] < size:
+                continue
+            if self.aggregate == self.AGGREGATE_MEAN:
+                latency = latency / size
+            if self.max_latency_ms > 0 and latency > self.max_latency_ms:
+                continue
+            if math.isfinite(latency):
+                candidates.append((latency, region))
+        candidates.sort()
+        return [region for _, region in candidates]
+
+
+__all__ = [
+    "RegionLatencySelector",
+]
@@ -0,0 +1,150 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .ctypes import AllianceRule, GameRules, MatchingRule, ValidationError
+from .region import RegionLatencySelector
+
+
+class RulesPlan:
+    """Immutable, validated form of a rules JSON with derived match bounds."""
+
+    __slots__ = (
+        "key",
+        "rules",
+        "min_players",
+        "max_players",
+        "min_teams",
+        "max_teams",
+        "min_team_players",
+        "max_team_players",
+        "auto_backfill",
+        "distance_rule",
+        "stat_codes",
+        "region_selector",
+    )
+
+    key: str
+    rules: GameRules
+    min_players: int
+    max_players: int
+    min_teams: int
+    max_teams: int
+    min_team_players: int
+    max_team_players: int
+    auto_backfill: bool
+    distance_rule: Optional[MatchingRule]
+    stat_codes: Tuple[str, ...]
+    region_selector: RegionLatencySelector
+
+    def __init__(self, key: str, rules: GameRules) -> None:
+        alliance = rules.alliance or AllianceRule()
+
+        min_players = alliance.min_number * alliance.player_min_number
+        max_players = alliance.max_number * alliance.player_max_number
+
+        if min_players == 0 and max_players == 0:
+            min_players = 2
+            max_players = 2
+
+        if rules.shipCountMin != 0:
+            min_players *= rules.shipCountMin
+
+        if rules.shipCountMax != 0:
+            max_players *= rules.shipCountMax
+
+        if min_players > max_players:
+            raise ValidationError(
+                f"minimum players ({min_players}) is greater than maximum players ({max_players})"
+            )
+
+        init = super().__setattr__
+        init("key", key)
+        init("rules", rules)
+        init("min_players", min_players)
+        init("max_players", max_players)
+        init("min_teams", alliance.min_number)
+        init("max_teams", alliance.max_number)
+        init("min_team_players", alliance.player_min_number)
+        init("max_team_players", alliance.player_max_number)
+        init("auto_backfill", rules.auto_backfill)
+        init("distance_rule", rules.get_distance_rule())
+        init("stat_codes", tuple(dict.fromkeys(r.attribute for r in rules.matching_rule if r.attribute)))
+        init("region_selector", RegionLatencySelector(max_latency_ms=rules.region_latency_max_ms))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return "{}(key={}, min_players={}, max_players={})".format(
+            self.__class__.__name__, self.key, self.min_players, self.max_players
+        )
+
+
+def compile_rules(rules_json: str, key: Optional[str] = None) -> RulesPlan:
+    if key is None:
+        key = hash_rules(rules_json)
+    try:
+        rules_obj = json.loads(rules_json or "{}")
+    except ValueError as error:
+        raise ValidationError(f"invalid rules JSON: {error}") from error
+    if not isinstance(rules_obj, dict):
+        raise ValidationError("rules JSON must be an object")
+    try:
+        rules = GameRules(**rules_obj)
+    except (TypeError, ValueError, AttributeError) as error:
+        raise ValidationError(f"invalid rules: {error}") from error
+    rules.validate()
+    return RulesPlan(key=key, rules=rules)
+
+
+def hash_rules(rules_json: str) -> str:
+    return hashlib.blake2b(rules_json.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RulesCache:
+    """Bounded LRU of compiled rules plans keyed by the hash of the rules JSON."""
+
+    DEFAULT_MAX_SIZE: int = 64
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self.max_size = max_size if max_size is not None else self.DEFAULT_MAX_SIZE
+        self.hits: int = 0
+        self.misses: int = 0
+        self._plans: "OrderedDict[str, RulesPlan]" = OrderedDict()
+
+    def get(self, rules_json: str) -> RulesPlan:
+        key = hash_rules(rules_json)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+        self.misses += 1
+        plan = compile_rules(rules_json, key=key)
+        self._plans[key] = plan
+        if len(self._plans) > self.max_size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+__all__ = [
+    "RulesCache",
+    "RulesPlan",
+    "compile_rules",
+    "hash_rules",
+]
@@ -6,17 +6,18 @@
 # pylint: disable=no-member
 # pylint: disable=no-name-in-module
 
-import json
+import logging
+import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from logging import Logger
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional
 from uuid import uuid4
 
 from grpc import ServicerContext, StatusCode
-from google.protobuf.json_format import MessageToJson
-from google.protobuf.timestamp_pb2 import Timestamp
 
-from accelbyte_py_sdk import AccelByteSDK
+import opentelemetry.trace
+from opentelemetry.trace import INVALID_SPAN, Span, Tracer
 
 from matchFunction_pb2 import (
     BackfillTicket,
@@ -32,7 +33,18 @@ from matchFunction_pb2 import (
 )
 from matchFunction_pb2_grpc import MatchFunctionServicer
 
-from ..ctypes import GameRules, ValidationError
+from ..budget import TimeBudget
+from ..capture import StreamCapture
+from ..ctypes import ValidationError
+from ..metrics import MatchFunctionMetrics
+from ..pool import SkillTicketPool, TicketPool
+from ..rules import RulesCache, RulesPlan
+from ..utils import LazyMessageJson, PayloadLogSampler
+
+if TYPE_CHECKING:
+    from accelbyte_py_sdk import AccelByteSDK
+
+UNTRACED_SPAN: ContextManager[Span] = nullcontext(INVALID_SPAN)
 
 
 class AsyncMatchFunctionService(MatchFunctionServicer):
@@ -40,24 +52,41 @@ class AsyncMatchFunctionService(MatchFunctionServicer):
 
     def __init__(
         self,
-        sdk: Optional[AccelByteSDK] = None,
+        sdk: Optional["AccelByteSDK"] = None,
         logger: Optional[Logger] = None,
+        rules_cache: Optional[RulesCache] = None,
+        payload_log_level: int = logging.INFO,
+        payload_log_every_n: int = 1,
+        payload_log_first_k: int = 0,
+        payload_log_max_size: int = 0,
+        metrics: Optional[MatchFunctionMetrics] = None,
+        deadline_reserve: float = 0.0,
+        capture: Optional[StreamCapture] = None,
+        tracer: Optional[Tracer] = None,
     ):
         self.sdk = sdk
         self.logger = logger
+        self.rules_cache = rules_cache if rules_cache is not None else RulesCache()
+        self.payload_log_level = payload_log_level
+        self.payload_log_every_n = payload_log_every_n
+        self.payload_log_first_k = payload_log_first_k
+        self.payload_log_max_size = payload_log_max_size
+        self.payload_log_sampler = self.create_payload_log_sampler()
+        self.metrics = metrics if metrics is not None else MatchFunctionMetrics()
+        self.deadline_reserve = deadline_reserve
+        self.capture = capture
+        self.tracer = tracer if tracer is not None else opentelemetry.trace.get_tracer(__name__)
 
     async def GetStatCodes(self, request: GetStatCodesRequest, context: ServicerContext):
         self.log_payload(f'{self.GetStatCodes.__name__} request: %s', request)
 
         try:
-            rules_json = request.rules.json or "{}"
-            rules_obj = json.loads(rules_json)
-            rules = GameRules(**rules_obj)
+            rules = self.rules_cache.get(request.rules.json)
         except ValidationError as error:
             self.logger.error(error)
             await context.abort(StatusCode.INVALID_ARGUMENT, details=str(error))
 
-        response = StatCodesResponse(codes=[])
+        response = StatCodesResponse(codes=rules.stat_codes)
 
         self.log_payload(f'{self.GetStatCodes.__name__} response: %s', response)
         return response
@@ -66,7 +95,7 @@ class AsyncMatchFunctionService(MatchFunctionServicer):
         self.log_payload(f'{self.ValidateTicket.__name__} request: %s', request)
         assert isinstance(request, ValidateTicketRequest)
         response = ValidateTicketResponse(valid_ticket=True)
-        self.log_payload(f'{self.ValidateTicket.__name__} response: %s', request)
+        self.log_payload(f'{self.ValidateTicket.__name__} response: %s', response)
         return response
 
     async def EnrichTicket(self, request, context: ServicerContext):
@@ -79,16 +108,26 @@ class AsyncMatchFunctionService(MatchFunctionServicer):
             self.logger.info(
                 "EnrichedTicket Attributes: {}".format(response.ticket.ticket_attributes)
             )
-        self.log_payload(f'{self.EnrichTicket.__name__} response: %s', request)
+        self.log_payload(f'{self.EnrichTicket.__name__} response: %s', response)
         return response
 
     async def MakeMatches(self, request_iterator, context: ServicerContext):
         first_message: bool = True
         matches_made: int = 0
-        rules: Optional[GameRules] = None
-        unmatched_tickets: Optional[List[Ticket]] = None
+        rules: Optional[RulesPlan] = None
+        pool: Optional[TicketPool[Ticket]] = None
+        sampler = self.create_payload_log_sampler()
+        tick_id: int = 0
+        match_pool: str = ""
+        build_cpu_time: float = 0.0
+        tickets_received: int = 0
+        budget = TimeBudget.from_context(context, reserve=self.deadline_reserve)
+        rpc_span = opentelemetry.trace.get_current_span()
+        traced = rpc_span.is_recording()
+        if self.capture is not None:
+            request_iterator = self.capture.record("MakeMatches", request_iterator)
         async for request in request_iterator:
-            self.log_payload(f'{self.MakeMatches.__name__} request: %s', request)
+            self.log_payload(f'{self.MakeMatches.__name__} request: %s', request, sampler)
             assert isinstance(request, MakeMatchesRequest)
             if first_message:
                 first_message = False
@@ -96,115 +135,170 @@ class AsyncMatchFunctionService(MatchFunctionServicer):
                     error = "First message must have the expected 'parameters' set."
                     self.logger.error(error)
                     await context.abort(StatusCode.INVALID_ARGUMENT, details=error)
+                parameters = request.parameters
+                tick_id = parameters.tickId
+                rpc_span.set_attributes(self.get_span_attributes(parameters))
                 try:
-                    parameters = request.parameters
-                    rules_json = parameters.rules.json or "{}"
-                    rules_obj = json.loads(rules_json)
-                    rules = GameRules(**rules_obj)
-                    unmatched_tickets = []
+                    with self.start_span("MakeMatches.parse_rules", traced):
+                        rules = self.rules_cache.get(parameters.rules.json)
+                        pool = self.create_pool(rules=rules)
                 except ValidationError as error:
                     self.logger.error(error)
                     await context.abort(StatusCode.INVALID_ARGUMENT, details=str(error))
             else:
                 assert rules is not None
-                assert unmatched_tickets is not None
+                assert pool is not None
                 if not request.HasField("ticket"):
                     error = "Message must have the expected 'ticket' set."
                     self.logger.error(error)
                     await context.abort(StatusCode.INVALID_ARGUMENT, details=error)
 
                 ticket = request.ticket
-                matches, unmatched_tickets = self.build_match(
-                    rules=rules,
-                    ticket=ticket,
-                    unmatched_tickets=unmatched_tickets,
+                match_pool = match_pool or ticket.match_pool
+                tickets_received += 1
+                build_start = time.thread_time()
+                degraded = budget.degraded
+                matches = self.build_match(
+                    rules=rules, ticket=ticket, pool=pool, budget=budget, traced=traced
                 )
+                build_cpu_time += time.thread_time() - build_start
+                if budget.degraded and not degraded:
+                    self.record_degraded_tick(rpc="MakeMatches", tick_id=tick_id, match_pool=match_pool)
                 if matches:
                     for match in matches:
-                        response = MatchResponse()
-                        response.match = match
-                        self.logger.info("Match made and sent to client!")
-                        self.log_payload(f'{self.MakeMatches.__name__} response: %s', response)
-                        yield response
+                        span = (
+                            self.tracer.start_span(
+                                "MakeMatches.emit_response",
+                                attributes={"matchmaking.ticket_count": len(match.tickets)},
+                            )
+                            if traced
+                            else INVALID_SPAN
+                        )
+                        try:
+                            response = MatchResponse(match=match)
+                            self.logger.info("Match made and sent to client!")
+                            self.log_payload(f'{self.MakeMatches.__name__} response: %s', response, sampler)
+                            yield response
+                        finally:
+                            span.end()
                         matches_made += 1
                 else:
-                    self.logger.info("Not enough tickets to create a match: {}".format(len(unmatched_tickets)))
+                    self.logger.info("Not enough tickets to create a match: {}".format(len(pool)))
         self.logger.info("Received MakeMatches (end): {} match(es) made".format(matches_made))
+        rpc_span.set_attributes(
+            {
+                "matchmaking.match_pool": match_pool,
+                "matchmaking.ticket_count": tickets_received,
+                "matchmaking.result_count": matches_made,
+                "matchmaking.degraded": budget.degraded,
+            }
+        )
+        if pool is not None:
+            self.logger.info(
+                "MakeMatches pool (end): tick {}, match pool '{}': {} unmatched ticket(s), peak {}".format(
+                    tick_id, match_pool, pool.size, pool.peak_size
+                )
+            )
+            attributes = {"match_pool": match_pool}
+            self.metrics.pool_size.record(pool.size, {**attributes, "pool": "ticket"})
+            self.metrics.build_cpu_time.record(
+                build_cpu_time, {**attributes, "function": "build_match"}
+            )
+            self.metrics.results_per_tick.record(
+                matches_made, {**attributes, "rpc": "MakeMatches"}
+            )
+
+    @classmethod
+    def create_pool(cls, rules: RulesPlan) -> TicketPool[Ticket]:
+        distance_rule = rules.distance_rule
+        if distance_rule is None:
+            return TicketPool(min_size=rules.min_players, max_size=rules.max_players)
+        attribute = distance_rule.attribute
+        return SkillTicketPool(
+            key=lambda ticket: cls.get_ticket_skill(ticket=ticket, attribute=attribute),
+            max_distance=distance_rule.reference,
+            min_size=rules.min_players,
+            max_size=rules.max_players,
+        )
+
+    @staticmethod
+    def get_ticket_skill(ticket: Ticket, attribute: str) -> float:
+        total = 0.0
+        count = 0
+        for player in ticket.players:
+            value = player.attributes.fields.get(attribute)
+            if value is not None:
+                total += value.number_value
+                count += 1
+        return total / count if count else 0.0
 
     def build_match(
-        self, rules: GameRules, ticket: Ticket, unmatched_tickets: List[Ticket],
-    ) -> Tuple[List[Match], List[Ticket]]:
+        self, rules: RulesPlan, ticket: Ticket, pool: TicketPool[Ticket],
+        budget: Optional[TimeBudget] = None, traced: bool = False,
+    ) -> List[Match]:
         matches: List[Match] = []
 
-        unmatched_tickets.append(ticket)
-
-        min_players = rules.alliance.min_number * rules.alliance.player_min_number
-        max_players = rules.alliance.max_number * rules.alliance.player_max_number
-
-        if min_players == 0 and max_players == 0:
-            min_players = 2
-            max_players = 2
+        with self.start_span("MakeMatches.pool_insert", traced) as span:
+            pool.add(ticket)
+            if traced:
+                span.set_attribute("matchmaking.pool_size", len(pool))
 
-        if rules.shipCountMin != 0:
-            min_players *= rules.shipCountMin
-
-        if rules.shipCountMax != 0:
-            min_players *= rules.shipCountMax
-
-        while True:
-            if len(unmatched_tickets) < min_players:
-                break
-
-            num_players = min_players
-            if len(unmatched_tickets) >= max_players:
-                num_players = max_players
-
-            self.logger.info("Received enough tickets to create a match!")
+        with self.start_span("MakeMatches.build_match", traced) as span:
+            if budget is not None and budget.is_exhausted():
+                groups = pool.drain_greedy()
+            else:
+                groups = pool.drain_matches()
+            if traced:
+                span.set_attribute("matchmaking.match_count", len(groups))
+            if not groups:
+                return matches
 
-            backfill = False
-            if rules.auto_backfill and num_players < max_players:
-                backfill = True
+            region_preferences = rules.region_selector.select(groups)
 
-            players = []
-            player_ids = []
-            matched_tickets = []
-            for i in range(num_players):
-                player: Ticket.PlayerData = Ticket.PlayerData()
-                matched_ticket = unmatched_tickets[i]
-                for player in matched_ticket.players:
-                    assert isinstance(player, Ticket.PlayerData)
-                    players.append(player)
-                    player_ids.append(player.player_id)
-                matched_tickets.append(matched_ticket)
+            now = time.time()
+            for matched_tickets, regions in zip(groups, region_preferences):
+                self.metrics.record_ticket_ages(matched_tickets, now=now)
+                self.logger.info("Received enough tickets to create a match!")
 
-            team_id = str(uuid4())
-            team = Match.Team()
-            team.team_id = team_id
-            team.user_ids.extend(player_ids)
+                backfill = False
+                if rules.auto_backfill and len(matched_tickets) < pool.max_size:
+                    backfill = True
 
-            match = Match()
-            match.tickets.extend(matched_tickets)
-            match.teams.append(team)
-            match.match_attributes.fields["small-team-1"].string_value = team_id
-            match.backfill = backfill
-            # RegionPreference value is just an example.
-            # The value(s) should be from the best region on the matchmaker.Ticket.Latencies
-            match.region_preferences.extend(["us-east-2", "us-west-2"])
+                team_id = str(uuid4())
+                team = Match.Team()
+                team.team_id = team_id
+                for matched_ticket in matched_tickets:
+                    team.user_ids.extend(player.player_id for player in matched_ticket.players)
 
-            unmatched_tickets = unmatched_tickets[num_players:]
+                match = Match()
+                match.tickets.extend(matched_tickets)
+                match.teams.append(team)
+                match.match_attributes.fields["small-team-1"].string_value = team_id
+                match.backfill = backfill
+                match.region_preferences.extend(regions)
 
-            matches.append(match)
+                matches.append(match)
 
-        return matches, unmatched_tickets
+        return matches
 
     async def BackfillMatches(self, request_iterator, context: ServicerContext):
         first_message: bool = True
         proposals_made: int = 0
-        rules: Optional[GameRules] = None
-        unmatched_tickets: Optional[List[Ticket]] = None
-        unmatched_backfill_tickets: Optional[List[BackfillTicket]] = None
+        rules: Optional[RulesPlan] = None
+        pool: Optional[TicketPool[Ticket]] = None
+        backfill_pool: Optional[TicketPool[BackfillTicket]] = None
+        sampler = self.create_payload_log_sampler()
+        tick_id: int = 0
+        match_pool: str = ""
+        build_cpu_time: float = 0.0
+        tickets_received: int = 0
+        budget = TimeBudget.from_context(context, reserve=self.deadline_reserve)
+        rpc_span = opentelemetry.trace.get_current_span()
+        traced = rpc_span.is_recording()
+        if self.capture is not None:
+            request_iterator = self.capture.record("BackfillMatches", request_iterator)
         async for request in request_iterator:
-            self.log_payload(f'{self.BackfillMatches.__name__} request: %s', request)
+            self.log_payload(f'{self.BackfillMatches.__name__} request: %s', request, sampler)
             assert isinstance(request, BackfillMakeMatchesRequest)
             if first_message:
                 first_message = False
@@ -212,124 +306,195 @@ class AsyncMatchFunctionService(MatchFunctionServicer):
                     error = "First message must have the expected 'parameters' set."
                     self.logger.error(error)
                     await context.abort(StatusCode.INVALID_ARGUMENT, details=error)
+                parameters = request.parameters
+                tick_id = parameters.tickId
+                rpc_span.set_attributes(self.get_span_attributes(parameters))
                 try:
-                    parameters = request.parameters
-                    rules_json = parameters.rules.json or "{}"
-                    rules_obj = json.loads(rules_json)
-                    rules = GameRules(**rules_obj)
-                    unmatched_tickets = []
-                    unmatched_backfill_tickets = []
+                    with self.start_span("BackfillMatches.parse_rules", traced):
+                        rules = self.rules_cache.get(parameters.rules.json)
+                        pool = TicketPool()
+                        backfill_pool = TicketPool()
                 except ValidationError as error:
                     self.logger.error(error)
                     await context.abort(StatusCode.INVALID_ARGUMENT, details=str(error))
             else:
                 assert rules is not None
-                assert unmatched_tickets is not None
-                assert unmatched_backfill_tickets is not None
-                if request.HasField("ticket"):
-                    ticket = request.ticket
-                    proposals, unmatched_tickets, unmatched_backfill_tickets = self.build_backfill_match(
-                        rules=rules,
-                        ticket=ticket,
-                        unmatched_tickets=unmatched_tickets,
-                        backfill_ticket=None,
-                        unmatched_backfill_tickets=unmatched_backfill_tickets,
-                    )
-                    if proposals:
-                        for proposal in proposals:
-                            response = BackfillResponse()
-                            response.backfill_proposal = proposal
-                            self.logger.info("Backfill proposal made and sent to client!")
-                            self.log_payload(f'{self.BackfillMatches.__name__} response: %s', response)
-                            yield response
-                            proposals_made += 1
-                    else:
-                        self.logger.info(
-                            "Not enough tickets to create a backfill proposal: {}, {}".format(
-                                len(unmatched_tickets),
-                                len(unmatched_backfill_tickets),
-                            )
+                assert pool is not None
+                assert backfill_pool is not None
+                if request.HasField("ticket") or request.HasField("backfill_ticket"):
+                    if not match_pool:
+                        match_pool = (
+                            request.ticket.match_pool
+                            if request.HasField("ticket")
+                            else request.backfill_ticket.match_pool
                         )
-                elif request.HasField("backfill_ticket"):
-                    backfill_ticket = request.backfill_ticket
-                    proposals, unmatched_tickets, unmatched_backfill_tickets = self.build_backfill_match(
+                    tickets_received += 1
+                    build_start = time.thread_time()
+                    degraded = budget.degraded
+                    proposals = self.build_backfill_match(
                         rules=rules,
-                        ticket=None,
-                        unmatched_tickets=unmatched_tickets,
-                        backfill_ticket=backfill_ticket,
-                        unmatched_backfill_tickets=unmatched_backfill_tickets,
+                        ticket=request.ticket if request.HasField("ticket") else None,
+                        pool=pool,
+                        backfill_ticket=(
+                            request.backfill_ticket if request.HasField("backfill_ticket") else None
+                        ),
+                        backfill_pool=backfill_pool,
+                        budget=budget,
+                        traced=traced,
                     )
+                    build_cpu_time += time.thread_time() - build_start
+                    if budget.degraded and not degraded:
+                        self.record_degraded_tick(
+                            rpc="BackfillMatches", tick_id=tick_id, match_pool=match_pool
+                        )
                     if proposals:
                         for proposal in proposals:
-                            response = BackfillResponse()
-                            response.backfill_proposal = proposal
-                            self.logger.info("Backfill proposal made and sent to client!")
-                            self.log_payload(f'{self.BackfillMatches.__name__} response: %s', response)
-                            yield response
+                            span = (
+                                self.tracer.start_span(
+                                    "BackfillMatches.emit_response",
+                                    attributes={"matchmaking.ticket_count": len(proposal.added_tickets)},
+                                )
+                                if traced
+                                else INVALID_SPAN
+                            )
+                            try:
+                                response = BackfillResponse(backfill_proposal=proposal)
+                                self.logger.info("Backfill proposal made and sent to client!")
+                                self.log_payload(f'{self.BackfillMatches.__name__} response: %s', response, sampler)
+                                yield response
+                            finally:
+                                span.end()
                             proposals_made += 1
                     else:
                         self.logger.info(
                             "Not enough tickets to create a backfill proposal: {}, {}".format(
-                                len(unmatched_tickets),
-                                len(unmatched_backfill_tickets),
+                                len(pool),
+                                len(backfill_pool),
                             )
                         )
 
         self.logger.info("received BackfillMatches (end): {} proposal(s) made".format(proposals_made))
+        rpc_span.set_attributes(
+            {
+                "matchmaking.match_pool": match_pool,
+                "matchmaking.ticket_count": tickets_received,
+                "matchmaking.result_count": proposals_made,
+                "matchmaking.degraded": budget.degraded,
+            }
+        )
+        if pool is not None and backfill_pool is not None:
+            self.logger.info(
+                "BackfillMatches pool (end): tick {}, match pool '{}': {} unmatched ticket(s), peak {}; "
+                "{} unmatched backfill ticket(s), peak {}".format(
+                    tick_id, match_pool,
+                    pool.size, pool.peak_size, backfill_pool.size, backfill_pool.peak_size
+                )
+            )
+            attributes = {"match_pool": match_pool}
+            self.metrics.pool_size.record(pool.size, {**attributes, "pool": "ticket"})
+            self.metrics.pool_size.record(
+                backfill_pool.size, {**attributes, "pool": "backfill_ticket"}
+            )
+            self.metrics.build_cpu_time.record(
+                build_cpu_time, {**attributes, "function": "build_backfill_match"}
+            )
+            self.metrics.results_per_tick.record(
+                proposals_made, {**attributes, "rpc": "BackfillMatches"}
+            )
 
     def build_backfill_match(
-        self, rules: GameRules,
-        ticket: Optional[Ticket], unmatched_tickets: List[Ticket],
-        backfill_ticket: Optional[BackfillTicket], unmatched_backfill_tickets: List[BackfillTicket],
-    ) -> Tuple[List[BackfillProposal], List[Ticket], List[BackfillTicket]]:
+        self, rules: RulesPlan,
+        ticket: Optional[Ticket], pool: TicketPool[Ticket],
+        backfill_ticket: Optional[BackfillTicket], backfill_pool: TicketPool[BackfillTicket],
+        budget: Optional[TimeBudget] = None, traced: bool = False,
+    ) -> List[BackfillProposal]:
         proposals: List[BackfillProposal] = []
 
-        if ticket:
-            unmatched_tickets.append(ticket)
-
-        if backfill_ticket:
-            unmatched_backfill_tickets.append(backfill_ticket)
-
-        if len(unmatched_tickets) > 0 and len(unmatched_backfill_tickets) > 0:
-            self.logger.info("Received enough tickets to backfill!")
-
-            len_unmatched_backfill_tickets = len(unmatched_backfill_tickets)
-            for i in range(len_unmatched_backfill_tickets):
-                b = unmatched_backfill_tickets[i]
-                t = unmatched_tickets[0]
-                unmatched_tickets = unmatched_tickets[1:]
+        # Pairing pops tickets first-come, so it is already the greedy
+        # fallback; the budget is only reported to count degraded ticks.
+        if budget is not None:
+            budget.report()
 
-                team_id = str(uuid4())
-                team = BackfillProposal.Team()
-                team.team_id = team_id
+        with self.start_span("BackfillMatches.pool_insert", traced) as span:
+            if ticket:
+                pool.add(ticket)
 
-                created_at = Timestamp()
-                created_at.FromDateTime(datetime.now(timezone.utc))
+            if backfill_ticket:
+                backfill_pool.add(backfill_ticket)
 
-                proposal = BackfillProposal()
-                proposal.backfill_ticket_id = b.ticket_id
-                proposal.CreatedAt = created_at
-                proposal.added_tickets.append(t)
-                proposal.proposed_teams.extend(b.partial_match.teams)
-                proposal.proposed_teams.append(team)
-                proposal.proposal_id = ""
-                proposal.match_pool = b.match_pool
-                proposal.match_session_id = b.match_session_id
+            if traced:
+                span.set_attribute("matchmaking.pool_size", len(pool))
+                span.set_attribute("matchmaking.backfill_pool_size", len(backfill_pool))
 
-                proposals.append(proposal)
+        if len(pool) > 0 and len(backfill_pool) > 0:
+            self.logger.info("Received enough tickets to backfill!")
 
-                if len(unmatched_tickets) == 0:
-                    if i+1 < len(unmatched_backfill_tickets):
-                        unmatched_backfill_tickets = unmatched_backfill_tickets[i+1:]
-                    else:
-                        unmatched_backfill_tickets = []
-                    break
+            with self.start_span("BackfillMatches.build_backfill_match", traced) as span:
+                while len(pool) > 0 and len(backfill_pool) > 0:
+                    b = backfill_pool.pop()
+                    t = pool.pop()
+
+                    team_id = str(uuid4())
+                    team = BackfillProposal.Team()
+                    team.team_id = team_id
+
+                    proposal = BackfillProposal()
+                    proposal.backfill_ticket_id = b.ticket_id
+                    proposal.CreatedAt.FromDatetime(datetime.now(timezone.utc))
+                    proposal.added_tickets.append(t)
+                    self.metrics.record_ticket_ages((t,))
+                    proposal.proposed_teams.extend(b.partial_match.teams)
+                    proposal.proposed_teams.append(team)
+                    proposal.proposal_id = ""
+                    proposal.match_pool = b.match_pool
+                    proposal.match_session_id = b.match_session_id
+
+                    proposals.append(proposal)
+
+                if traced:
+                    span.set_attribute("matchmaking.proposal_count", len(proposals))
+
+        return proposals
+
+    def start_span(self, name: str, traced: bool) -> ContextManager[Span]:
+        # Stage spans are only started under a recorded RPC span; even no-op
+        # spans cost a few microseconds per ticket.
+        if not traced:
+            return UNTRACED_SPAN
+        return self.tracer.start_as_current_span(name)
+
+    @staticmethod
+    def get_span_attributes(parameters) -> Dict[str, Any]:
+        # ab_trace_id is AccelByte's own trace id for the tick; recording it
+        # lets a sampled gRPC trace be found from the matchmaking logs.
+        return {
+            "matchmaking.tick_id": parameters.tickId,
+            "accelbyte.trace_id": parameters.scope.ab_trace_id,
+        }
+
+    def record_degraded_tick(self, rpc: str, tick_id: int, match_pool: str) -> None:
+        self.logger.warning(
+            "{} tick {} reached the deadline reserve ({}s), switching to greedy matching".format(
+                rpc, tick_id, self.deadline_reserve
+            )
+        )
+        self.metrics.degraded_ticks.add(1, {"match_pool": match_pool, "rpc": rpc})
 
-        return proposals, unmatched_tickets, unmatched_backfill_tickets
+    def create_payload_log_sampler(self) -> PayloadLogSampler:
+        return PayloadLogSampler(
+            every_n=self.payload_log_every_n, first_k=self.payload_log_first_k
+        )
 
     # noinspection PyShadowingBuiltins
-    def log_payload(self, format : str, payload):
-        if not self.logger:
+    def log_payload(self, format : str, payload, sampler: Optional[PayloadLogSampler] = None):
+        if not self.logger or not self.logger.isEnabledFor(self.payload_log_level):
+            return
+        if sampler is None:
+            sampler = self.payload_log_sampler
+        if not sampler.sample():
             return
-        payload_json = MessageToJson(payload, preserving_proto_field_name=True)
-        self.logger.info(format.format(payload_json))
+        self.logger.log(
+            self.payload_log_level,
+            format,
+            LazyMessageJson(payload, max_size=self.payload_log_max_size),
+        )
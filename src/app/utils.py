@@ -2,9 +2,12 @@
 # This is licensed software from AccelByte Inc, for limitations
 # and restrictions contact your company contract manager.
 
-from typing import Iterable
+import time
+from typing import Iterable, List, Optional, Tuple
 
 from environs import Env
+from google.protobuf.json_format import MessageToJson
+from google.protobuf.message import Message
 
 from accelbyte_grpc_plugin.utils import create_env as _create_env
 
@@ -14,6 +17,67 @@ async def aiterize(iterable: Iterable):
         yield item
 
 
+class LazyMessageJson:
+    """Defers MessageToJson until a log handler actually formats the record.
+
+    The result is kept, so a record formatted by several handlers is serialized once.
+    """
+
+    __slots__ = ("message", "max_size", "_text")
+
+    def __init__(self, message: Message, max_size: int = 0) -> None:
+        self.message = message
+        self.max_size = max_size
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            payload_json = MessageToJson(self.message, preserving_proto_field_name=True)
+            if 0 < self.max_size < len(payload_json):
+                payload_json = "{}... ({} more chars)".format(
+                    payload_json[: self.max_size], len(payload_json) - self.max_size
+                )
+            self._text = payload_json
+        return self._text
+
+
+class PayloadLogSampler:
+    """Selects the first `first_k` messages, then every `every_n`-th one (0 disables)."""
+
+    __slots__ = ("every_n", "first_k", "count")
+
+    def __init__(self, every_n: int = 1, first_k: int = 0) -> None:
+        self.every_n = every_n
+        self.first_k = first_k
+        self.count = 0
+
+    def sample(self) -> bool:
+        self.count += 1
+        if self.count <= self.first_k:
+            return True
+        return self.every_n > 0 and self.count % self.every_n == 0
+
+
+class StartupPhases:
+    """Records how long each startup phase took, measured from `start`."""
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.last = start
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def __str__(self) -> str:
+        return "{} (total {:.3f} s)".format(
+            ", ".join("{} {:.3f} s".format(name, seconds) for name, seconds in self.phases),
+            self.last - self.start,
+        )
+
+
 def create_env(**kwargs) -> Env:
     env = _create_env(**kwargs)
 
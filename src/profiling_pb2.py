@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: profiling.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'profiling.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import permission_pb2 as permission__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fprofiling.proto\x12\x1e\x61\x63\x63\x65lbyte.grpcplugin.profiling\x1a\x10permission.proto\"\xce\x02\n\x0eProfileRequest\x12I\n\x08profiler\x18\x01 \x01(\x0e\x32\x37.accelbyte.grpcplugin.profiling.ProfileRequest.Profiler\x12\x45\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\x35.accelbyte.grpcplugin.profiling.ProfileRequest.Format\x12\x18\n\x10\x64uration_seconds\x18\x03 \x01(\x01\x12\x1c\n\x14sampling_interval_ms\x18\x04 \x01(\x01\x12\r\n\x05limit\x18\x05 \x01(\x05\x12\x0c\n\x04sort\x18\x06 \x01(\t\"&\n\x08Profiler\x12\x0c\n\x08\x43PROFILE\x10\x00\x12\x0c\n\x08SAMPLING\x10\x01\"-\n\x06\x46ormat\x12\x08\n\x04TEXT\x10\x00\x12\n\n\x06PSTATS\x10\x01\x12\r\n\tCOLLAPSED\x10\x02\"\x91\x01\n\x0fProfileResponse\x12\x45\n\x06\x66ormat\x18\x01 \x01(\x0e\x32\x35.accelbyte.grpcplugin.profiling.ProfileRequest.Format\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x12\x18\n\x10\x64uration_seconds\x18\x03 \x01(\x01\x12\x0f\n\x07samples\x18\x04 \x01(\x03\"b\n\x15MemorySnapshotRequest\x12\x18\n\x10\x64uration_seconds\x18\x01 \x01(\x01\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x10\n\x08key_type\x18\x03 \x01(\t\x12\x0e\n\x06\x66rames\x18\x04 \x01(\x05\"b\n\nMemoryStat\x12\x10\n\x08location\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x12\x11\n\tsize_diff\x18\x03 \x01(\x03\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\x12\x12\n\ncount_diff\x18\x05 \x01(\x03\"\x9a\x01\n\x16MemorySnapshotResponse\x12\x39\n\x05stats\x18\x01 \x03(\x0b\x32*.accelbyte.grpcplugin.profiling.MemoryStat\x12\x12\n\ntotal_size\x18\x02 \x01(\x03\x12\x17\n\x0ftotal_size_diff\x18\x03 \x01(\x03\x12\x18\n\x10\x64uration_seconds\x18\x04 \x01(\x01\x32\xe6\x02\n\tProfiling\x12\xa0\x01\n\x07Profile\x12..accelbyte.grpcplugin.profiling.ProfileRequest\x1a/.accelbyte.grpcplugin.profiling.ProfileResponse\"4\x82\xb5\x18,ADMIN:NAMESPACE:{namespace}:EXTEND:PROFILING\x88\xb5\x18\x04\x12\xb5\x01\n\x0eMemorySnapshot\x12\x35.accelbyte.grpcplugin.profiling.MemorySnapshotRequest\x1a\x36.accelbyte.grpcplugin.profiling.MemorySnapshotResponse\"4\x82\xb5\x18,ADMIN:NAMESPACE:{namespace}:EXTEND:PROFILING\x88\xb5\x18\x04\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'profiling_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_PROFILING'].methods_by_name['Profile']._loaded_options = None
+  _globals['_PROFILING'].methods_by_name['Profile']._serialized_options = b'\202\265\030,ADMIN:NAMESPACE:{namespace}:EXTEND:PROFILING\210\265\030\004'
+  _globals['_PROFILING'].methods_by_name['MemorySnapshot']._loaded_options = None
+  _globals['_PROFILING'].methods_by_name['MemorySnapshot']._serialized_options = b'\202\265\030,ADMIN:NAMESPACE:{namespace}:EXTEND:PROFILING\210\265\030\004'
+  _globals['_PROFILEREQUEST']._serialized_start=70
+  _globals['_PROFILEREQUEST']._serialized_end=404
+  _globals['_PROFILEREQUEST_PROFILER']._serialized_start=319
+  _globals['_PROFILEREQUEST_PROFILER']._serialized_end=357
+  _globals['_PROFILEREQUEST_FORMAT']._serialized_start=359
+  _globals['_PROFILEREQUEST_FORMAT']._serialized_end=404
+  _globals['_PROFILERESPONSE']._serialized_start=407
+  _globals['_PROFILERESPONSE']._serialized_end=552
+  _globals['_MEMORYSNAPSHOTREQUEST']._serialized_start=554
+  _globals['_MEMORYSNAPSHOTREQUEST']._serialized_end=652
+  _globals['_MEMORYSTAT']._serialized_start=654
+  _globals['_MEMORYSTAT']._serialized_end=752
+  _globals['_MEMORYSNAPSHOTRESPONSE']._serialized_start=755
+  _globals['_MEMORYSNAPSHOTRESPONSE']._serialized_end=909
+  _globals['_PROFILING']._serialized_start=912
+  _globals['_PROFILING']._serialized_end=1270
+# @@protoc_insertion_point(module_scope)
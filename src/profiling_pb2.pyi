@@ -0,0 +1,89 @@
+import permission_pb2 as _permission_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ProfileRequest(_message.Message):
+    __slots__ = ("profiler", "format", "duration_seconds", "sampling_interval_ms", "limit", "sort")
+    class Profiler(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        CPROFILE: _ClassVar[ProfileRequest.Profiler]
+        SAMPLING: _ClassVar[ProfileRequest.Profiler]
+    CPROFILE: ProfileRequest.Profiler
+    SAMPLING: ProfileRequest.Profiler
+    class Format(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        TEXT: _ClassVar[ProfileRequest.Format]
+        PSTATS: _ClassVar[ProfileRequest.Format]
+        COLLAPSED: _ClassVar[ProfileRequest.Format]
+    TEXT: ProfileRequest.Format
+    PSTATS: ProfileRequest.Format
+    COLLAPSED: ProfileRequest.Format
+    PROFILER_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    SAMPLING_INTERVAL_MS_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    SORT_FIELD_NUMBER: _ClassVar[int]
+    profiler: ProfileRequest.Profiler
+    format: ProfileRequest.Format
+    duration_seconds: float
+    sampling_interval_ms: float
+    limit: int
+    sort: str
+    def __init__(self, profiler: _Optional[_Union[ProfileRequest.Profiler, str]] = ..., format: _Optional[_Union[ProfileRequest.Format, str]] = ..., duration_seconds: _Optional[float] = ..., sampling_interval_ms: _Optional[float] = ..., limit: _Optional[int] = ..., sort: _Optional[str] = ...) -> None: ...
+
+class ProfileResponse(_message.Message):
+    __slots__ = ("format", "data", "duration_seconds", "samples")
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    format: ProfileRequest.Format
+    data: bytes
+    duration_seconds: float
+    samples: int
+    def __init__(self, format: _Optional[_Union[ProfileRequest.Format, str]] = ..., data: _Optional[bytes] = ..., duration_seconds: _Optional[float] = ..., samples: _Optional[int] = ...) -> None: ...
+
+class MemorySnapshotRequest(_message.Message):
+    __slots__ = ("duration_seconds", "limit", "key_type", "frames")
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    KEY_TYPE_FIELD_NUMBER: _ClassVar[int]
+    FRAMES_FIELD_NUMBER: _ClassVar[int]
+    duration_seconds: float
+    limit: int
+    key_type: str
+    frames: int
+    def __init__(self, duration_seconds: _Optional[float] = ..., limit: _Optional[int] = ..., key_type: _Optional[str] = ..., frames: _Optional[int] = ...) -> None: ...
+
+class MemoryStat(_message.Message):
+    __slots__ = ("location", "size", "size_diff", "count", "count_diff")
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    SIZE_DIFF_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    COUNT_DIFF_FIELD_NUMBER: _ClassVar[int]
+    location: str
+    size: int
+    size_diff: int
+    count: int
+    count_diff: int
+    def __init__(self, location: _Optional[str] = ..., size: _Optional[int] = ..., size_diff: _Optional[int] = ..., count: _Optional[int] = ..., count_diff: _Optional[int] = ...) -> None: ...
+
+class MemorySnapshotResponse(_message.Message):
+    __slots__ = ("stats", "total_size", "total_size_diff", "duration_seconds")
+    STATS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_SIZE_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_SIZE_DIFF_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    stats: _containers.RepeatedCompositeFieldContainer[MemoryStat]
+    total_size: int
+    total_size_diff: int
+    duration_seconds: float
+    def __init__(self, stats: _Optional[_Iterable[_Union[MemoryStat, _Mapping]]] = ..., total_size: _Optional[int] = ..., total_size_diff: _Optional[int] = ..., duration_seconds: _Optional[float] = ...) -> None: ...
@@ -0,0 +1,145 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+import profiling_pb2 as profiling__pb2
+
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in profiling_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ProfilingStub(object):
+    """Admin service for on-demand profiling of a running instance.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Profile = channel.unary_unary(
+                '/accelbyte.grpcplugin.profiling.Profiling/Profile',
+                request_serializer=profiling__pb2.ProfileRequest.SerializeToString,
+                response_deserializer=profiling__pb2.ProfileResponse.FromString,
+                _registered_method=True)
+        self.MemorySnapshot = channel.unary_unary(
+                '/accelbyte.grpcplugin.profiling.Profiling/MemorySnapshot',
+                request_serializer=profiling__pb2.MemorySnapshotRequest.SerializeToString,
+                response_deserializer=profiling__pb2.MemorySnapshotResponse.FromString,
+                _registered_method=True)
+
+
+class ProfilingServicer(object):
+    """Admin service for on-demand profiling of a running instance.
+    """
+
+    def Profile(self, request, context):
+        """Profiles the server for the requested duration and returns the result.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MemorySnapshot(self, request, context):
+        """Traces allocations for the requested duration and returns the top growth.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ProfilingServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.Profile,
+                    request_deserializer=profiling__pb2.ProfileRequest.FromString,
+                    response_serializer=profiling__pb2.ProfileResponse.SerializeToString,
+            ),
+            'MemorySnapshot': grpc.unary_unary_rpc_method_handler(
+                    servicer.MemorySnapshot,
+                    request_deserializer=profiling__pb2.MemorySnapshotRequest.FromString,
+                    response_serializer=profiling__pb2.MemorySnapshotResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'accelbyte.grpcplugin.profiling.Profiling', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('accelbyte.grpcplugin.profiling.Profiling', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Profiling(object):
+    """Admin service for on-demand profiling of a running instance.
+    """
+
+    @staticmethod
+    def Profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/accelbyte.grpcplugin.profiling.Profiling/Profile',
+            profiling__pb2.ProfileRequest.SerializeToString,
+            profiling__pb2.ProfileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def MemorySnapshot(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/accelbyte.grpcplugin.profiling.Profiling/MemorySnapshot',
+            profiling__pb2.MemorySnapshotRequest.SerializeToString,
+            profiling__pb2.MemorySnapshotResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from accelbyte_py_sdk.token_validation._cache_types import JWKSCache
+
+from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+
+
+class OverlapDetectingValidator:
+    """Synchronous validator that records whether it was ever entered concurrently."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def validate_token(self, token, resource=None, action=None, namespace=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.calls += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return None
+
+
+class ColdJWKSValidator:
+    """Validator backed by the SDK's JWKSCache whose fetch is slow and counted."""
+
+    def __init__(self):
+        self.jwks_cache = JWKSCache(sdk=None)
+        self.jwks_cache.update = self.fetch_jwks
+        self.fetches = 0
+
+    def fetch_jwks(self, **kwargs):
+        time.sleep(0.05)
+        self.fetches += 1
+        with self.jwks_cache._lock:
+            self.jwks_cache._jwks["kid"] = "key"
+
+    def validate_token(self, token, resource=None, action=None, namespace=None, **kwargs):
+        return None if self.jwks_cache.get_key("kid") else KeyError("kid")
+
+
+class AuthorizationServerInterceptorTest(unittest.TestCase):
+    def create_interceptor(self, validator):
+        executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
+        return AuthorizationServerInterceptor(token_validator=validator, namespace="test", executor=executor)
+
+    def test_multiple_interceptors_can_be_created(self):
+        first = self.create_interceptor(OverlapDetectingValidator())
+        second = self.create_interceptor(OverlapDetectingValidator())
+        first.token_cache_hits.inc()
+        second.token_cache_hits.inc()
+
+    @staticmethod
+    def validate_all(interceptor, count=8):
+        async def validate_all():
+            return await asyncio.gather(
+                *(
+                    interceptor.validate_token(token="token-{}".format(i), resource=None, action=None)
+                    for i in range(count)
+                )
+            )
+
+        return asyncio.run(validate_all())
+
+    def test_sync_validations_run_in_parallel(self):
+        validator = OverlapDetectingValidator()
+        interceptor = self.create_interceptor(validator)
+
+        errors = self.validate_all(interceptor)
+
+        self.assertEqual(errors, [None] * 8)
+        self.assertEqual(validator.calls, 8)
+        self.assertGreater(validator.max_active, 1)
+
+    def test_cold_cache_is_fetched_once(self):
+        validator = ColdJWKSValidator()
+        interceptor = self.create_interceptor(validator)
+
+        errors = self.validate_all(interceptor)
+
+        self.assertEqual(errors, [None] * 8)
+        self.assertEqual(validator.fetches, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
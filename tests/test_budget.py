@@ -0,0 +1,130 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import json
+import logging
+import unittest
+from unittest import mock
+
+from matchFunction_pb2 import (
+    BackfillMakeMatchesRequest,
+    BackfillTicket,
+    MakeMatchesRequest,
+    Rules,
+    Ticket,
+)
+
+from app.budget import TimeBudget
+from app.metrics import MatchFunctionMetrics
+from app.services.matchFunction import AsyncMatchFunctionService
+
+from .test_match_function import FakeContext
+
+RULES = {
+    "alliance": {"min_number": 1, "max_number": 1, "player_min_number": 2, "player_max_number": 2},
+    "matching_rule": [{"attribute": "mmr", "criteria": "distance", "reference": 10}],
+}
+
+
+class TimeBudgetTest(unittest.TestCase):
+    def test_without_deadline_never_exhausts(self):
+        budget = TimeBudget(reserve=1.0)
+        self.assertIsNone(budget.remaining())
+        self.assertFalse(budget.is_exhausted())
+        self.assertFalse(budget.report())
+
+    def test_exhausts_at_reserve_and_stays_degraded(self):
+        with mock.patch("app.budget.time.monotonic", return_value=100.0) as monotonic:
+            budget = TimeBudget(time_remaining=1.0, reserve=0.25)
+            monotonic.return_value = 100.5
+            self.assertAlmostEqual(budget.remaining(), 0.5)
+            self.assertFalse(budget.is_exhausted())
+            monotonic.return_value = 100.75
+            self.assertTrue(budget.is_exhausted())
+            # A clock that moved backwards does not undo the switch.
+            monotonic.return_value = 100.0
+            self.assertTrue(budget.report())
+            self.assertTrue(budget.degraded)
+
+    def test_from_context(self):
+        context = FakeContext()
+        self.assertIsNone(TimeBudget.from_context(context).deadline)
+        context.time_remaining = lambda: 0.0
+        self.assertTrue(TimeBudget.from_context(context, reserve=0.25).is_exhausted())
+        self.assertIsNone(TimeBudget.from_context(object()).deadline)
+
+
+class DegradedTickTest(unittest.TestCase):
+    def setUp(self):
+        logger = logging.getLogger("test.budget")
+        logger.setLevel(logging.CRITICAL)
+        self.metrics = MatchFunctionMetrics(meter=mock.MagicMock())
+        self.service = AsyncMatchFunctionService(logger=logger, metrics=self.metrics, deadline_reserve=0.25)
+
+    @staticmethod
+    def ticket(ticket_id, mmr):
+        ticket = Ticket(ticket_id=ticket_id, match_pool="pool")
+        player = ticket.players.add(player_id="player-{}".format(ticket_id))
+        player.attributes.fields["mmr"].number_value = mmr
+        return ticket
+
+    @staticmethod
+    def context(time_remaining):
+        context = FakeContext()
+        context.time_remaining = lambda: time_remaining
+        return context
+
+    @staticmethod
+    def collect(responses):
+        async def collect():
+            return [response async for response in responses]
+
+        return asyncio.run(collect())
+
+    @staticmethod
+    async def stream(*requests):
+        for request in requests:
+            yield request
+
+    def make_matches(self, time_remaining):
+        parameters = MakeMatchesRequest.MakeMatchesParameters(rules=Rules(json=json.dumps(RULES)), tickId=7)
+        requests = self.stream(
+            MakeMatchesRequest(parameters=parameters),
+            MakeMatchesRequest(ticket=self.ticket("a", 0)),
+            MakeMatchesRequest(ticket=self.ticket("b", 100)),
+        )
+        return self.collect(self.service.MakeMatches(requests, self.context(time_remaining)))
+
+    def test_make_matches_within_budget_respects_distance(self):
+        self.assertEqual(self.make_matches(time_remaining=60.0), [])
+        self.metrics.degraded_ticks.add.assert_not_called()
+
+    def test_make_matches_falls_back_to_greedy(self):
+        responses = self.make_matches(time_remaining=0.0)
+
+        self.assertEqual([[t.ticket_id for t in r.match.tickets] for r in responses], [["a", "b"]])
+        self.metrics.degraded_ticks.add.assert_called_once_with(
+            1, {"match_pool": "pool", "rpc": "MakeMatches"}
+        )
+
+    def test_backfill_reports_degraded_tick_once(self):
+        parameters = BackfillMakeMatchesRequest.MakeMatchesParameters(rules=Rules(json="{}"), tickId=7)
+        requests = self.stream(
+            BackfillMakeMatchesRequest(parameters=parameters),
+            BackfillMakeMatchesRequest(ticket=self.ticket("a", 0)),
+            BackfillMakeMatchesRequest(backfill_ticket=BackfillTicket(ticket_id="b", match_pool="pool")),
+            BackfillMakeMatchesRequest(ticket=self.ticket("c", 0)),
+        )
+
+        responses = self.collect(self.service.BackfillMatches(requests, self.context(0.0)))
+
+        self.assertEqual([r.backfill_proposal.backfill_ticket_id for r in responses], ["b"])
+        self.metrics.degraded_ticks.add.assert_called_once_with(
+            1, {"match_pool": "pool", "rpc": "BackfillMatches"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
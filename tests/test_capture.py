@@ -0,0 +1,86 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from matchFunction_pb2 import MakeMatchesRequest, Rules, Ticket
+
+from app.capture import StreamCapture, decode_varint, encode_varint, read_capture
+
+
+def requests(tick_id=7, tickets=3, size=1):
+    parameters = MakeMatchesRequest.MakeMatchesParameters(rules=Rules(json="{}"), tickId=tick_id)
+    yield MakeMatchesRequest(parameters=parameters)
+    for i in range(tickets):
+        yield MakeMatchesRequest(ticket=Ticket(ticket_id="ticket-{}-".format(i) * size, match_pool="pool"))
+
+
+class VarintTest(unittest.TestCase):
+    def test_round_trip(self):
+        for value in (0, 1, 127, 128, 300, 16383, 16384, 2 ** 21, 2 ** 35):
+            with self.subTest(value=value):
+                data = encode_varint(value)
+                self.assertEqual(decode_varint(data, 0), (value, len(data)))
+
+
+class StreamCaptureTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def record(self, capture, messages, rpc="MakeMatches"):
+        async def stream():
+            for message in messages:
+                yield message
+
+        async def consume():
+            return [message async for message in capture.record(rpc, stream())]
+
+        return asyncio.run(consume())
+
+    def capture_files(self):
+        return sorted(os.path.join(self.directory, name) for name in os.listdir(self.directory))
+
+    def test_round_trip_through_mmap_reader(self):
+        capture = StreamCapture(directory=self.directory)
+        # Tickets of ~40, ~4000 and ~40000 bytes need one, two and three varint bytes.
+        messages = [*requests(tickets=1), *requests(tickets=1, size=400), *requests(tickets=1, size=4000)]
+
+        self.assertEqual(self.record(capture, messages), messages)
+        capture.close()
+
+        [path] = self.capture_files()
+        self.assertTrue(os.path.basename(path).startswith("MakeMatches-7-"))
+        self.assertEqual(list(read_capture(path)), messages)
+        self.assertEqual(os.path.getsize(path), capture.captured_bytes)
+
+    def test_every_n(self):
+        capture = StreamCapture(directory=self.directory, every_n=2)
+        for tick_id in range(4):
+            self.record(capture, list(requests(tick_id=tick_id)))
+        capture.close()
+
+        self.assertEqual(len(self.capture_files()), 2)
+
+    def test_max_bytes_cuts_the_stream_and_stops_capturing(self):
+        messages = list(requests(tickets=10))
+        frame_size = sum(len(m.SerializeToString()) + 1 for m in messages[:4])
+        capture = StreamCapture(directory=self.directory, max_bytes=frame_size)
+
+        self.assertEqual(self.record(capture, messages), messages)
+        self.assertEqual(self.record(capture, list(requests(tick_id=8))), list(requests(tick_id=8)))
+        capture.close()
+
+        [path] = self.capture_files()
+        self.assertEqual(list(read_capture(path)), messages[:4])
+        self.assertTrue(capture.is_full())
+        self.assertEqual(capture.dropped_messages, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import logging
+import queue
+import unittest
+
+from accelbyte_grpc_plugin.options.log_queue import DropOldestQueueHandler
+
+
+class DropOldestQueueHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = queue.Queue(maxsize=2)
+        self.handler = DropOldestQueueHandler(self.queue)
+        self.logger = logging.getLogger("test.log_queue")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_message_is_formatted_on_the_caller(self):
+        payload = {"state": "before"}
+        self.logger.warning("payload: %s", payload)
+        payload["state"] = "after"
+
+        record = self.queue.get_nowait()
+        self.assertEqual(record.getMessage(), "payload: {'state': 'before'}")
+        self.assertIsNone(record.args)
+
+    def test_exception_is_rendered_and_cleared(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("failed")
+
+        record = self.queue.get_nowait()
+        self.assertIsNone(record.exc_info)
+        self.assertIn("ValueError: boom", record.getMessage())
+
+    def test_drops_oldest_when_full(self):
+        for index in range(3):
+            self.logger.warning("record %d", index)
+
+        self.assertEqual(self.handler.dropped_records, 1)
+        self.assertEqual(
+            [self.queue.get_nowait().getMessage() for _ in range(2)],
+            ["record 1", "record 2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import gzip
+import json
+import logging
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from accelbyte_grpc_plugin.options.loki_batch import BatchingLokiHandler
+
+
+class LokiStub(ThreadingHTTPServer):
+    """Local stand-in for the Loki push endpoint that records every request."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LokiStubRequestHandler)
+        self.requests = []
+        self.statuses = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return "http://{}:{}/loki/api/v1/push".format(*self.server_address)
+
+    def wait_for(self, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if len(self.requests) >= count:
+                    return
+            time.sleep(0.01)
+        raise AssertionError("expected {} pushes, got {}".format(count, len(self.requests)))
+
+
+class LokiStubRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests.append((dict(self.headers), body))
+            status = self.server.statuses.pop(0) if self.server.statuses else 204
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def pushed_lines(body):
+    payload = json.loads(gzip.decompress(body))
+    return [line for stream in payload["streams"] for _, line in stream["values"]]
+
+
+class BatchingLokiHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = LokiStub()
+        thread = threading.Thread(target=self.stub.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(self.stub.server_close)
+        self.addCleanup(self.stub.shutdown)
+
+    def create_handler(self, **kwargs):
+        kwargs.setdefault("flush_interval", 60.0)
+        kwargs.setdefault("retry_backoff", 0.01)
+        handler = BatchingLokiHandler(url=self.stub.url, **kwargs)
+        self.addCleanup(handler.close)
+        return handler
+
+    @staticmethod
+    def emit(handler, *messages):
+        for message in messages:
+            handler.handle(logging.makeLogRecord({"name": "test", "levelname": "INFO", "msg": message}))
+
+    def test_pushes_full_batches_gzip_compressed(self):
+        handler = self.create_handler(batch_size=3)
+
+        self.emit(handler, *("line-{}".format(i) for i in range(7)))
+        self.stub.wait_for(2)
+        handler.close()
+
+        self.assertEqual(len(self.stub.requests), 3)
+        headers, _ = self.stub.requests[0]
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            [pushed_lines(body) for _, body in self.stub.requests],
+            [["line-0", "line-1", "line-2"], ["line-3", "line-4", "line-5"], ["line-6"]],
+        )
+
+    def test_flushes_after_interval(self):
+        handler = self.create_handler(batch_size=100, flush_interval=0.05)
+
+        self.emit(handler, "line")
+        self.stub.wait_for(1)
+
+        self.assertEqual(pushed_lines(self.stub.requests[0][1]), ["line"])
+
+    def test_retries_server_errors_with_backoff(self):
+        self.stub.statuses = [503, 500]
+        handler = self.create_handler(batch_size=1, max_retries=3)
+
+        self.emit(handler, "line")
+        self.stub.wait_for(3)
+        handler.close()
+
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual({body for _, body in self.stub.requests}, {self.stub.requests[0][1]})
+        self.assertEqual(handler.failed_batches, 0)
+
+    def test_does_not_retry_client_errors(self):
+        self.stub.statuses = [400]
+        handler = self.create_handler(batch_size=1, max_retries=3)
+
+        self.emit(handler, "line")
+        self.stub.wait_for(1)
+        handler.close()
+
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertEqual(handler.failed_batches, 1)
+
+    def test_drops_oldest_records_on_overflow(self):
+        handler = self.create_handler(batch_size=100, max_buffer=3)
+
+        self.emit(handler, *("line-{}".format(i) for i in range(5)))
+        handler.close()
+
+        self.assertEqual(handler.dropped_records, 2)
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertEqual(pushed_lines(self.stub.requests[0][1]), ["line-2", "line-3", "line-4"])
+
+    def test_close_waits_for_the_flusher_to_drain(self):
+        self.stub.statuses = [503]
+        handler = self.create_handler(batch_size=2, max_retries=1, retry_backoff=0.1)
+
+        self.emit(handler, "line-0", "line-1", "line-2")
+        self.stub.wait_for(1)
+        handler.close()
+
+        self.assertFalse(handler._thread.is_alive())
+        self.assertEqual(
+            [pushed_lines(body) for _, body in self.stub.requests],
+            [["line-0", "line-1"], ["line-0", "line-1"], ["line-2"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import json
+import logging
+import unittest
+
+from grpc import StatusCode
+
+from app.services.matchFunction import AsyncMatchFunctionService
+from matchFunction_pb2 import GetStatCodesRequest, Rules
+
+
+class Abort(Exception):
+    def __init__(self, code: StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+
+
+class FakeContext:
+    async def abort(self, code: StatusCode, details: str = "") -> None:
+        raise Abort(code, details)
+
+    def time_remaining(self):
+        return None
+
+
+class GetStatCodesTest(unittest.TestCase):
+    def setUp(self):
+        logger = logging.getLogger("test")
+        logger.setLevel(logging.CRITICAL)
+        self.service = AsyncMatchFunctionService(logger=logger)
+
+    def get_stat_codes(self, rules):
+        request = GetStatCodesRequest(rules=Rules(json=json.dumps(rules)))
+        return asyncio.run(self.service.GetStatCodes(request, FakeContext()))
+
+    def test_stat_codes(self):
+        response = self.get_stat_codes({"matching_rule": [{"attribute": "mmr", "reference": 50}]})
+        self.assertEqual(list(response.codes), ["mmr"])
+
+    def test_malformed_rules_are_invalid_argument(self):
+        for rules in (
+            {"alliance": 5},
+            {"alliance": {"min_number": "2", "max_number": 2}},
+            {"matching_rule": "abc"},
+            {"matching_rule": [{"reference": "x"}]},
+            {"shipCountMin": 2},
+        ):
+            with self.subTest(rules=rules):
+                with self.assertRaises(Abort) as raised:
+                    self.get_stat_codes(rules)
+                self.assertEqual(raised.exception.code, StatusCode.INVALID_ARGUMENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
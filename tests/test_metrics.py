@@ -0,0 +1,111 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import logging
+import time
+import unittest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from matchFunction_pb2 import (
+    BackfillMakeMatchesRequest,
+    BackfillTicket,
+    MakeMatchesRequest,
+    Rules,
+    Ticket,
+)
+
+from app.metrics import MatchFunctionMetrics
+from app.services.matchFunction import AsyncMatchFunctionService
+
+from .test_match_function import FakeContext
+
+
+def ticket(ticket_id, age=0.0):
+    ticket = Ticket(ticket_id=ticket_id, match_pool="pool")
+    ticket.players.add(player_id="player-{}".format(ticket_id))
+    if age:
+        ticket.CreatedAt.FromNanoseconds(int((time.time() - age) * 1e9))
+    return ticket
+
+
+async def stream(*requests):
+    for request in requests:
+        yield request
+
+
+class MatchFunctionMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[self.reader])
+        self.addCleanup(provider.shutdown)
+        logger = logging.getLogger("test.metrics")
+        logger.setLevel(logging.CRITICAL)
+        self.service = AsyncMatchFunctionService(
+            logger=logger, metrics=MatchFunctionMetrics(meter=provider.get_meter("test"))
+        )
+
+    def collect(self, responses):
+        async def collect():
+            return [response async for response in responses]
+
+        return asyncio.run(collect())
+
+    def data_points(self):
+        points = {}
+        for resource_metrics in self.reader.get_metrics_data().resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    points[metric.name] = {
+                        tuple(sorted(point.attributes.items())): point for point in metric.data.data_points
+                    }
+        return points
+
+    def test_make_matches_records_pool_age_and_results(self):
+        parameters = MakeMatchesRequest.MakeMatchesParameters(rules=Rules(json="{}"), tickId=7)
+        requests = stream(
+            MakeMatchesRequest(parameters=parameters),
+            MakeMatchesRequest(ticket=ticket("a", age=10.0)),
+            MakeMatchesRequest(ticket=ticket("b", age=20.0)),
+            MakeMatchesRequest(ticket=ticket("c")),
+        )
+
+        self.assertEqual(len(self.collect(self.service.MakeMatches(requests, FakeContext()))), 1)
+
+        points = self.data_points()
+        pool_size = points["matchmaking_pool_size"][(("match_pool", "pool"), ("pool", "ticket"))]
+        self.assertEqual((pool_size.count, pool_size.sum), (1, 1))
+        ticket_age = points["matchmaking_ticket_age"][(("match_pool", "pool"),)]
+        self.assertEqual(ticket_age.count, 2)
+        self.assertAlmostEqual(ticket_age.sum, 30.0, delta=1.0)
+        results = points["matchmaking_results_per_tick"][(("match_pool", "pool"), ("rpc", "MakeMatches"))]
+        self.assertEqual((results.count, results.sum), (1, 1))
+        self.assertIn(
+            (("function", "build_match"), ("match_pool", "pool")), points["matchmaking_build_cpu_time"]
+        )
+
+    def test_backfill_matches_records_both_pools_and_results(self):
+        parameters = BackfillMakeMatchesRequest.MakeMatchesParameters(rules=Rules(json="{}"), tickId=7)
+        requests = stream(
+            BackfillMakeMatchesRequest(parameters=parameters),
+            BackfillMakeMatchesRequest(ticket=ticket("a", age=5.0)),
+            BackfillMakeMatchesRequest(backfill_ticket=BackfillTicket(ticket_id="b", match_pool="pool")),
+            BackfillMakeMatchesRequest(backfill_ticket=BackfillTicket(ticket_id="c", match_pool="pool")),
+        )
+
+        self.assertEqual(len(self.collect(self.service.BackfillMatches(requests, FakeContext()))), 1)
+
+        points = self.data_points()
+        pool_size = points["matchmaking_pool_size"]
+        self.assertEqual(pool_size[(("match_pool", "pool"), ("pool", "ticket"))].sum, 0)
+        self.assertEqual(pool_size[(("match_pool", "pool"), ("pool", "backfill_ticket"))].sum, 1)
+        self.assertEqual(points["matchmaking_ticket_age"][(("match_pool", "pool"),)].count, 1)
+        results = points["matchmaking_results_per_tick"][(("match_pool", "pool"), ("rpc", "BackfillMatches"))]
+        self.assertEqual((results.count, results.sum), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
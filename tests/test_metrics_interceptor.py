@@ -0,0 +1,31 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from accelbyte_grpc_plugin.interceptors.metrics import MetricsServerInterceptor
+
+
+class MetricsServerInterceptorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The interceptor registers its metrics on the global registry, so it is created once.
+        cls.interceptor = MetricsServerInterceptor(labels={"os": "test"})
+
+    def test_unknown_methods_are_not_cached(self):
+        async def continuation(handler_call_details):
+            return None
+
+        for i in range(3):
+            details = SimpleNamespace(method="/unknown.Service/Method{}".format(i), invocation_metadata=())
+            handler = asyncio.run(self.interceptor.intercept_service(continuation, details))
+            self.assertIsNone(handler)
+
+        self.assertEqual(self.interceptor.method_metrics, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import logging
+import unittest
+from unittest import mock
+
+from google.protobuf.json_format import MessageToJson
+
+from matchFunction_pb2 import MakeMatchesRequest, Rules, Ticket
+
+from app.services.matchFunction import AsyncMatchFunctionService
+from app.utils import LazyMessageJson, PayloadLogSampler
+
+from .test_match_function import FakeContext
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+class PayloadLogSamplerTest(unittest.TestCase):
+    @staticmethod
+    def sampled(sampler, count=10):
+        return [i for i in range(1, count + 1) if sampler.sample()]
+
+    def test_rates(self):
+        for every_n, first_k, expected in (
+            (1, 0, list(range(1, 11))),
+            (3, 0, [3, 6, 9]),
+            (0, 0, []),
+            (0, 2, [1, 2]),
+            (4, 3, [1, 2, 3, 4, 8]),
+        ):
+            with self.subTest(every_n=every_n, first_k=first_k):
+                self.assertEqual(self.sampled(PayloadLogSampler(every_n=every_n, first_k=first_k)), expected)
+
+
+class LazyMessageJsonTest(unittest.TestCase):
+    def test_truncates_to_max_size(self):
+        message = Ticket(ticket_id="x" * 100)
+        payload_json = MessageToJson(message, preserving_proto_field_name=True)
+
+        self.assertEqual(str(LazyMessageJson(message)), payload_json)
+        self.assertEqual(
+            str(LazyMessageJson(message, max_size=10)),
+            "{}... ({} more chars)".format(payload_json[:10], len(payload_json) - 10),
+        )
+
+    def test_serializes_once(self):
+        payload = LazyMessageJson(Ticket(ticket_id="x"))
+        with mock.patch("app.utils.MessageToJson", return_value="{}") as message_to_json:
+            self.assertEqual([str(payload), str(payload)], ["{}", "{}"])
+        message_to_json.assert_called_once()
+
+
+class PayloadLoggingTest(unittest.TestCase):
+    def setUp(self):
+        self.handler = RecordingHandler()
+        self.logger = logging.getLogger("test.payload_logging")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+        patcher = mock.patch("app.utils.MessageToJson", return_value="{}")
+        self.message_to_json = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_service(self, **kwargs):
+        return AsyncMatchFunctionService(logger=self.logger, payload_log_level=logging.DEBUG, **kwargs)
+
+    def test_not_serialized_below_debug(self):
+        self.logger.setLevel(logging.INFO)
+        service = self.create_service()
+
+        for _ in range(5):
+            service.log_payload("payload: %s", Ticket())
+
+        self.message_to_json.assert_not_called()
+
+    def test_unsampled_messages_are_not_serialized(self):
+        self.logger.setLevel(logging.DEBUG)
+        service = self.create_service(payload_log_every_n=3)
+
+        for _ in range(9):
+            service.log_payload("payload: %s", Ticket())
+
+        self.assertEqual(self.message_to_json.call_count, 3)
+        self.assertEqual(len(self.handler.messages), 3)
+
+    def test_stream_payloads_are_sampled_per_stream(self):
+        self.logger.setLevel(logging.DEBUG)
+        service = self.create_service(payload_log_every_n=0, payload_log_first_k=2)
+
+        async def make_matches():
+            async def requests():
+                parameters = MakeMatchesRequest.MakeMatchesParameters(rules=Rules(json="{}"), tickId=1)
+                yield MakeMatchesRequest(parameters=parameters)
+                for i in range(4):
+                    yield MakeMatchesRequest(ticket=Ticket(ticket_id=str(i), match_pool="pool"))
+
+            return [response async for response in service.MakeMatches(requests(), FakeContext())]
+
+        for _ in range(2):
+            asyncio.run(make_matches())
+
+        # Two streams of five requests and two matches each, two payloads logged per stream.
+        self.assertEqual(self.message_to_json.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import random
+import unittest
+
+from app.pool import SkillTicketPool, TicketPool
+
+
+class TicketPoolTest(unittest.TestCase):
+    def create_pool(self, items, min_size=2, max_size=3):
+        pool = TicketPool(min_size=min_size, max_size=max_size)
+        for item in items:
+            pool.add(item)
+        return pool
+
+    def test_pop_is_fifo(self):
+        pool = self.create_pool(range(3))
+        self.assertEqual([pool.pop() for _ in range(3)], [0, 1, 2])
+        with self.assertRaises(IndexError):
+            pool.pop()
+
+    def test_drain_matches_in_fifo_order(self):
+        pool = self.create_pool(range(6))
+        self.assertEqual(pool.drain_matches(), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(len(pool), 0)
+
+    def test_partial_drain_leaves_remainder(self):
+        pool = self.create_pool(range(4), min_size=3, max_size=3)
+        self.assertEqual(pool.drain_matches(), [[0, 1, 2]])
+        self.assertEqual(pool.size, 1)
+
+        pool.add(4)
+        pool.add(5)
+        self.assertEqual(pool.drain_matches(), [[3, 4, 5]])
+
+    def test_falls_back_to_min_size(self):
+        pool = self.create_pool(range(5), min_size=2, max_size=4)
+        self.assertEqual(pool.drain_matches(), [[0, 1, 2, 3]])
+        self.assertEqual(pool.size, 1)
+
+        pool = self.create_pool(range(3), min_size=2, max_size=4)
+        self.assertEqual(pool.drain_matches(), [[0, 1]])
+        self.assertEqual(pool.pop(), 2)
+
+    def test_greedy_drain_below_min_size(self):
+        pool = self.create_pool(range(1), min_size=2, max_size=3)
+        self.assertEqual(pool.drain_greedy(), [])
+        self.assertEqual(pool.size, 1)
+
+    def test_peak_size(self):
+        pool = self.create_pool(range(4), min_size=2, max_size=2)
+        self.assertEqual(pool.peak_size, 4)
+        pool.drain_matches()
+        pool.add(4)
+        self.assertEqual(pool.size, 1)
+        self.assertEqual(pool.peak_size, 4)
+
+    def test_sizes_are_at_least_one(self):
+        pool = self.create_pool(range(2), min_size=0, max_size=0)
+        self.assertEqual(pool.drain_matches(), [[0], [1]])
+
+
+class SkillTicketPoolTest(unittest.TestCase):
+    def create_pool(self, keys, max_distance=10, min_size=2, max_size=3, load=2):
+        # A small load spreads even a few tickets over several blocks.
+        pool = SkillTicketPool(
+            key=lambda ticket: ticket[0],
+            max_distance=max_distance,
+            min_size=min_size,
+            max_size=max_size,
+            load=load,
+        )
+        for index, key in enumerate(keys):
+            pool.add((key, index))
+        return pool
+
+    @staticmethod
+    def window_keys(pool, window):
+        (block, index), num_items = window
+        keys = [key for keys in pool._key_blocks[block:] for key in keys]
+        return keys[index:index + num_items]
+
+    def test_prefers_max_size_window(self):
+        pool = self.create_pool([0, 100, 101, 102, 103, 200])
+        window = pool.find_window(101)
+        self.assertEqual(window[1], 3)
+        self.assertEqual(self.window_keys(pool, window), [101, 102, 103])
+
+    def test_falls_back_to_min_size_window(self):
+        pool = self.create_pool([0, 100, 105, 200, 300])
+        window = pool.find_window(105)
+        self.assertEqual(window[1], 2)
+        self.assertEqual(self.window_keys(pool, window), [100, 105])
+
+    def test_distance_bound(self):
+        pool = self.create_pool([0, 11, 22, 33])
+        self.assertIsNone(pool.find_window(11))
+        self.assertEqual(pool.drain_matches(), [])
+        self.assertEqual(pool.size, 4)
+
+        pool.add((10, 4))
+        self.assertEqual(pool.drain_matches(), [[(10, 4), (11, 1)]])
+        self.assertEqual(pool.size, 3)
+
+    def test_window_must_contain_key(self):
+        pool = self.create_pool([0, 1, 2, 50])
+        self.assertIsNone(pool.find_window(50))
+
+    def test_pop_and_greedy_drain_in_key_order(self):
+        pool = self.create_pool([5, 3, 9, 1, 7], max_distance=0)
+        self.assertEqual(pool.pop(), (1, 3))
+        self.assertEqual(pool.drain_greedy(), [[(3, 1), (5, 0), (7, 4)]])
+        self.assertEqual(pool.pop(), (9, 2))
+        with self.assertRaises(IndexError):
+            pool.pop()
+
+    def test_no_ticket_lost_or_duplicated(self):
+        rnd = random.Random(0)
+        for load in (1, 2, 16):
+            with self.subTest(load=load):
+                pool = self.create_pool([], max_distance=5, min_size=2, max_size=4, load=load)
+                added, matched = [], []
+                for index in range(2000):
+                    ticket = (rnd.randint(0, 500), index)
+                    pool.add(ticket)
+                    added.append(ticket)
+                    if index % 7 == 0:
+                        for group in pool.drain_matches():
+                            self.assertIn(len(group), (2, 4))
+                            self.assertLessEqual(group[-1][0] - group[0][0], 5)
+                            matched.extend(group)
+                remaining = [pool.pop() for _ in range(pool.size)]
+                self.assertEqual(remaining, sorted(remaining, key=lambda ticket: ticket[0]))
+                self.assertEqual(sorted(matched + remaining), sorted(added))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import logging
+import unittest
+from unittest import mock
+
+from environs import Env
+from grpc import StatusCode
+
+from accelbyte_grpc_plugin.app import App
+from accelbyte_grpc_plugin.interceptors.authorization import AuthorizationServerInterceptor
+from accelbyte_grpc_plugin.options.profiling import AppOptionProfiling, AsyncProfilingService
+from profiling_pb2 import ProfileRequest
+
+from .test_authorization import OverlapDetectingValidator
+from .test_match_function import Abort, FakeContext
+
+
+class ProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.service = AsyncProfilingService()
+
+    def profile(self, **kwargs):
+        request = ProfileRequest(
+            profiler=ProfileRequest.CPROFILE, format=ProfileRequest.TEXT, duration_seconds=0.01, **kwargs
+        )
+        return asyncio.run(self.service.Profile(request, FakeContext()))
+
+    def test_sort(self):
+        response = self.profile(sort="tottime")
+        self.assertIn(b"tottime", response.data)
+
+    def test_unknown_sort_is_invalid_argument(self):
+        with self.assertRaises(Abort) as raised:
+            self.profile(sort="bogus")
+        self.assertEqual(raised.exception.code, StatusCode.INVALID_ARGUMENT)
+
+
+class AppOptionProfilingTest(unittest.TestCase):
+    def setUp(self):
+        self.app = App(env=Env(), logger=logging.getLogger("test.profiling"))
+        self.app.grpc_server = mock.MagicMock()
+
+    def test_requires_authorization_interceptor(self):
+        with self.assertRaises(RuntimeError):
+            AppOptionProfiling().apply(self.app)
+        self.app.grpc_server.add_generic_rpc_handlers.assert_not_called()
+        self.assertNotIn(AsyncProfilingService.full_name, self.app.grpc_service_names)
+
+    def test_registers_behind_authorization(self):
+        interceptor = AuthorizationServerInterceptor(token_validator=OverlapDetectingValidator())
+        self.app.grpc_interceptors.append(interceptor)
+
+        AppOptionProfiling().apply(self.app)
+
+        self.assertIn(AsyncProfilingService.full_name, self.app.grpc_service_names)
+        policy = interceptor.get_method_policy("/{}/Profile".format(AsyncProfilingService.full_name))
+        self.assertIsNotNone(policy.resource)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import unittest
+from types import SimpleNamespace
+
+import grpc
+from environs import Env
+from grpc import StatusCode
+
+from accelbyte_grpc_plugin.app import App
+from accelbyte_grpc_plugin.interceptors.readiness import ReadinessServerInterceptor
+
+from .test_match_function import Abort, FakeContext
+
+
+async def unary(request, context):
+    return "response"
+
+
+async def stream(request_iterator, context):
+    yield "response"
+
+
+class ReadinessServerInterceptorTest(unittest.TestCase):
+    def setUp(self):
+        self.interceptor = ReadinessServerInterceptor(serving=False)
+
+    def intercept(self, method, handler):
+        async def continuation(handler_call_details):
+            return handler
+
+        details = SimpleNamespace(method=method, invocation_metadata=())
+        return asyncio.run(self.interceptor.intercept_service(continuation, details))
+
+    def call_unary(self, method="/service.Service/Unary"):
+        handler = self.intercept(method, grpc.unary_unary_rpc_method_handler(unary))
+        return asyncio.run(handler.unary_unary(None, FakeContext()))
+
+    def call_stream(self, method="/service.Service/Stream"):
+        async def collect(handler):
+            return [response async for response in handler.stream_stream(iter(()), FakeContext())]
+
+        handler = self.intercept(method, grpc.stream_stream_rpc_method_handler(stream))
+        return asyncio.run(collect(handler))
+
+    def test_rejects_calls_until_serving(self):
+        for call in (self.call_unary, self.call_stream):
+            with self.subTest(call=call.__name__):
+                with self.assertRaises(Abort) as raised:
+                    call()
+                self.assertEqual(raised.exception.code, StatusCode.UNAVAILABLE)
+
+    def test_health_check_stays_reachable(self):
+        self.assertEqual(self.call_unary("/grpc.health.v1.Health/Check"), "response")
+
+    def test_set_serving_admits_calls(self):
+        app = App(env=Env(), logger=logging.getLogger("test.readiness"))
+        app.grpc_interceptors.append(self.interceptor)
+
+        asyncio.run(app.set_serving(True))
+
+        self.assertTrue(self.interceptor.serving)
+        self.assertEqual(self.call_unary(), "response")
+        self.assertEqual(self.call_stream(), ["response"])
+
+    def test_unknown_methods_are_left_alone(self):
+        self.assertIsNone(self.intercept("/unknown.Service/Method", None))
+
+
+class DeferredImportTest(unittest.TestCase):
+    def test_startup_modules_do_not_import_the_sdk(self):
+        src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+        code = (
+            "import sys, app.__main__, accelbyte_grpc_plugin.utils; "
+            "print(any(m.startswith('accelbyte_py_sdk') for m in sys.modules))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=src, text=True)
+        self.assertEqual(output.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import json
+import logging
+import unittest
+
+from app.region import RegionLatencySelector
+from app.rules import compile_rules
+from app.services.matchFunction import AsyncMatchFunctionService
+from matchFunction_pb2 import Ticket
+
+
+def create_ticket(**latencies):
+    ticket = Ticket()
+    for region, latency in latencies.items():
+        ticket.latencies[region.replace("_", "-")] = latency
+    return ticket
+
+
+class RegionLatencySelectorTest(unittest.TestCase):
+    def test_orders_by_worst_latency(self):
+        selector = RegionLatencySelector()
+        group = [
+            create_ticket(us_east_2=40, eu_west_1=90, ap_south_1=30),
+            create_ticket(us_east_2=80, eu_west_1=20, ap_south_1=120),
+        ]
+        self.assertEqual(selector.select_group(group), ["us-east-2", "eu-west-1", "ap-south-1"])
+
+    def test_orders_by_mean_latency(self):
+        selector = RegionLatencySelector(aggregate=RegionLatencySelector.AGGREGATE_MEAN)
+        group = [
+            create_ticket(us_east_2=40, ap_south_1=30),
+            create_ticket(us_east_2=80, ap_south_1=70),
+        ]
+        self.assertEqual(selector.select_group(group), ["ap-south-1", "us-east-2"])
+
+    def test_drops_regions_over_max_latency(self):
+        selector = RegionLatencySelector(max_latency_ms=100)
+        group = [
+            create_ticket(us_east_2=40, eu_west_1=90, ap_south_1=30),
+            create_ticket(us_east_2=80, eu_west_1=100, ap_south_1=120),
+        ]
+        self.assertEqual(selector.select_group(group), ["us-east-2", "eu-west-1"])
+
+    def test_drops_regions_missing_for_a_ticket(self):
+        selector = RegionLatencySelector()
+        group = [create_ticket(us_east_2=40, eu_west_1=10), create_ticket(us_east_2=50)]
+        self.assertEqual(selector.select_group(group), ["us-east-2"])
+
+    def test_ties_are_broken_by_name(self):
+        selector = RegionLatencySelector()
+        self.assertEqual(selector.select_group([create_ticket(us_west_2=50, eu_west_1=50)]), ["eu-west-1", "us-west-2"])
+
+    def test_falls_back_to_default_preferences(self):
+        selector = RegionLatencySelector(max_latency_ms=100)
+        self.assertEqual(selector.select([[Ticket(), Ticket()]]), [["us-east-2", "us-west-2"]])
+        self.assertEqual(
+            RegionLatencySelector(default_preferences=["eu-west-1"]).select_group([Ticket()]), ["eu-west-1"]
+        )
+
+    def test_build_match_uses_the_rules_filter(self):
+        logger = logging.getLogger("test")
+        logger.setLevel(logging.CRITICAL)
+        service = AsyncMatchFunctionService(logger=logger)
+        rules = compile_rules(
+            json.dumps(
+                {
+                    "alliance": {"min_number": 1, "max_number": 1, "player_min_number": 2, "player_max_number": 2},
+                    "region_latency_max_ms": 100,
+                }
+            )
+        )
+        pool = service.create_pool(rules=rules)
+        service.build_match(rules=rules, ticket=create_ticket(us_east_2=40, eu_west_1=150), pool=pool)
+        matches = service.build_match(rules=rules, ticket=create_ticket(us_east_2=60, eu_west_1=20), pool=pool)
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(list(matches[0].region_preferences), ["us-east-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import json
+import unittest
+
+from app.ctypes import ValidationError
+from app.rules import compile_rules
+
+
+def alliance(min_number=1, max_number=1, player_min_number=2, player_max_number=2):
+    return {
+        "min_number": min_number,
+        "max_number": max_number,
+        "player_min_number": player_min_number,
+        "player_max_number": player_max_number,
+    }
+
+
+class CompileRulesTest(unittest.TestCase):
+    def assert_invalid(self, rules):
+        with self.assertRaises(ValidationError):
+            compile_rules(json.dumps(rules))
+
+    def test_defaults(self):
+        plan = compile_rules("{}")
+        self.assertEqual((plan.min_players, plan.max_players), (2, 2))
+
+    def test_malformed_alliance(self):
+        self.assert_invalid({"alliance": 5})
+        self.assert_invalid({"alliance": "abc"})
+        self.assert_invalid({"alliance": [1, 2]})
+        self.assert_invalid({"alliance": {"unknown": 1}})
+
+    def test_malformed_alliance_fields(self):
+        self.assert_invalid({"alliance": alliance(min_number="2")})
+        self.assert_invalid({"alliance": alliance(player_max_number="4")})
+        self.assert_invalid({"alliance": alliance(max_number=2.5)})
+        self.assert_invalid({"alliance": alliance(min_number=True)})
+        self.assert_invalid({"alliance": alliance(max_number=None)})
+
+    def test_malformed_matching_rule(self):
+        self.assert_invalid({"matching_rule": "abc"})
+        self.assert_invalid({"matching_rule": {"attribute": "mmr"}})
+        self.assert_invalid({"matching_rule": [5]})
+        self.assert_invalid({"matching_rule": [{"reference": "x"}]})
+        self.assert_invalid({"matching_rule": [{"attribute": 5, "reference": 1}]})
+        self.assert_invalid({"matching_rule": [{"attribute": "mmr", "criteria": None}]})
+        self.assert_invalid({"matching_rule": [{"attribute": "mmr", "unknown": 1}]})
+
+    def test_malformed_scalars(self):
+        self.assert_invalid({"shipCountMin": "2"})
+        self.assert_invalid({"shipCountMax": 1.5})
+        self.assert_invalid({"auto_backfill": "yes"})
+        self.assert_invalid({"region_latency_max_ms": "100"})
+
+    def test_malformed_json(self):
+        self.assert_invalid("[]")
+        with self.assertRaises(ValidationError):
+            compile_rules("{")
+        with self.assertRaises(ValidationError):
+            compile_rules("[1]")
+
+    def test_valid_matching_rule(self):
+        plan = compile_rules(
+            json.dumps({"matching_rule": [{"attribute": "mmr", "criteria": "distance", "reference": 50}]})
+        )
+        self.assertIsNotNone(plan.distance_rule)
+        self.assertEqual(plan.stat_codes, ("mmr",))
+
+    def test_ship_count_scales_bounds(self):
+        plan = compile_rules(json.dumps({"shipCountMin": 2, "shipCountMax": 2}))
+        self.assertEqual((plan.min_players, plan.max_players), (4, 4))
+
+        plan = compile_rules(json.dumps({"alliance": alliance(), "shipCountMin": 1, "shipCountMax": 3}))
+        self.assertEqual((plan.min_players, plan.max_players), (2, 6))
+
+    def test_ship_count_max_does_not_scale_min_players(self):
+        plan = compile_rules(json.dumps({"shipCountMax": 2}))
+        self.assertEqual((plan.min_players, plan.max_players), (2, 4))
+
+    def test_min_players_above_max_players(self):
+        self.assert_invalid({"shipCountMin": 2})
+        self.assert_invalid({"alliance": alliance(player_min_number=4, player_max_number=4), "shipCountMin": 3, "shipCountMax": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
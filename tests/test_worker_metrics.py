@@ -0,0 +1,70 @@
+# Copyright (c) 2025 AccelByte Inc. All Rights Reserved.
+# This is licensed software from AccelByte Inc, for limitations
+# and restrictions contact your company contract manager.
+
+import logging
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from environs import Env
+from opentelemetry.sdk.metrics import MeterProvider
+from prometheus_client import CollectorRegistry, generate_latest
+
+from accelbyte_grpc_plugin.app import App
+from accelbyte_grpc_plugin.options.prometheus import AppOptionPrometheus
+from accelbyte_grpc_plugin.workers import (
+    PROMETHEUS_MULTIPROC_DIR_ENV,
+    WORKER_ID_ENV,
+    WorkerMetricsCollector,
+    register_worker_metrics_port,
+)
+
+
+class WorkerMetricsTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = tmp_dir.name
+        environ = mock.patch.dict(os.environ, {PROMETHEUS_MULTIPROC_DIR_ENV: self.path})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+        self.registry = CollectorRegistry()
+        self.registry.register(WorkerMetricsCollector(path=self.path, endpoint="/metrics", timeout=0.5))
+
+    def start_worker(self, worker_id: int) -> MeterProvider:
+        with mock.patch.dict(os.environ, {WORKER_ID_ENV: str(worker_id)}):
+            app = App(env=Env(), logger=logging.getLogger("test.worker_metrics"))
+        option = AppOptionPrometheus()
+        option.apply(app)
+        self.addCleanup(option.server.server_close)
+        self.addCleanup(option.server.shutdown)
+        provider = MeterProvider(metric_readers=app.otel_metric_readers)
+        self.addCleanup(provider.shutdown)
+        return provider
+
+    def test_scrapes_worker_opentelemetry_metrics(self):
+        for worker_id, calls in ((0, 3), (1, 5)):
+            provider = self.start_worker(worker_id)
+            provider.get_meter("test").create_counter("worker_test_calls").add(calls)
+
+        text = generate_latest(self.registry).decode("utf-8")
+
+        self.assertIn('worker_test_calls_total{worker="0"} 3.0', text)
+        self.assertIn('worker_test_calls_total{worker="1"} 5.0', text)
+        self.assertEqual(text.count("# TYPE worker_test_calls_total counter"), 1)
+
+    def test_skips_unreachable_workers(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        register_worker_metrics_port(worker_id=0, port=port)
+
+        self.assertEqual(generate_latest(self.registry), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()